@@ -13,16 +13,11 @@ sys.path.insert(0, str(src_path))
 # Import configuration and utilities
 from src.config.settings import get_app_config
 from src.utils.css_loader import load_main_css
-from src.utils.helpers import initialize_session_state, log_user_action
+from src.utils.helpers import initialize_session_state, log_user_action, set_page
+from src.utils.profiler import finish_rerun, profile_section, profiled, start_rerun
 
-# Import pages
-from src.pages.home import render_home_page
-from src.pages.agent_space import render_agent_space
-from src.pages.use_cases import render_use_cases_page
-from src.pages.governance import render_governance_page
-from src.pages.academy import render_academy_page
-from src.pages.news import render_news_page
-# from src.pages.analytics import render_analytics_page
+# Pages are imported lazily on first navigation
+from src.pages.registry import DEFAULT_PAGE, get_page_renderer, get_page_import_stats
 
 def main():
     """Main application function"""
@@ -30,6 +25,9 @@ def main():
     # Get configuration
     config = get_app_config()
     
+    # Start per-rerun profiling (no-op unless enabled in settings)
+    start_rerun(st.session_state.get('page', DEFAULT_PAGE))
+    
     # Page configuration
     st.set_page_config(
         page_title=config.name,
@@ -39,13 +37,15 @@ def main():
     )
     
     # Load CSS
-    load_main_css()
+    with profile_section("load_main_css"):
+        load_main_css()
     
     # Initialize session state
     initialize_session_state()
     
     # Render sidebar and handle navigation
-    render_sidebar()
+    with profile_section("render_sidebar"):
+        render_sidebar()
     
     # Handle navigation
     handle_navigation()
@@ -74,70 +74,40 @@ def render_sidebar():
         "📊 Analytics Dashboard"
     ]
     
-    # Get current page from session state
+    # Keep the selectbox in sync with navigation done elsewhere (home cards, back buttons)
     current_page = st.session_state.get('page', '🏠 Home')
+    if current_page not in page_options:
+        current_page = '🏠 Home'
+    if st.session_state.get('nav_page') != current_page:
+        st.session_state.nav_page = current_page
     
-    # Find current index for dropdown
-    try:
-        current_index = page_options.index(current_page)
-    except ValueError:
-        current_index = 0
-    
-    # Create selectbox with current page selected
-    selected_page = st.sidebar.selectbox(
+    # The callback switches page before the script runs, so a selection costs a single rerun
+    st.sidebar.selectbox(
         "Choose a section:", 
         page_options,
-        index=current_index
+        key="nav_page",
+        on_change=on_sidebar_navigation
     )
-    
-    # If selection changed, update session state
-    if selected_page != current_page:
-        st.session_state.page = selected_page
-        # Reset agent view when navigating
-        if 'agent_view' in st.session_state:
-            del st.session_state.agent_view
-        st.rerun()
 
+def on_sidebar_navigation():
+    """Callback: navigate to the page picked in the sidebar"""
+    set_page(st.session_state.nav_page)
+
+@profiled()
 def handle_navigation():
     """Handle page navigation and routing"""
     # Get current page
     page = st.session_state.get('page', '🏠 Home')
     
-    # Log page navigation
-    log_user_action("page_navigation", {"page": page})
+    # Log a page view only when the page changes, not on every rerun of the same page
+    if st.session_state.get('last_viewed_page') != page:
+        st.session_state.last_viewed_page = page
+        log_user_action("page_navigation", {"page": page})
     
     # Route to appropriate page
-    if page == "🏠 Home":
-        render_home_page()
-    elif page == "🤖 Agent Studio":
-        render_agent_space()
-    elif page == "💡 Use Case Intake":
-        render_use_cases_page()
-    elif page == "📚 AI Governance":
-        render_governance_page()
-    elif page == "🎓 AI Academy":
-        render_academy_page()
-    elif page == "📰 AI News":
-        render_news_page()
-    elif page == "📊 Analytics Dashboard":
-        render_placeholder_page("Analytics Dashboard", "📊")
-    else:
-        render_home_page()
-
-def render_placeholder_page(page_name: str, icon: str):
-    """Render placeholder page for pages not yet implemented"""
-    # Temporary navigation back to home
-    if st.button("← Back to Home"):
-        st.session_state.page = "🏠 Home"
-        st.rerun()
-
-    st.title(f"{icon} {page_name}")
-    st.info(f"🚧 {page_name} is being migrated to the new modular architecture. Coming soon!")
-    
-    # Show progress
-    st.progress(0.3)
-    st.write("**Migration Progress:** 30% complete")    
-    
+    render_page = get_page_renderer(page) or get_page_renderer(DEFAULT_PAGE)
+    with profile_section(render_page.__name__):
+        render_page()
 
 def render_footer():
     """Render application footer"""
@@ -148,6 +118,37 @@ def render_footer():
     config = get_app_config()
     if config.debug:
         st.markdown(f"*Version: {config.version} | Debug Mode: Enabled*")
+        
+        import_stats = get_page_import_stats()
+        if import_stats:
+            st.caption("Page import cost (this worker): " + " | ".join(
+                f"{page} {stats['seconds'] * 1000:.0f} ms, {stats['modules_loaded']} modules"
+                for page, stats in import_stats.items()
+            ))
+    
+    # Timing breakdown (only when profiling is enabled)
+    profile = finish_rerun()
+    if profile:
+        render_profile_overlay(profile)
+
+def render_profile_overlay(profile):
+    """Render the timing breakdown of the current rerun"""
+    with st.expander(f"⏱️ Rerun profile: {profile.total_seconds * 1000:.1f} ms ({profile.label})"):
+        st.markdown("**Sections**")
+        st.table([
+            {"Section": "\u00a0\u00a0\u00a0\u00a0" * depth + name, "Time (ms)": f"{seconds * 1000:.1f}"}
+            for depth, name, seconds in filter(None, profile.sections)
+        ])
+        
+        if profile.cache:
+            st.markdown("**Caches**")
+            st.table([
+                {"Cache": cache, "Hits": hits, "Misses": misses}
+                for cache, (hits, misses) in profile.cache.items()
+            ])
+        
+        if profile.profile_path:
+            st.caption(f"cProfile stats written to {profile.profile_path}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,390 @@
+"""
+Load test harness for the AI Hub
+Drives N concurrent headless sessions (streamlit.testing AppTest) through a realistic journey
+against local stand-ins for the RSS feeds and the Google Sheets webhook, and reports rerun
+latency percentiles, memory per session and throughput.
+
+Usage:
+    python scripts/load_test.py --sessions 20 --journeys 3
+    python scripts/load_test.py --sessions 50 --rss-latency 200 --json load_report.json
+
+AppTest is single-threaded by design, so every session runs in its own worker process and
+all sessions start their journeys together once every worker has warmed up. Sessions really
+overlap, but they do not share one server's in-process caches (and AppTest gives each run a
+fresh st.cache_data store), so treat the numbers as per-session cost under CPU contention
+rather than the capacity of a single Streamlit server. Use --think-time for realistic pacing.
+
+Submissions, analytics and agent usage are written to a temporary directory that is deleted
+afterwards; the real stores under static/data are never touched.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List
+from urllib.parse import quote, urlparse, parse_qs
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+os.chdir(PROJECT_ROOT)
+
+import feedparser
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = str(PROJECT_ROOT / "app.py")
+
+TITLE_WORDS = [
+    "predictive", "maintenance", "rolling", "mill", "quality", "inspection", "furnace", "energy",
+    "forecasting", "scrap", "yield", "supplier", "invoice", "safety", "vision", "coil", "defect"
+]
+
+# --- Local stand-ins -------------------------------------------------------------------------
+
+class StandInServer:
+    """Serves canned RSS feeds and accepts Sheets webhook calls, with configurable latency"""
+
+    def __init__(self, rss_latency: float, sheets_latency: float):
+        self.rss_latency = rss_latency
+        self.sheets_latency = sheets_latency
+        self.counts = defaultdict(int)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, name="load-test-standins", daemon=True).start()
+
+    def stop(self):
+        self._server.shutdown()
+
+    def count(self, name: str):
+        with self._lock:
+            self.counts[name] += 1
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body: bytes = b"", content_type: str = "application/json"):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                if parsed.path == "/rss":
+                    time.sleep(server.rss_latency)
+                    server.count("rss_fetches")
+                    source = parse_qs(parsed.query).get("source", ["feed"])[0]
+                    self._send(200, build_rss(source).encode(), "application/rss+xml")
+                else:
+                    time.sleep(server.sheets_latency)
+                    server.count("sheets_reads")
+                    self._send(200, b'{"updates": []}')
+
+            def do_HEAD(self):
+                server.count("sheets_probes")
+                self._send(200)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                self.rfile.read(length)
+                time.sleep(server.sheets_latency)
+                server.count("sheets_submissions")
+                self._send(200, b'{"result": "success"}')
+
+        return Handler
+
+def build_rss(source: str, items: int = 5) -> str:
+    """A small RSS 2.0 document with recent, AI-flavoured items"""
+    now = format_datetime(datetime.now(timezone.utc))
+    entries = "".join(
+        f"""
+        <item>
+            <title>AI update {i} from {source}: new model improves industrial forecasting</title>
+            <link>https://example.com/{quote(source)}/{i}</link>
+            <description>Machine learning and generative AI advances for manufacturing and steel production.</description>
+            <pubDate>{now}</pubDate>
+        </item>"""
+        for i in range(items)
+    )
+    return f"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>{source}</title><link>https://example.com</link>
+<description>Stand-in feed</description>{entries}
+</channel></rss>"""
+
+def install_stand_ins(base_url: str):
+    """Route RSS fetches and Sheets calls to the stand-in server"""
+    original_parse = feedparser.parse
+
+    def parse(url, *args, **kwargs):
+        return original_parse(f"{base_url}/rss?source={quote(str(url), safe='')}", *args, **kwargs)
+
+    feedparser.parse = parse
+
+    from src.services.sheets_service import sheets_service
+    sheets_service.webhook_url = f"{base_url}/sheets"
+
+def redirect_stores(data_dir: Path):
+    """Point every persistent store at data_dir; must run before the first session opens them"""
+    from src.services.analytics_service import JsonlSink, analytics_pipeline
+    from src.services.analytics_store import analytics_store
+    from src.services.sheets_service import sheets_service
+    from src.services.submissions_service import submissions_repository
+    from src.services.usage_service import usage_ledger
+
+    submissions_repository.db_path = data_dir / "submissions.db"
+    analytics_store.db_path = data_dir / "analytics" / "rollups.db"
+    usage_ledger.db_path = data_dir / "agents" / "usage.db"
+    sheets_service.data_dir = str(data_dir)
+    # Also leaves out the HTTP sink, so load test events never reach the analytics endpoint
+    analytics_pipeline.set_sinks([JsonlSink(str(data_dir / "analytics")), analytics_store])
+
+# --- Journey ---------------------------------------------------------------------------------
+
+class SessionRunner:
+    """One simulated user session walking Home -> News -> Agent Studio -> Use Case submit"""
+
+    def __init__(self, session_id: int, timeout: float, think_time: float):
+        self.session_id = session_id
+        self.timeout = timeout
+        self.think_time = think_time
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: List[str] = []
+        self.app = None
+
+    def _step(self, name: str, action):
+        """Run one interaction (one rerun) and record its latency"""
+        if self.think_time:
+            time.sleep(random.uniform(0, self.think_time))
+        start = time.perf_counter()
+        try:
+            action()
+            self.latencies[name].append(time.perf_counter() - start)
+            if self.app.exception:
+                self.errors.append(f"{name}: {self.app.exception[0].value}")
+        except Exception as e:
+            self.errors.append(f"{name}: {type(e).__name__}: {e}")
+
+    def _navigate(self, page: str):
+        self.app.sidebar.selectbox(key="nav_page").set_value(page).run(timeout=self.timeout)
+
+    def _submit_use_case(self, journey: int):
+        app = self.app
+        title = " ".join(random.sample(TITLE_WORDS, 4)).capitalize()
+        text_inputs = {widget.label: widget for widget in app.text_input}
+        text_areas = {widget.label: widget for widget in app.text_area}
+        selects = {widget.label: widget for widget in app.selectbox}
+
+        text_inputs["Your Name *"].set_value(f"Load Test {self.session_id}")
+        text_inputs["Email Address *"].set_value(f"loadtest+{self.session_id}@aperam.com")
+        selects["Department *"].set_value("Production")
+        selects["Business Unit *"].set_value("Stainless Steel")
+        text_inputs["Use Case Title *"].set_value(f"{title} ({self.session_id}-{journey})")
+        text_areas["Problem Description *"].set_value(f"Manual {title.lower()} work causes delays and rework.")
+        text_areas["Proposed AI Solution *"].set_value("Train a model on historical plant data and surface recommendations.")
+        next(box for box in app.checkbox if box.label.startswith("Submit even if")).check()
+
+        submit = next(button for button in app.button if "Submit Use Case" in button.label)
+        submit.click().run(timeout=self.timeout)
+
+        if not any("submitted successfully" in message.value for message in app.success):
+            feedback = [message.value for message in (*app.error, *app.warning)][:2]
+            raise RuntimeError(f"submission not accepted: {feedback}")
+
+    def run(self, journeys: int):
+        self.app = AppTest.from_file(APP_PATH, default_timeout=self.timeout)
+        self._step("open_home", lambda: self.app.run(timeout=self.timeout))
+
+        for journey in range(journeys):
+            self._step("news", lambda: self._navigate("📰 AI News"))
+            self._step("agent_studio", lambda: self._navigate("🤖 Agent Studio"))
+            self._step("live_agents", lambda: self.app.button(key="access_live").click().run(timeout=self.timeout))
+            self._step("back_to_studio", lambda: self.app.button(key="back_live").click().run(timeout=self.timeout))
+            self._step("use_case_intake", lambda: self._navigate("💡 Use Case Intake"))
+            self._step("submit_use_case", lambda: self._submit_use_case(journey))
+            self._step("home", lambda: self._navigate("🏠 Home"))
+
+        return self
+
+# --- Reporting -------------------------------------------------------------------------------
+
+def get_rss_bytes() -> int:
+    """Current resident set size of this process"""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # Peak RSS where /proc is unavailable (kilobytes on Linux, bytes on macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), round(pct / 100 * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    return {
+        "count": len(values),
+        "mean_ms": statistics.fmean(values) * 1000 if values else 0.0,
+        "p50_ms": percentile(values, 50) * 1000,
+        "p95_ms": percentile(values, 95) * 1000,
+        "p99_ms": percentile(values, 99) * 1000,
+        "max_ms": max(values) * 1000 if values else 0.0
+    }
+
+def session_worker(session_id: int, args: argparse.Namespace, base_url: str, data_dir: str,
+                   barrier, results):
+    """Worker process: warm up, wait for every other session, then walk the journeys"""
+    result = {"session_id": session_id, "latencies": {}, "errors": []}
+    try:
+        redirect_stores(Path(data_dir))
+        install_stand_ins(base_url)
+
+        # Imports and process-wide caches are loaded before the clock starts
+        AppTest.from_file(APP_PATH, default_timeout=args.timeout).run(timeout=args.timeout)
+        result["baseline_rss"] = get_rss_bytes()
+
+        barrier.wait(timeout=args.timeout)
+        result["started"] = time.time()
+        runner = SessionRunner(session_id, args.timeout, args.think_time).run(args.journeys)
+        result["finished"] = time.time()
+        result["peak_rss"] = get_rss_bytes()
+        result["latencies"] = dict(runner.latencies)
+        result["errors"] = runner.errors
+    except Exception as e:
+        result["errors"].append(f"worker: {type(e).__name__}: {e}")
+    results.put(result)
+
+def run_load_test(args) -> Dict:
+    server = StandInServer(args.rss_latency / 1000, args.sheets_latency / 1000)
+    server.start()
+
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(args.sessions)
+    results = context.Queue()
+
+    with tempfile.TemporaryDirectory(prefix="aihub-loadtest-") as data_dir:
+        workers = [
+            context.Process(target=session_worker, args=(i, args, server.base_url, data_dir, barrier, results))
+            for i in range(args.sessions)
+        ]
+        for worker in workers:
+            worker.start()
+
+        outcomes = []
+        # Generous deadline: warm-up plus every step of every journey may each take up to --timeout
+        deadline = time.time() + args.timeout * (2 + 7 * args.journeys)
+        while len(outcomes) < len(workers) and time.time() < deadline:
+            try:
+                outcomes.append(results.get(timeout=1))
+            except queue.Empty:
+                if not any(worker.is_alive() for worker in workers):
+                    break
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+
+    server.stop()
+
+    completed = [outcome for outcome in outcomes if "finished" in outcome]
+    started = min((outcome["started"] for outcome in completed), default=0.0)
+    elapsed = max((outcome["finished"] for outcome in completed), default=0.0) - started
+
+    by_step = defaultdict(list)
+    for outcome in outcomes:
+        for step, values in outcome["latencies"].items():
+            by_step[step].extend(values)
+    all_latencies = [value for values in by_step.values() for value in values]
+    errors = [error for outcome in outcomes for error in outcome["errors"]]
+    errors += [f"session {i}: no result" for i in range(args.sessions) if i not in {o["session_id"] for o in outcomes}]
+    baseline = [outcome["baseline_rss"] for outcome in completed]
+    peak = [outcome["peak_rss"] for outcome in completed]
+
+    return {
+        "sessions": args.sessions,
+        "completed_sessions": len(completed),
+        "journeys_per_session": args.journeys,
+        "elapsed_s": elapsed,
+        "reruns": len(all_latencies),
+        "throughput_reruns_per_s": len(all_latencies) / elapsed if elapsed > 0 else 0.0,
+        "throughput_journeys_per_s": len(completed) * args.journeys / elapsed if elapsed > 0 else 0.0,
+        "latency": summarize(all_latencies),
+        "latency_by_step": {step: summarize(values) for step, values in by_step.items()},
+        "memory": {
+            "worker_baseline_rss_mb": statistics.fmean(baseline) / 2**20 if baseline else 0.0,
+            "worker_peak_rss_mb": statistics.fmean(peak) / 2**20 if peak else 0.0,
+            "rss_per_session_mb": statistics.fmean(p - b for p, b in zip(peak, baseline)) / 2**20 if peak else 0.0
+        },
+        "stand_in_calls": dict(server.counts),
+        "errors": len(errors),
+        "error_samples": errors[:10]
+    }
+
+def print_report(report: Dict):
+    latency = report["latency"]
+    memory = report["memory"]
+    print(f"\nSessions: {report['completed_sessions']}/{report['sessions']} completed "
+          f"{report['journeys_per_session']} journeys each in {report['elapsed_s']:.1f}s")
+    print(f"Throughput: {report['throughput_reruns_per_s']:.1f} reruns/s, "
+          f"{report['throughput_journeys_per_s']:.2f} journeys/s")
+    print(f"Rerun latency: p50 {latency['p50_ms']:.0f} ms | p95 {latency['p95_ms']:.0f} ms | "
+          f"p99 {latency['p99_ms']:.0f} ms | max {latency['max_ms']:.0f} ms")
+    print(f"Memory: {memory['rss_per_session_mb']:.2f} MB RSS growth per session "
+          f"(worker baseline {memory['worker_baseline_rss_mb']:.0f} MB, peak {memory['worker_peak_rss_mb']:.0f} MB)")
+
+    print(f"\n{'Step':<18}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for step, stats in report["latency_by_step"].items():
+        print(f"{step:<18}{stats['count']:>7}{stats['p50_ms']:>10.0f}{stats['p95_ms']:>10.0f}{stats['p99_ms']:>10.0f}")
+
+    print(f"\nStand-in calls: {report['stand_in_calls']}")
+    print(f"Errors: {report['errors']}")
+    for error in report["error_samples"]:
+        print(f"  - {error}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent session load test for the AI Hub")
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent simulated sessions")
+    parser.add_argument("--journeys", type=int, default=2, help="Journeys per session")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Max random pause before each step (s)")
+    parser.add_argument("--rss-latency", type=float, default=100.0, help="Stand-in RSS response time (ms)")
+    parser.add_argument("--sheets-latency", type=float, default=150.0, help="Stand-in Sheets response time (ms)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-rerun timeout (s)")
+    parser.add_argument("--json", help="Also write the report to this JSON file")
+    args = parser.parse_args()
+
+    report = run_load_test(args)
+    print_report(report)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"\nReport written to {args.json}")
+
+if __name__ == "__main__":
+    main()
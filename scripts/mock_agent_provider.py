@@ -0,0 +1,148 @@
+"""
+Mock agent provider
+Local HTTP server that answers in the OpenAI, Anthropic and Vertex AI wire formats, with
+streaming, latency and failure injection, for exercising the agent gateway offline.
+
+Usage:
+    python scripts/mock_agent_provider.py --port 8765 --latency 300 --fail-rate 0.2
+
+Point an agent at it by setting its url in src/config/agents.yaml (or VERTEX_AI_RD_AGENT_URL)
+to http://127.0.0.1:8765/<provider>, where <provider> is openai, anthropic, vertex or generic.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+def build_reply(query: str) -> str:
+    """Canned answer that echoes the question"""
+    return f"Mock answer to: {query.strip() or '(empty query)'}. Steel grade 1.4301 meets the requirement."
+
+def extract_query(body: dict) -> str:
+    """Pull the user text out of any of the supported request formats"""
+    if "messages" in body:
+        return body["messages"][-1].get("content", "")
+    if "contents" in body:
+        return "".join(part.get("text", "") for part in body["contents"][-1].get("parts", []))
+    return body.get("query", "")
+
+def full_response(provider: str, text: str) -> dict:
+    if provider == "openai":
+        return {"choices": [{"message": {"role": "assistant", "content": text}}]}
+    if provider == "anthropic":
+        return {"content": [{"type": "text", "text": text}]}
+    if provider == "vertex":
+        return {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+    return {"response": text}
+
+def stream_events(provider: str, text: str):
+    """Server-sent event payloads for a reply, one word per chunk"""
+    for word in text.split(" "):
+        chunk = word + " "
+        if provider == "openai":
+            yield {"choices": [{"delta": {"content": chunk}}]}
+        elif provider == "anthropic":
+            yield {"type": "content_block_delta", "delta": {"type": "text_delta", "text": chunk}}
+        elif provider == "vertex":
+            yield {"candidates": [{"content": {"parts": [{"text": chunk}]}}]}
+        else:
+            yield {"delta": chunk}
+    if provider == "anthropic":
+        yield {"type": "message_stop"}
+
+class MockAgentProvider:
+    """Threaded HTTP server speaking the provider formats"""
+
+    def __init__(self, port: int = 0, latency: float = 0.0, fail_rate: float = 0.0, chunk_delay: float = 0.02):
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.chunk_delay = chunk_delay
+        self.requests = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._make_handler())
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, name="mock-agent-provider", daemon=True).start()
+
+    def stop(self):
+        self._server.shutdown()
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            failed = random.random() < self.fail_rate
+            self.failures += failed
+            return failed
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, status: int, payload: dict):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            def do_HEAD(self):
+                self._send_json(200, {})
+
+            def do_POST(self):
+                provider = urlparse(self.path).path.strip("/") or "generic"
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                time.sleep(server.latency)
+
+                if server._should_fail():
+                    self._send_json(503, {"error": "injected failure"})
+                    return
+
+                text = build_reply(extract_query(body))
+                streaming = body.get("stream") or "alt=sse" in self.path
+                if not streaming:
+                    self._send_json(200, full_response(provider, text))
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                for event in stream_events(provider, text):
+                    self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+                    self.wfile.flush()
+                    time.sleep(server.chunk_delay)
+                if provider == "openai":
+                    self.wfile.write(b"data: [DONE]\n\n")
+                self.close_connection = True
+
+        return Handler
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0, help="Milliseconds before each response")
+    parser.add_argument("--fail-rate", type=float, default=0, help="Fraction of requests answered with 503")
+    args = parser.parse_args()
+
+    provider = MockAgentProvider(args.port, args.latency / 1000, args.fail_rate)
+    print(f"Mock agent provider on {provider.base_url}/{{openai,anthropic,vertex,generic}}")
+    try:
+        provider._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
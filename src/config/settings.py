@@ -2,13 +2,17 @@
 Configuration management for Aperam AI Hub
 """
 import os
+from pathlib import Path
 from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
+# One .env for every settings class, wherever the app is launched from
+ENV_FILE = Path(__file__).parent.parent.parent / ".env"
+
 # Load environment variables
-load_dotenv()
+load_dotenv(ENV_FILE)
 
 class AppSettings(BaseSettings):
     """Main application settings"""
@@ -19,6 +23,10 @@ class AppSettings(BaseSettings):
     debug: bool = Field(default=True, env="DEBUG")
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
     
+    # Profiling (per-rerun timing overlay; cProfile dumps when profile_dir is set)
+    enable_profiling: bool = Field(default=False, env="ENABLE_PROFILING")
+    profile_dir: Optional[str] = Field(default=None, env="PROFILE_DIR")
+    
     # Streamlit Configuration
     port: int = Field(default=8501, env="STREAMLIT_SERVER_PORT")
     headless: bool = Field(default=True, env="STREAMLIT_SERVER_HEADLESS")
@@ -34,7 +42,7 @@ class AppSettings(BaseSettings):
     encryption_key: Optional[str] = Field(default=None, env="ENCRYPTION_KEY")
     
     class Config:
-        env_file = ".env"
+        env_file = ENV_FILE
         case_sensitive = False
 
 class AgentSettings(BaseSettings):
@@ -43,6 +51,21 @@ class AgentSettings(BaseSettings):
     # Current Agent URLs
     vertex_ai_rd_agent_url: str = Field(default="https://vertex-ai-agent.com/rd", env="VERTEX_AI_RD_AGENT_URL")
     agent_timeout: int = Field(default=30, env="AGENT_TIMEOUT")
+    agent_health_interval: int = Field(default=60, env="AGENT_HEALTH_INTERVAL")  # Seconds between health probes
+    
+    # Response cache in front of agent queries
+    response_cache_ttl: int = Field(default=3600, env="RESPONSE_CACHE_TTL")  # Seconds; agents can override with cache_ttl
+    response_cache_max_entries: int = Field(default=1000, env="RESPONSE_CACHE_MAX_ENTRIES")
+    response_cache_similarity: float = Field(default=0.9, env="RESPONSE_CACHE_SIMILARITY")  # Cosine threshold for near-duplicates
+    
+    # Document Intelligence demo
+    document_workers: int = Field(default=2, env="DOCUMENT_WORKERS")  # Extraction threads shared by all sessions
+    document_cache_dir: str = Field(default=".cache/documents", env="DOCUMENT_CACHE_DIR")
+    document_cache_max_mb: int = Field(default=200, env="DOCUMENT_CACHE_MAX_MB")  # 0 disables the cache
+    
+    # Multi-agent workflow demo
+    workflow_step_timeout: float = Field(default=5.0, env="WORKFLOW_STEP_TIMEOUT")  # Seconds per step
+    workflow_cache_max_entries: int = Field(default=256, env="WORKFLOW_CACHE_MAX_ENTRIES")  # Step results kept for reuse
     
     # Future AI Provider Keys
     openai_api_key: Optional[str] = Field(default=None, env="OPENAI_API_KEY")
@@ -50,7 +73,7 @@ class AgentSettings(BaseSettings):
     google_api_key: Optional[str] = Field(default=None, env="GOOGLE_API_KEY")
     
     class Config:
-        env_file = ".env"
+        env_file = ENV_FILE
         case_sensitive = False
 
 class NewsSettings(BaseSettings):
@@ -61,7 +84,7 @@ class NewsSettings(BaseSettings):
     max_news_articles: int = Field(default=50, env="MAX_NEWS_ARTICLES")
     
     class Config:
-        env_file = ".env"
+        env_file = ENV_FILE
         case_sensitive = False
 
 class DatabaseSettings(BaseSettings):
@@ -71,7 +94,7 @@ class DatabaseSettings(BaseSettings):
     redis_url: Optional[str] = Field(default=None, env="REDIS_URL")
     
     class Config:
-        env_file = ".env"
+        env_file = ENV_FILE
         case_sensitive = False
 
 class AzureSettings(BaseSettings):
@@ -82,7 +105,7 @@ class AzureSettings(BaseSettings):
     tenant_id: Optional[str] = Field(default=None, env="AZURE_TENANT_ID")
     
     class Config:
-        env_file = ".env"
+        env_file = ENV_FILE
         case_sensitive = False
 
 class AnalyticsSettings(BaseSettings):
@@ -92,34 +115,67 @@ class AnalyticsSettings(BaseSettings):
     analytics_endpoint: Optional[str] = Field(default=None, env="ANALYTICS_ENDPOINT")
     
     class Config:
-        env_file = ".env"
+        env_file = ENV_FILE
         case_sensitive = False
 
-# Global settings instances
-app_settings = AppSettings()
-agent_settings = AgentSettings()
-news_settings = NewsSettings()
-database_settings = DatabaseSettings()
-azure_settings = AzureSettings()
-analytics_settings = AnalyticsSettings()
+# Credentials: never written to the config snapshot, always read from the environment
+SECRET_FIELDS = {
+    "AppSettings": ("secret_key", "encryption_key"),
+    "AgentSettings": ("openai_api_key", "anthropic_api_key", "google_api_key"),
+    "NewsSettings": ("news_api_key",),
+    "DatabaseSettings": ("database_url", "redis_url"),
+    "AzureSettings": ("client_secret",)
+}
+
+SETTINGS_CLASSES = (
+    AppSettings,
+    AgentSettings,
+    NewsSettings,
+    DatabaseSettings,
+    AzureSettings,
+    AnalyticsSettings
+)
+
+# Settings instances, created lazily from the precompiled config snapshot
+_settings_instances = {}
+
+def _get_settings(settings_class):
+    """Get the shared instance of a settings class"""
+    settings = _settings_instances.get(settings_class)
+    if settings is None:
+        from src.utils.config_snapshot import get_snapshot_settings
+        settings = _settings_instances[settings_class] = get_snapshot_settings(settings_class)
+    return settings
 
 # Helper functions
 def get_app_config():
     """Get application configuration"""
-    return app_settings
+    return _get_settings(AppSettings)
 
 def get_agent_config():
     """Get agent configuration"""
-    return agent_settings
+    return _get_settings(AgentSettings)
 
 def get_news_config():
     """Get news configuration"""
-    return news_settings
+    return _get_settings(NewsSettings)
+
+def get_database_config():
+    """Get database configuration"""
+    return _get_settings(DatabaseSettings)
+
+def get_azure_config():
+    """Get Azure configuration"""
+    return _get_settings(AzureSettings)
+
+def get_analytics_config():
+    """Get analytics configuration"""
+    return _get_settings(AnalyticsSettings)
 
 def is_development():
     """Check if running in development mode"""
-    return app_settings.debug
+    return get_app_config().debug
 
 def is_production():
     """Check if running in production mode"""
-    return not app_settings.debug
\ No newline at end of file
+    return not get_app_config().debug
@@ -0,0 +1,131 @@
+"""
+Use case submission schema
+Typed validation and the fixed Google Sheets column mapping for submissions
+"""
+import uuid
+from datetime import datetime
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, field_validator
+
+# Sheet column -> model field, in the column order of the Sheet
+SHEET_COLUMN_MAPPING: Tuple[Tuple[str, str], ...] = (
+    ("timestamp", "submission_date"),
+    ("submitter_name", "submitter_name"),
+    ("submitter_email", "submitter_email"),
+    ("department", "department"),
+    ("business_unit", "business_unit"),
+    ("use_case_title", "use_case_title"),
+    ("problem_description", "problem_description"),
+    ("proposed_solution", "proposed_solution"),
+    ("expected_benefits", "expected_benefits"),
+    ("priority", "priority"),
+    ("timeline", "timeline"),
+    ("data_availability", "data_availability"),
+    ("technical_complexity", "technical_complexity"),
+    ("integration_needs", "integration_needs"),
+    ("budget_range", "budget_range"),
+    ("stakeholders", "stakeholders"),
+    ("additional_notes", "additional_notes"),
+    ("submission_id", "submission_id"),
+    ("status", "status"),
+)
+
+SHEET_COLUMNS: Tuple[str, ...] = tuple(column for column, _ in SHEET_COLUMN_MAPPING)
+
+OPTIONAL_FIELDS = (
+    "expected_benefits", "priority", "timeline", "data_availability", "technical_complexity",
+    "integration_needs", "budget_range", "stakeholders", "additional_notes"
+)
+
+class UseCaseSubmission(BaseModel):
+    """A validated use case submission"""
+
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
+
+    # Required fields
+    submitter_name: str = Field(min_length=1)
+    submitter_email: str = Field(min_length=1)
+    department: str = Field(min_length=1)
+    business_unit: str = Field(min_length=1)
+    use_case_title: str = Field(min_length=1)
+    problem_description: str = Field(min_length=1)
+    proposed_solution: str = Field(min_length=1)
+
+    # Optional details
+    expected_benefits: str = ""
+    priority: str = ""
+    timeline: str = ""
+    data_availability: str = ""
+    technical_complexity: str = ""
+    integration_needs: str = ""
+    budget_range: str = ""
+    stakeholders: str = ""
+    additional_notes: str = ""
+
+    # Tracking
+    submission_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    submission_date: str = Field(default_factory=lambda: datetime.now().isoformat())
+    status: str = "Under Review"
+
+    @field_validator(*OPTIONAL_FIELDS, mode="before")
+    @classmethod
+    def _none_as_empty(cls, value):
+        # Optional details left blank arrive as null from JSON backlogs and webhooks
+        return "" if value is None else value
+
+    @field_validator("department", "business_unit")
+    @classmethod
+    def _not_placeholder(cls, value: str) -> str:
+        if value.startswith("Select "):
+            raise ValueError("a value must be selected")
+        return value
+
+    @field_validator("submitter_email")
+    @classmethod
+    def _valid_email(cls, value: str) -> str:
+        if '@' not in value or '.' not in value:
+            raise ValueError("not a valid email address")
+        return value
+
+# Compiled once at import; reused for every bulk validation and serialization
+_SUBMISSION_LIST = TypeAdapter(List[UseCaseSubmission])
+_sheet_row_getter = itemgetter(*(field for _, field in SHEET_COLUMN_MAPPING))
+
+def validate_submissions(records: List[Dict]) -> Tuple[List[UseCaseSubmission], Dict[int, List[str]]]:
+    """
+    Validate many raw submissions at once
+    Returns the valid submissions and error messages keyed by the index of each invalid record.
+    """
+    try:
+        return _SUBMISSION_LIST.validate_python(records), {}
+    except ValidationError as e:
+        errors: Dict[int, List[str]] = {}
+        for error in e.errors():
+            index, *field = error["loc"]
+            errors.setdefault(index, []).append(_format_error(field, error))
+
+    # Validate the remaining records in one more pass
+    valid_records = [record for i, record in enumerate(records) if i not in errors]
+    return _SUBMISSION_LIST.validate_python(valid_records), errors
+
+def validate_submission(record: Dict) -> Tuple[Optional[UseCaseSubmission], List[str]]:
+    """Validate a single submission; returns (submission or None, error messages)"""
+    valid, errors = validate_submissions([record])
+    return (valid[0] if valid else None), errors.get(0, [])
+
+def to_sheet_rows(submissions: List[UseCaseSubmission]) -> List[List[str]]:
+    """Serialize submissions to Sheet rows in SHEET_COLUMNS order"""
+    return [list(_sheet_row_getter(data)) for data in _SUBMISSION_LIST.dump_python(submissions)]
+
+def _format_error(field: List, error: Dict) -> str:
+    """Turn a pydantic error into a user-facing message"""
+    name = str(field[0]) if field else "submission"
+    label = name.replace('_', ' ').title()
+    if name == "submitter_email" and error["type"] == "value_error":
+        return "Please enter a valid email address"
+    blank = error["type"] in ("missing", "string_too_short") or error.get("input", "") is None
+    if blank or (error["type"] == "value_error" and name in ("department", "business_unit")):
+        return f"Please fill in the {label} field"
+    return f"Invalid {label} field: {error['msg']}"
@@ -7,14 +7,12 @@ import streamlit as st
 from typing import Dict, List, Optional
 from datetime import datetime
 from src.config.settings import get_app_config
-from src.utils.helpers import log_user_action
+from src.utils.helpers import log_user_action, render_back_button
 
 def render_academy_page():
     """Render the AI Academy page"""
     # Back to home button
-    if st.button("← Back to Home", key="back_to_home_academy"):
-        st.session_state.page = "🏠 Home"
-        st.rerun()
+    render_back_button("back_to_home_academy")
     
     st.title("🎓 AI Academy")
     
@@ -46,6 +44,7 @@ def render_academy_page():
     with tab4:
         render_interactive_labs()
 
+@st.fragment
 def render_learning_paths():
     """Render learning paths section"""
     st.markdown("### 🎯 Personalized Learning Paths")
@@ -145,6 +144,7 @@ def render_learning_paths():
             
             st.markdown("---")
 
+@st.fragment
 def render_course_catalog():
     """Render course catalog section"""
     st.markdown("### 📚 Course Catalog")
@@ -200,6 +200,7 @@ def render_course_catalog():
             
             st.markdown("---")
 
+@st.fragment
 def render_progress_tracking():
     """Render progress tracking section"""
     st.markdown("### 🏆 My Learning Progress")
@@ -302,6 +303,7 @@ def render_progress_tracking():
             else:
                 st.info(f"📊 {achievement['progress']}%")
 
+@st.fragment
 def render_interactive_labs():
     """Render interactive labs section"""
     st.markdown("### 💡 Interactive AI Labs")
@@ -2,18 +2,33 @@
 Agent Studio Page - Aperam AI Hub
 AI agents and interactive demonstrations
 """
+import time
+import numpy as np
+import pandas as pd
 import streamlit as st
 from typing import Dict, Any
-from ..utils.helpers import show_breadcrumb, log_user_action, display_agent_tile
-from ..utils.config_loader import get_live_agents, get_demo_agents, get_agent_by_id
-from ..utils.css_loader import get_agent_card_css
+from ..utils.helpers import show_breadcrumb, log_user_action, display_agent_tile, render_back_button
+from ..utils.config_loader import get_agent_by_id
+from ..services.agent_health_service import (
+    get_agent_health, get_agent_health_history, format_uptime, format_response_time
+)
+from ..services.agent_gateway import AgentGatewayError, stream_agent_query
+from ..services.response_cache import response_cache, get_response_cache_stats
+from ..services.document_service import document_processor, submit_document, get_document_job
+from ..services.steel_specs_index import search_steel_grades
+from ..services.maintenance_service import (
+    EQUIPMENT_TYPES, FEATURES, HIGH_RISK, MEDIUM_RISK, RISK_MODELS,
+    generate_sample_fleet, read_fleet_csv, score_asset, score_fleet, summarize_risk
+)
+from ..services.agent_catalog import get_agent_catalog, get_agent_card_html
+from ..services.usage_service import get_usage_summary, get_usage_breakdown, get_agent_usage_series
+from ..services.workflow_service import WorkflowStep, workflow_engine, start_workflow, get_workflow_run
+from ..config.settings import get_agent_config
 
 def render_agent_space():
     """Render the agent studio page"""
     # Back to home button
-    if st.button("← Back to Home", key="back_to_home"):
-        st.session_state.page = "🏠 Home"
-        st.rerun()
+    render_back_button("back_to_home")
     
     st.title("🤖 Agent Studio")
     st.write("Your AI-powered workspace for intelligent automation and insights")
@@ -33,6 +48,19 @@ def render_agent_space():
     elif st.session_state.agent_view == 'demo':
         render_demo_agents_page()
 
+def set_agent_view(view: str):
+    """Callback: switch the Agent Studio view before the next run"""
+    st.session_state.agent_view = view
+
+def select_demo(demo_type: str):
+    """Callback: open a demo below the demo cards"""
+    st.session_state.selected_demo = demo_type
+
+def open_agent_console(agent_id: str):
+    """Callback: open an agent's query console on the live agents view"""
+    st.session_state.agent_view = 'live'
+    st.session_state.active_agent = agent_id
+
 def render_main_agent_view():
     """Render main agent studio view with native Streamlit components only"""
     
@@ -40,19 +68,29 @@ def render_main_agent_view():
     col1, col2, col3, col4 = st.columns(4)
     
     try:
-        live_agents = get_live_agents()
-        demo_agents = get_demo_agents()
-        live_count = len([agent for agent in live_agents if agent.get('status') == 'Active'])
-        demo_count = len(demo_agents)
+        catalog = get_agent_catalog()
+        live_count = len(catalog.active)
+        demo_count = len(catalog.demo)
     except Exception as e:
         st.error(f"Error loading agent configuration: {str(e)}")
         st.write("Please check that the configuration files exist and are properly formatted.")
         return
     
+    # Served from the usage ledger's daily rollups
+    usage = get_usage_summary()
+    usage_today = get_usage_summary(days=0)
+    
     col1.metric("🔴 Live Agents", live_count, "Production Ready")
     col2.metric("🧪 Demo Agents", demo_count, "Try Now")
-    col3.metric("📊 Total Queries", "2,847", "+245 today")
-    col4.metric("⚡ Avg Response", "1.2s", "Fast")
+    col3.metric("📊 Total Queries", f"{usage['calls']:,}", f"+{usage_today['calls']:,} today")
+    col4.metric(
+        "⚡ Avg Response",
+        f"{usage['avg_latency']:.1f}s" if usage['avg_latency'] is not None else "—",
+        f"{usage['cached'] / usage['calls']:.0%} cached" if usage['calls'] else None,
+        delta_color="off"
+    )
+    
+    render_agent_usage_chart(catalog.active + catalog.development + catalog.demo)
     
     st.divider()
     
@@ -73,9 +111,8 @@ def render_main_agent_view():
             st.write("• Enterprise Security")
         
         st.write("")  # Add some spacing
-        if st.button("🚀 Access Live Agents", key="access_live", use_container_width=True, type="primary"):
-            st.session_state.agent_view = 'live'
-            st.rerun()
+        st.button("🚀 Access Live Agents", key="access_live", use_container_width=True, type="primary",
+                  on_click=set_agent_view, args=('live',))
     
     # Container 2: Demo Agents
     with container_col2:
@@ -91,9 +128,8 @@ def render_main_agent_view():
             st.write("• Interactive Prototypes")
         
         st.write("")  # Add some spacing
-        if st.button("🎮 Try Interactive Demos", key="try_demos", use_container_width=True, type="secondary"):
-            st.session_state.agent_view = 'demo'
-            st.rerun()
+        st.button("🎮 Try Interactive Demos", key="try_demos", use_container_width=True, type="secondary",
+                  on_click=set_agent_view, args=('demo',))
     
     st.divider()
     
@@ -158,8 +194,8 @@ def render_agent_card(agent, is_live=False):
         button_col1, button_col2 = st.columns(2)
         with button_col1:
             if agent.get('status') == 'Active':
-                if st.button("🚀 Launch", key=f"launch_{agent.get('id', 'unknown')}", use_container_width=True):
-                    launch_agent(agent)
+                st.button("🚀 Launch", key=f"launch_{agent.get('id', 'unknown')}", use_container_width=True,
+                          on_click=open_agent_console, args=(agent['id'],))
             else:
                 if st.button("👁️ Preview", key=f"preview_{agent.get('id', 'unknown')}", use_container_width=True):
                     show_agent_details(agent)
@@ -186,23 +222,34 @@ def render_demo_card(title, description, features, demo_type):
             st.write(f"• {feature}")
         
         # Try button
-        if st.button(f"▶️ Try {title}", key=f"try_{demo_type}", use_container_width=True):
-            st.session_state.selected_demo = demo_type
-            st.rerun()
+        st.button(f"▶️ Try {title}", key=f"try_{demo_type}", use_container_width=True,
+                  on_click=select_demo, args=(demo_type,))
+
+def render_agent_usage_chart(agents):
+    """Queries per agent over the last 7 days, from the usage rollups"""
+    breakdown = get_usage_breakdown(days=7)
+    if not breakdown:
+        return
+    
+    names = {agent['id']: agent.get('name', agent['id']) for agent in agents}
+    usage = pd.DataFrame(breakdown, columns=["agent_id", "Queries", "Tokens", "Cost"])
+    usage.index = [names.get(agent_id, agent_id) for agent_id in usage["agent_id"]]
+    
+    with st.expander("📈 Agent Usage (last 7 days)"):
+        st.bar_chart(usage[["Queries"]])
+        st.caption(f"{int(usage['Tokens'].sum()):,} tokens · ${usage['Cost'].sum():,.2f} spent")
 
 def render_live_agents_page():
     """Render dedicated live agents page"""
-    if st.button("← Back to Agent Studio", key="back_live"):
-        st.session_state.agent_view = 'main'
-        st.rerun()
+    st.button("← Back to Agent Studio", key="back_live", on_click=set_agent_view, args=('main',))
     
     st.title("🔴 Live Production Agents")
     st.write("Enterprise-ready AI agents deployed for business operations")
     
     try:
-        live_agents = get_live_agents()
-        active_agents = [agent for agent in live_agents if agent.get('status') == 'Active']
-        dev_agents = [agent for agent in live_agents if agent.get('status') in ['Coming Soon', 'In Development']]
+        catalog = get_agent_catalog()
+        active_agents = catalog.active
+        dev_agents = catalog.development
     except Exception as e:
         st.error(f"Error loading live agents: {str(e)}")
         return
@@ -211,8 +258,10 @@ def render_live_agents_page():
     col1, col2, col3, col4 = st.columns(4)
     col1.metric("Active Agents", len(active_agents))
     col2.metric("Development Agents", len(dev_agents))
-    col3.metric("Total Queries Today", "1,247")
-    col4.metric("Average Uptime", "99.7%")
+    col3.metric("Total Queries Today", f"{get_usage_summary(days=0)['calls']:,}")
+    uptimes = [get_agent_health(agent['id'])['uptime'] for agent in active_agents]
+    uptimes = [uptime for uptime in uptimes if uptime is not None]
+    col4.metric("Average Uptime", f"{sum(uptimes) / len(uptimes):.1f}%" if uptimes else "Pending")
     
     st.markdown("---")
     
@@ -235,9 +284,31 @@ def render_live_agents_page():
         for agent in dev_agents:
             render_live_agent_card(agent)
 
+def render_agent_usage(agent: Dict[str, Any]):
+    """Ledger totals and hourly query volume for one agent"""
+    usage = get_usage_summary(days=7, agent_id=agent['id'])
+    if not usage['calls']:
+        st.caption("No queries recorded for this agent in the last 7 days")
+        return
+    
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Queries (7 days)", f"{usage['calls']:,}", f"{usage['errors']:,} failed", delta_color="off")
+    col2.metric("Tokens (7 days)", f"{usage['tokens']:,}")
+    col3.metric("Spend (7 days)", f"${usage['cost']:,.2f}")
+    
+    series = get_agent_usage_series(agent['id'], hours=24)
+    if series:
+        st.write("**Queries per Hour (last 24h):**")
+        hourly = pd.DataFrame(series, columns=["hour", "calls", "Errors"]).set_index("hour")
+        # Stacked, so the bar height is the total number of queries
+        hourly["Answered"] = hourly["calls"] - hourly["Errors"]
+        st.bar_chart(hourly[["Answered", "Errors"]])
+
+@st.fragment
 def render_live_agent_card(agent: Dict[str, Any]):
     """Render a live agent card"""
-    st.markdown(get_agent_card_css(agent), unsafe_allow_html=True)
+    health = get_agent_health(agent['id'])
+    st.markdown(get_agent_card_html(agent, format_uptime(health)), unsafe_allow_html=True)
     
     # Agent actions
     col1, col2, col3 = st.columns(3)
@@ -249,7 +320,8 @@ def render_live_agent_card(agent: Dict[str, Any]):
                 "agent_name": agent['name'],
                 "provider": agent.get('provider', 'Unknown')
             })
-            launch_agent(agent)
+            st.balloons()
+            st.session_state.active_agent = agent['id']
     
     with col2:
         if st.button(f"View Details", key=f"details_{agent['id']}"):
@@ -259,11 +331,13 @@ def render_live_agent_card(agent: Dict[str, Any]):
         if st.button(f"Performance", key=f"perf_{agent['id']}"):
             show_agent_performance(agent)
 
+    # Keep the console open across the fragment reruns triggered by its own widgets
+    if st.session_state.get('active_agent') == agent['id']:
+        launch_agent(agent)
+
 def render_demo_agents_page():
     """Render dedicated demo agents page"""
-    if st.button("← Back to Agent Studio", key="back_demo"):
-        st.session_state.agent_view = 'main'
-        st.rerun()
+    st.button("← Back to Agent Studio", key="back_demo", on_click=set_agent_view, args=('main',))
     
     st.title("🧪 Interactive AI Demos")
     st.write("Try these interactive demonstrations to experience our AI capabilities")
@@ -325,61 +399,123 @@ def render_demo_agents_page():
     else:
         st.info("👆 Click on any demo card above to get started!")
 
+@st.fragment
 def render_document_intelligence_demo():
     """Render document intelligence demo"""
     st.subheader("📄 Document Intelligence Demo")
     st.write("Upload documents for AI-powered analysis and insights extraction")
     
+    supported_formats = list((get_agent_by_id("document_intelligence") or {}).get('supported_formats', ['pdf', 'txt', 'docx', 'xlsx']))
     uploaded_file = st.file_uploader(
         "Upload a document to analyze", 
-        type=['pdf', 'txt', 'docx', 'xlsx'],
-        help="Supported formats: PDF, TXT, DOCX, XLSX"
+        type=supported_formats,
+        help=f"Supported formats: {', '.join(fmt.upper() for fmt in supported_formats)}"
     )
     
-    if uploaded_file:
+    job_id = st.session_state.get('document_job_id')
+    
+    if not uploaded_file:
+        # Upload removed: stop any extraction still running for it
+        if job_id:
+            document_processor.cancel(job_id)
+            del st.session_state['document_job_id']
+        return
+    
+    job = get_document_job(job_id) if job_id else None
+    if job is None or st.session_state.get('document_upload_id') != uploaded_file.file_id:
+        if job is not None:
+            document_processor.cancel(job.job_id)
         log_user_action("demo_interaction", {
             "demo": "document_intelligence",
             "file_type": uploaded_file.type,
             "file_size": uploaded_file.size
         })
+        job = submit_document(uploaded_file, uploaded_file.name)
+        st.session_state.document_job_id = job.job_id
+        st.session_state.document_upload_id = uploaded_file.file_id
+    
+    # Small documents finish within the wait and render without polling
+    document_processor.wait(job.job_id, timeout=0.5)
+    if job.finished:
+        render_document_results(job)
+    else:
+        render_document_progress(job.job_id)
+
+@st.fragment(run_every=1)
+def render_document_progress(job_id: str):
+    """Poll a running extraction and show the pages extracted so far"""
+    job = get_document_job(job_id)
+    if job is None or job.finished:
+        # One full rerun renders the final results and stops the polling
+        st.rerun()
+    
+    pages = len(job.pages)
+    if job.total_pages:
+        st.progress(pages / job.total_pages, text=f"Extracting {job.file_name}: page {pages} of {job.total_pages}")
+    else:
+        st.progress(0.0 if job.status == "queued" else 0.5, text=f"Extracting {job.file_name}: {pages} pages so far")
+    
+    render_document_results(job)
+
+def render_document_results(job):
+    """Render extracted content and insights for a job, complete or partial"""
+    if job.status == "failed":
+        st.error(f"❌ {job.error}")
+        return
+    if job.status == "cancelled":
+        st.warning("Extraction cancelled")
+        return
+    if job.from_cache:
+        st.success(f"⚡ {job.file_name} was analyzed before — results loaded from cache")
+    elif job.finished:
+        st.success(f"✅ {job.file_name} analyzed in {job.elapsed:.1f}s")
+    
+    analysis = job.analysis
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Pages", analysis.pages)
+    col2.metric("Words", f"{analysis.words:,}")
+    col3.metric("Tables", analysis.tables)
+    col4.metric("Size", f"{job.size / 1024 / 1024:.1f} MB" if job.size >= 1024 * 1024 else f"{job.size / 1024:.0f} KB")
+    
+    st.write("**Key insights:**")
+    insights = {
+        "Standards referenced": analysis.standards,
+        "Steel grades": analysis.grades,
+        "Measurements": analysis.measurements
+    }
+    for label, counts in insights.items():
+        found = ", ".join(f"{value} ({count})" if count > 1 else value for value, count in counts.most_common(8))
+        st.write(f"- {label}: {found or 'none found'}")
+    
+    pages = list(job.pages)
+    if not pages:
+        return
+    
+    # Show detailed extracted content
+    with st.expander("View Extracted Content"):
+        labels = [page.label for page in pages]
+        selected = st.selectbox("Page", labels, index=len(labels) - 1 if not job.finished else 0, key=f"doc_page_{job.job_id}")
+        page = pages[labels.index(selected)]
         
-        # Simulate processing
-        with st.spinner("Analyzing document..."):
-            st.success("✅ Document uploaded! AI analysis complete.")
-        
-        # Mock results
-        st.write("**Key insights:**")
-        st.write("- Document type: Technical specification")
-        st.write("- Key topics: Steel composition, quality requirements") 
-        st.write("- Action items: 3 recommendations identified")
-        st.write("- Confidence score: 94%")
-        
-        # Show expandable detailed analysis
-        with st.expander("View Detailed Analysis"):
-            st.write("**Extracted entities:**")
-            st.write("- Materials: Carbon steel, Stainless steel 316L")
-            st.write("- Specifications: ASTM A36, ISO 9001")
-            st.write("- Measurements: 10mm thickness, 500 MPa strength")
-            
-            st.write("**Recommendations:**")
-            st.write("1. Consider alternative alloy for better corrosion resistance")
-            st.write("2. Update specification to include recent standard revisions")
-            st.write("3. Add quality control checkpoints for critical dimensions")
+        if page.text.strip():
+            preview = page.text if len(page.text) == page.chars else f"{page.text}\n…"
+            st.text(preview)
+        for table in page.tables:
+            st.dataframe(pd.DataFrame(table), use_container_width=True, hide_index=True)
+        if page.chars > len(page.text):
+            st.caption(f"Showing the first {len(page.text):,} of {page.chars:,} characters")
 
+@st.fragment
 def render_steel_specs_demo():
     """Render steel specifications demo"""
     st.subheader("🔧 Steel Specs Assistant")
     st.write("Ask natural language questions about steel specifications and get expert answers")
     
+    agent = get_agent_by_id("steel_specs_assistant") or {}
+    
     # Sample queries
     st.write("**Try these sample queries:**")
-    sample_queries = [
-        "What steel grade is best for marine applications?",
-        "Compare carbon steel vs stainless steel for structural use",
-        "What are the welding requirements for A36 steel?"
-    ]
-    
-    for query in sample_queries:
+    for query in agent.get('sample_queries', []):
         if st.button(f"💬 {query}", key=f"sample_{hash(query)}"):
             st.session_state.sample_query = query
     
@@ -397,25 +533,82 @@ def render_steel_specs_demo():
             "query_length": len(user_query)
         })
         
-        # Mock AI response
+        # Repeated and near-duplicate questions are answered from the response cache
         with st.spinner("Analyzing your query..."):
-            st.write(f"🤖 **AI Response:** For {user_query}, I recommend considering the following:")
-            st.write("- **Primary recommendation:** High-strength low-alloy steel (HSLA)")
-            st.write("- **Alternative options:** Stainless steel 304/316 series")
-            st.write("- **Key considerations:** Temperature resistance, corrosion protection")
-            st.write("- **Standards to reference:** ASTM A572, AISI 4140")
-            
-            st.info("💡 **Pro tip:** Consider consulting with our materials engineers for specific application requirements")
+            start = time.perf_counter()
+            answer = response_cache.get_or_compute("steel_specs_assistant", user_query, answer_steel_query)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        
+        st.markdown(answer.text)
+        if answer.match != "miss":
+            st.caption(f"⚡ Answered from cache ({answer.match} match to \"{answer.query}\")")
+        else:
+            st.caption(f"🔎 Retrieved from the local specification index in {elapsed_ms:.1f} ms")
+        
+        st.info("💡 **Pro tip:** Consider consulting with our materials engineers for specific application requirements")
+        
+        stats = get_response_cache_stats()
+        st.caption(f"Response cache: {stats['hit_rate']:.0%} hit rate over {stats['exact_hits'] + stats['similar_hits'] + stats['misses']} queries")
 
+def answer_steel_query(query: str) -> str:
+    """Answer a steel specification question from the grades retrieved for it"""
+    matches = search_steel_grades(query, k=3)
+    if not matches:
+        return (
+            "🤖 **AI Response:** I could not find a matching grade in the specification library. "
+            "Try naming a grade (e.g. 316L, S355J2), a standard or an application."
+        )
+    
+    # The answer must not echo the query: near-duplicate questions are served this same cached text
+    lines = ["🤖 **AI Response:** The closest matches in the specification library are:"]
+    for rank, match in enumerate(matches, start=1):
+        grade = match['grade']
+        designations = ", ".join(str(value) for value in (grade.get('designations') or {}).values())
+        composition = ", ".join(f"{element} {value}" for element, value in grade.get('composition', {}).items())
+        mechanical = grade.get('mechanical', {})
+        lines += [
+            "",
+            f"**{rank}. {grade['name']}** ({designations}) — {grade['family']}",
+            f"- {grade.get('summary', '')}",
+            f"- **Composition (wt%):** {composition}",
+            f"- **Mechanical:** yield ≥ {mechanical.get('yield_mpa')} MPa, tensile {mechanical.get('tensile_mpa')} MPa, "
+            f"elongation ≥ {mechanical.get('elongation_pct')}%, hardness {mechanical.get('hardness')}",
+            f"- **Standards:** {', '.join(grade.get('standards', []))}",
+            f"- **Corrosion:** {grade.get('corrosion_resistance', 'N/A')}",
+            f"- **Welding:** {grade.get('weldability', 'N/A')}",
+            f"- **Max service temperature:** {grade.get('max_service_temp_c', 'N/A')} °C",
+            f"- **Typical applications:** {', '.join(grade.get('applications', []))}"
+        ]
+    return "\n".join(lines)
+
+@st.fragment
 def render_predictive_analytics_demo():
     """Render predictive analytics demo"""
     st.subheader("📊 Predictive Analytics Simulator")
     st.write("Simulate predictive maintenance scenarios and see AI-driven insights")
     
+    model_key = st.selectbox(
+        "Risk model:",
+        list(RISK_MODELS.keys()),
+        format_func=lambda key: RISK_MODELS[key].name,
+        key="maintenance_model"
+    )
+    model = RISK_MODELS[model_key]
+    
+    single_tab, fleet_tab = st.tabs(["🎛️ Single Asset", "🏭 Fleet Scoring"])
+    
+    with single_tab:
+        render_single_asset_prediction(model)
+    
+    with fleet_tab:
+        render_fleet_scoring(model)
+
+def render_single_asset_prediction(model):
+    """Score one asset from the simulation sliders"""
     # Equipment selection
     equipment_type = st.selectbox(
         "Select equipment type:",
-        ["Blast Furnace", "Rolling Mill", "Heat Treatment Furnace", "Casting Machine"]
+        list(EQUIPMENT_TYPES)
     )
     
     # Simulation parameters
@@ -433,6 +626,7 @@ def render_predictive_analytics_demo():
         log_user_action("demo_interaction", {
             "demo": "predictive_analytics",
             "equipment": equipment_type,
+            "model": model.name,
             "parameters": {
                 "operating_hours": operating_hours,
                 "temperature": temperature_avg,
@@ -441,25 +635,18 @@ def render_predictive_analytics_demo():
             }
         })
         
-        # Mock prediction results
         with st.spinner("Running AI prediction model..."):
-            # Calculate mock failure probability based on parameters
-            failure_prob = min(95, max(5, 
-                (operating_hours / 744 * 30) + 
-                (temperature_avg / 1500 * 20) + 
-                (vibration_level / 20 * 25) + 
-                (last_maintenance / 365 * 25)
-            ))
+            failure_prob = score_asset(operating_hours, temperature_avg, vibration_level, last_maintenance, model)
             
             st.write("🎯 **Prediction Results:**")
             st.write(f"- **Equipment:** {equipment_type}")
             st.write(f"- **Failure probability:** {failure_prob:.0f}% (next 30 days)")
             
-            if failure_prob > 70:
+            if failure_prob > HIGH_RISK:
                 st.error("⚠️ **High risk** - Immediate maintenance recommended")
                 st.write("- **Recommended action:** Schedule emergency maintenance")
                 st.write("- **Estimated downtime:** 8-12 hours")
-            elif failure_prob > 40:
+            elif failure_prob > MEDIUM_RISK:
                 st.warning("⚡ **Medium risk** - Schedule maintenance soon")
                 st.write("- **Recommended action:** Schedule maintenance within 2 weeks")
                 st.write("- **Estimated downtime:** 4-6 hours")
@@ -471,17 +658,99 @@ def render_predictive_analytics_demo():
             st.write(f"- **Confidence level:** {min(98, max(85, 100 - failure_prob/2)):.0f}%")
             st.write(f"- **Model accuracy:** 94.2% (based on 10,000+ historical cases)")
 
+def render_fleet_scoring(model):
+    """Score a whole fleet from a CSV upload (or a generated sample) and rank it by risk"""
+    st.write(f"Upload a CSV with one row per asset and the columns: `{'`, `'.join(FEATURES)}`")
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        fleet_file = st.file_uploader("Fleet data (CSV)", type=['csv'], key="fleet_csv")
+    with col2:
+        st.write("")
+        if st.button("🧪 Use sample fleet", help="Generate 100,000 synthetic assets", use_container_width=True):
+            st.session_state.fleet_source = "sample"
+    
+    if fleet_file is not None:
+        source_key = fleet_file.file_id
+    elif st.session_state.get('fleet_source') == "sample":
+        source_key = "sample"
+    else:
+        st.info("👆 Upload fleet data or use the sample fleet to rank every asset by failure risk")
+        return
+    
+    # Re-score only when the data or the model changes, not on every widget interaction
+    result_key = (source_key, model.name)
+    if st.session_state.get('fleet_result_key') != result_key:
+        try:
+            fleet = read_fleet_csv(fleet_file) if fleet_file is not None else generate_sample_fleet()
+            start = time.perf_counter()
+            ranked = score_fleet(fleet, model)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        except (ValueError, pd.errors.ParserError) as e:
+            st.error(f"❌ Could not score fleet: {e}")
+            return
+        
+        log_user_action("demo_interaction", {
+            "demo": "predictive_analytics_fleet",
+            "model": model.name,
+            "assets": len(ranked),
+            "scoring_ms": round(elapsed_ms, 1)
+        })
+        st.session_state.fleet_result = (ranked, elapsed_ms)
+        st.session_state.fleet_result_key = result_key
+    
+    ranked, elapsed_ms = st.session_state.fleet_result
+    summary = summarize_risk(ranked)
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric("Assets Scored", f"{len(ranked):,}")
+    col2.metric("🔴 High Risk", f"{summary['High']:,}")
+    col3.metric("🟡 Medium Risk", f"{summary['Medium']:,}")
+    col4.metric("🟢 Low Risk", f"{summary['Low']:,}")
+    col5.metric("Scoring Time", f"{elapsed_ms:.0f} ms")
+    
+    if ranked.attrs.get("dropped"):
+        st.warning(f"{ranked.attrs['dropped']:,} rows skipped because of missing or non-numeric values")
+    
+    st.markdown("#### Highest-risk assets")
+    st.dataframe(ranked.head(100), use_container_width=True, hide_index=True)
+    
+    st.markdown("#### Risk distribution")
+    counts, edges = np.histogram(ranked["failure_prob"].to_numpy(), bins=20, range=(0, 100))
+    st.bar_chart(pd.DataFrame({"Assets": counts}, index=[f"{edge:.0f}%" for edge in edges[:-1]]))
+    
+    st.download_button(
+        "⬇️ Download top 1,000 ranked assets",
+        ranked.head(1000).to_csv(index=False),
+        file_name="fleet_risk_ranking.csv",
+        mime="text/csv"
+    )
+
 def launch_agent(agent: Dict[str, Any]):
-    """Launch a live agent"""
-    st.balloons()
+    """Launch a live agent with a query console routed through the agent gateway"""
     st.success(f"🚀 {agent['name']} launched successfully!")
     
     # Show agent URL or embed
-    if agent.get('url'):
-        st.markdown(f"**Agent URL:** [{agent['url']}]({agent['url']})")
-        st.info("🔗 Click the link above to access the agent interface")
-    else:
+    if not agent.get('url'):
         st.warning("Agent URL not configured yet")
+        return
+
+    st.markdown(f"**Agent URL:** [{agent['url']}]({agent['url']})")
+
+    with st.form(key=f"agent_query_{agent['id']}"):
+        query = st.text_area("Ask the agent", placeholder=f"e.g. {agent.get('description', 'Describe your question')}")
+        submitted = st.form_submit_button("Send")
+
+    if submitted and query.strip():
+        log_user_action("agent_query", {
+            "agent_id": agent['id'],
+            "provider": agent.get('provider', 'Unknown'),
+            "query_length": len(query)
+        })
+        try:
+            st.write_stream(stream_agent_query(agent, query))
+        except AgentGatewayError as e:
+            st.error(f"❌ {agent['name']} did not respond: {e}")
 
 def show_agent_details(agent: Dict[str, Any]):
     """Show detailed agent information"""
@@ -496,10 +765,13 @@ def show_agent_details(agent: Dict[str, Any]):
             st.write(f"- **Category:** {agent.get('category', 'Unknown')}")
         
         with col2:
+            health = get_agent_health(agent['id'])
             st.write("**Performance Metrics:**")
-            st.write(f"- **Uptime:** {agent.get('uptime', 'N/A')}")
-            st.write(f"- **Response Time:** {agent.get('response_time', 'N/A')}")
+            st.write(f"- **Uptime:** {format_uptime(health)}")
+            st.write(f"- **Response Time:** {format_response_time(health)} (p95 {format_response_time(health, 'p95')})")
             st.write(f"- **Cost per Query:** {agent.get('cost_per_query', 'N/A')}")
+            if health['last_checked']:
+                st.caption(f"Last checked {health['last_checked']} over {health['samples']} probes")
         
         st.write("**Capabilities:**")
         capabilities = agent.get('capabilities', [])
@@ -510,29 +782,30 @@ def show_agent_performance(agent: Dict[str, Any]):
     """Show agent performance metrics"""
     st.subheader(f"📊 {agent['name']} Performance")
     
-    # Mock performance data
+    # Rolling health figures from the background prober
+    health = get_agent_health(agent['id'])
     col1, col2, col3 = st.columns(3)
     
-    col1.metric("Uptime", agent.get('uptime', 'N/A'))
-    col2.metric("Avg Response Time", agent.get('response_time', 'N/A'))
-    col3.metric("Success Rate", "96.8%", "1.2%")
+    col1.metric("Uptime", format_uptime(health))
+    col2.metric("Response Time (p50)", format_response_time(health))
+    col3.metric("Response Time (p95)", format_response_time(health, 'p95'))
     
-    # Mock usage chart
-    st.write("**Usage Trends (Last 30 days):**")
-    import pandas as pd
-    import numpy as np
+    render_agent_usage(agent)
     
-    dates = pd.date_range(start='2024-06-01', periods=30, freq='D')
-    usage_data = pd.DataFrame({
-        'Date': dates,
-        'Queries': np.random.randint(50, 200, 30),
-        'Success Rate': np.random.uniform(0.9, 0.99, 30)
-    })
+    history = get_agent_health_history(agent['id'])
+    if not history:
+        st.info("⏳ Waiting for the first health probe of this agent")
+        return
     
-    st.line_chart(usage_data.set_index('Date'))
+    st.write("**Response Time (ms):**")
+    samples = pd.DataFrame(history).set_index('time')
+    st.line_chart(samples[['latency_ms']].where(samples['available']))
     
-    st.info("📈 Performance metrics are updated in real-time based on agent usage and feedback")
+    if health['available'] is False:
+        st.warning(f"⚠️ Last probe failed ({health.get('last_error') or 'unreachable'})")
+    st.caption(f"Rolling window of {health['samples']} probes, last checked {health['last_checked']}")
 
+@st.fragment
 def render_multi_agent_workflow_demo():
     """Render multi-agent workflow demo"""
     st.subheader("🤖 Multi-Agent Workflow Simulator")
@@ -549,50 +822,50 @@ def render_multi_agent_workflow_demo():
         ]
     )
     
-    # Show scenario details
+    # Show scenario details; steps without a dependency between them run concurrently
     scenario_details = {
         "New Product Development Pipeline": {
             "agents": ["Market Research Agent", "Design Agent", "Material Selector", "Cost Analyzer", "Compliance Checker"],
             "description": "Collaborative agents work together to develop a new steel product from market research to compliance verification",
             "steps": [
-                "Market Research Agent analyzes market trends and customer needs",
-                "Design Agent creates product specifications based on requirements",
-                "Material Selector chooses optimal steel composition",
-                "Cost Analyzer calculates production costs and pricing",
-                "Compliance Checker ensures regulatory compliance"
+                WorkflowStep("market_research", "Market Research Agent", "analyzes market trends and customer needs", duration=1.6),
+                WorkflowStep("material_selection", "Material Selector", "shortlists steel compositions for the target properties", duration=1.2),
+                WorkflowStep("design", "Design Agent", "creates product specifications based on requirements", ("market_research", "material_selection"), 1.4),
+                WorkflowStep("cost_analysis", "Cost Analyzer", "calculates production costs and pricing", ("design",), 1.0),
+                WorkflowStep("compliance", "Compliance Checker", "ensures regulatory compliance", ("design",), 1.2)
             ]
         },
         "Supply Chain Optimization": {
             "agents": ["Demand Forecaster", "Inventory Optimizer", "Logistics Planner", "Risk Assessor", "Vendor Selector"],
             "description": "Agents collaborate to optimize the entire supply chain for maximum efficiency",
             "steps": [
-                "Demand Forecaster predicts future demand patterns",
-                "Inventory Optimizer calculates optimal stock levels",
-                "Logistics Planner designs efficient transportation routes",
-                "Risk Assessor identifies potential supply chain risks",
-                "Vendor Selector recommends best suppliers"
+                WorkflowStep("demand_forecast", "Demand Forecaster", "predicts future demand patterns", duration=1.5),
+                WorkflowStep("supplier_risk", "Risk Assessor", "identifies potential supply chain risks", duration=1.3),
+                WorkflowStep("inventory", "Inventory Optimizer", "calculates optimal stock levels", ("demand_forecast",), 1.0),
+                WorkflowStep("logistics", "Logistics Planner", "designs efficient transportation routes", ("demand_forecast",), 1.2),
+                WorkflowStep("vendor_selection", "Vendor Selector", "recommends best suppliers", ("supplier_risk", "inventory"), 0.9)
             ]
         },
         "Quality Issue Resolution": {
             "agents": ["Quality Detector", "Root Cause Analyzer", "Solution Generator", "Implementation Planner", "Validator"],
             "description": "Coordinated response to quality issues with rapid resolution",
             "steps": [
-                "Quality Detector identifies and categorizes the issue",
-                "Root Cause Analyzer determines underlying causes",
-                "Solution Generator proposes corrective actions",
-                "Implementation Planner creates action timeline",
-                "Validator confirms solution effectiveness"
+                WorkflowStep("detection", "Quality Detector", "identifies and categorizes the issue", duration=0.8),
+                WorkflowStep("root_cause", "Root Cause Analyzer", "determines underlying causes", ("detection",), 1.6),
+                WorkflowStep("solution", "Solution Generator", "proposes corrective actions", ("root_cause",), 1.1),
+                WorkflowStep("implementation", "Implementation Planner", "creates action timeline", ("solution",), 0.9),
+                WorkflowStep("validation", "Validator", "confirms solution effectiveness", ("solution",), 1.0)
             ]
         },
         "Customer Order Processing": {
             "agents": ["Order Validator", "Inventory Checker", "Production Scheduler", "Quality Assurer", "Delivery Coordinator"],
             "description": "End-to-end order processing with quality assurance and delivery coordination",
             "steps": [
-                "Order Validator checks order specifications and feasibility",
-                "Inventory Checker verifies material availability",
-                "Production Scheduler optimizes manufacturing timeline",
-                "Quality Assurer ensures product meets specifications",
-                "Delivery Coordinator manages logistics and delivery"
+                WorkflowStep("order_validation", "Order Validator", "checks order specifications and feasibility", duration=0.7),
+                WorkflowStep("inventory_check", "Inventory Checker", "verifies material availability", ("order_validation",), 1.0),
+                WorkflowStep("quality_plan", "Quality Assurer", "ensures product meets specifications", ("order_validation",), 0.9),
+                WorkflowStep("scheduling", "Production Scheduler", "optimizes manufacturing timeline", ("inventory_check",), 1.2),
+                WorkflowStep("delivery", "Delivery Coordinator", "manages logistics and delivery", ("scheduling", "quality_plan"), 0.9)
             ]
         }
     }
@@ -604,109 +877,196 @@ def render_multi_agent_workflow_demo():
     st.write(f"**Description:** {current_scenario['description']}")
     st.write(f"**Agents Involved:** {', '.join(current_scenario['agents'])}")
     
-    # Simulate workflow execution
+    run_id = st.session_state.get('workflow_run_id')
+    run = get_workflow_run(run_id) if run_id else None
+    if run is not None and run.name != workflow_scenario:
+        # Scenario changed: stop the previous run
+        workflow_engine.cancel(run.run_id)
+        run = None
+    
+    col1, col2 = st.columns(2)
+    use_cache = col1.checkbox("♻️ Reuse cached step results", value=True, help="Steps whose inputs are unchanged return their previous result instantly")
+    step_timeout = col2.slider("Per-step timeout (s)", 0.5, 5.0, float(get_agent_config().workflow_step_timeout), 0.5)
+    
     if st.button("🚀 Start Multi-Agent Workflow"):
         log_user_action("demo_interaction", {
             "demo": "multi_agent_workflow",
             "scenario": workflow_scenario,
             "agent_count": len(current_scenario['agents'])
         })
-        
-        # Progress tracking
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        # Agent collaboration simulation
-        for i, (agent, step) in enumerate(zip(current_scenario['agents'], current_scenario['steps'])):
-            progress_percentage = (i + 1) / len(current_scenario['agents'])
-            progress_bar.progress(progress_percentage)
-            status_text.text(f"🤖 {agent} is working...")
-            
-            # Simulate processing time
-            import time
-            time.sleep(1)
-            
-            # Show step completion
-            st.success(f"✅ **{agent}** completed: {step}")
-        
-        # Final results
+        if run is not None:
+            workflow_engine.cancel(run.run_id)
+        run = start_workflow(workflow_scenario, current_scenario['steps'], timeout=step_timeout, use_cache=use_cache)
+        st.session_state.workflow_run_id = run.run_id
+    
+    if run is None:
+        return
+    if not run.finished:
+        render_workflow_progress(run.run_id)
+        return
+    
+    render_workflow_timeline(run)
+    if run.status == "cancelled":
+        st.warning("Workflow cancelled")
+        return
+    if run.status == "failed":
+        failed = [step for step in run.steps if run.step_runs[step.id].error]
+        st.error("❌ Workflow incomplete: " + "; ".join(f"{step.agent} — {run.step_runs[step.id].error}" for step in failed))
+        return
+    
+    # Celebrate once per run, not on every rerun
+    if st.session_state.get('workflow_celebrated') != run.run_id:
+        st.session_state.workflow_celebrated = run.run_id
         st.balloons()
-        st.success("🎉 Multi-Agent Workflow Completed Successfully!")
-        
-        # Show workflow results
-        st.subheader("📊 Workflow Results")
-        
-        if workflow_scenario == "New Product Development Pipeline":
-            col1, col2, col3 = st.columns(3)
-            col1.metric("Market Potential", "85%", "12%")
-            col2.metric("Development Cost", "$2.4M", "-15%")
-            col3.metric("Time to Market", "8 months", "-2 months")
-            
-            st.write("**Key Insights:**")
-            st.write("• High market demand for corrosion-resistant steel alloys")
-            st.write("• Optimal composition: 316L stainless steel with enhanced properties")
-            st.write("• Production cost optimized through automated processes")
-            st.write("• All regulatory requirements met (ASTM, ISO standards)")
-        
-        elif workflow_scenario == "Supply Chain Optimization":
-            col1, col2, col3 = st.columns(3)
-            col1.metric("Cost Reduction", "18%", "3%")
-            col2.metric("Delivery Time", "5.2 days", "-1.3 days")
-            col3.metric("Risk Score", "Low", "Improved")
-            
-            st.write("**Optimization Results:**")
-            st.write("• Inventory levels reduced by 22% while maintaining service levels")
-            st.write("• Transportation costs decreased through route optimization")
-            st.write("• Alternative suppliers identified for critical materials")
-            st.write("• Risk mitigation strategies implemented")
-        
-        elif workflow_scenario == "Quality Issue Resolution":
-            col1, col2, col3 = st.columns(3)
-            col1.metric("Resolution Time", "2.5 hours", "-4.5 hours")
-            col2.metric("Root Cause Found", "Yes", "100%")
-            col3.metric("Customer Impact", "Minimal", "Reduced")
-            
-            st.write("**Resolution Summary:**")
-            st.write("• Issue: Surface defects in rolled steel products")
-            st.write("• Root cause: Temperature fluctuation in heat treatment")
-            st.write("• Solution: Automated temperature control system upgrade")
-            st.write("• Prevention: Enhanced monitoring protocols implemented")
-        
-        elif workflow_scenario == "Customer Order Processing":
-            col1, col2, col3 = st.columns(3)
-            col1.metric("Processing Time", "12 minutes", "-48 minutes")
-            col2.metric("Order Accuracy", "99.8%", "0.3%")
-            col3.metric("Customer Satisfaction", "4.9/5", "0.2")
-            
-            st.write("**Order Processing Results:**")
-            st.write("• Order validated against technical specifications")
-            st.write("• Materials confirmed available in inventory")
-            st.write("• Production scheduled for optimal efficiency")
-            st.write("• Quality checkpoints established throughout process")
-            st.write("• Delivery timeline confirmed with customer")
+    st.success("🎉 Multi-Agent Workflow Completed Successfully!")
+    render_workflow_results(workflow_scenario, len(current_scenario['agents']))
+
+def cancel_workflow(run_id: str):
+    """Callback to cancel a running workflow"""
+    workflow_engine.cancel(run_id)
+
+@st.fragment(run_every=0.5)
+def render_workflow_progress(run_id: str):
+    """Poll a running workflow and redraw its timeline"""
+    run = get_workflow_run(run_id)
+    if run is None or run.finished:
+        # One full rerun renders the final results and stops the polling
+        st.rerun()
+    
+    completed = sum(1 for step_run in run.step_runs.values() if step_run.finished is not None)
+    running = [step.agent for step in run.steps if run.step_runs[step.id].status == "running"]
+    st.progress(completed / len(run.steps), text=f"🤖 {', '.join(running) or 'Agents'} working... ({run.elapsed:.1f}s)")
+    st.button("⏹️ Cancel Workflow", on_click=cancel_workflow, args=(run_id,))
+    render_workflow_gantt(run)
+
+def render_workflow_timeline(run):
+    """Show the finished run's Gantt chart and its critical path against sequential execution"""
+    st.subheader("⏱️ Execution Timeline")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("End-to-End", f"{run.elapsed:.1f}s")
+    col2.metric("Sequential Equivalent", f"{run.sequential_time:.1f}s")
+    col3.metric("Parallel Speedup", f"{run.sequential_time / run.elapsed:.1f}x" if run.elapsed > 0.05 else "—")
+    
+    steps = {step.id: step for step in run.steps}
+    critical_path = run.critical_path()
+    if critical_path:
+        st.caption("Critical path: " + " → ".join(steps[step_id].agent for step_id in critical_path))
+    render_workflow_gantt(run, critical_path)
+
+def render_workflow_gantt(run, critical_path=()):
+    """Horizontal bar per step from its start to its finish, colored by status"""
+    import plotly.graph_objects as go
+    
+    status_colors = {
+        "done": "#2E8B57", "cached": "#20B2AA", "running": "#1E90FF", "failed": "#DC143C",
+        "timed_out": "#FF8C00", "cancelled": "#808080", "skipped": "#C0C0C0"
+    }
+    now = run.elapsed
+    fig = go.Figure()
+    for status, color in status_colors.items():
+        bars = [
+            (step, run.step_runs[step.id]) for step in run.steps
+            if run.step_runs[step.id].status == status and run.step_runs[step.id].started is not None
+        ]
+        if not bars:
+            continue
+        fig.add_trace(go.Bar(
+            y=[step.agent for step, _ in bars],
+            x=[max((step_run.finished if step_run.finished is not None else now) - step_run.started, 0.02) for _, step_run in bars],
+            base=[step_run.started for _, step_run in bars],
+            orientation='h',
+            name=status.replace("_", " ").title(),
+            marker=dict(
+                color=color,
+                line=dict(color="#000000", width=[2 if step.id in critical_path else 0 for step, _ in bars])
+            ),
+            hovertext=[step.task for step, _ in bars]
+        ))
+    
+    fig.update_layout(
+        height=60 + 45 * len(run.steps),
+        margin=dict(l=10, r=10, t=10, b=10),
+        xaxis=dict(title="Seconds", range=[0, max(now, 1.0) * 1.05]),
+        yaxis=dict(categoryorder="array", categoryarray=[step.agent for step in reversed(run.steps)]),
+        legend=dict(orientation="h")
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+def render_workflow_results(workflow_scenario: str, agent_count: int):
+    """Render the business results for a completed workflow scenario"""
+    st.subheader("📊 Workflow Results")
+    
+    if workflow_scenario == "New Product Development Pipeline":
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Market Potential", "85%", "12%")
+        col2.metric("Development Cost", "$2.4M", "-15%")
+        col3.metric("Time to Market", "8 months", "-2 months")
         
-        # Agent coordination insights
-        st.subheader("🔄 Agent Coordination Insights")
-        st.write("**Collaboration Highlights:**")
-        st.write("• All agents shared real-time data and insights")
-        st.write("• Conflicts resolved through automated negotiation protocols")
-        st.write("• Workflow optimized based on agent capabilities")
-        st.write("• Human oversight maintained at critical decision points")
+        st.write("**Key Insights:**")
+        st.write("• High market demand for corrosion-resistant steel alloys")
+        st.write("• Optimal composition: 316L stainless steel with enhanced properties")
+        st.write("• Production cost optimized through automated processes")
+        st.write("• All regulatory requirements met (ASTM, ISO standards)")
+    
+    elif workflow_scenario == "Supply Chain Optimization":
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Cost Reduction", "18%", "3%")
+        col2.metric("Delivery Time", "5.2 days", "-1.3 days")
+        col3.metric("Risk Score", "Low", "Improved")
         
-        # Show agent interaction network
-        st.subheader("🕸️ Agent Interaction Network")
-        st.info("📊 Interactive network diagram showing agent communications and dependencies would be displayed here in production")
+        st.write("**Optimization Results:**")
+        st.write("• Inventory levels reduced by 22% while maintaining service levels")
+        st.write("• Transportation costs decreased through route optimization")
+        st.write("• Alternative suppliers identified for critical materials")
+        st.write("• Risk mitigation strategies implemented")
+    
+    elif workflow_scenario == "Quality Issue Resolution":
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Resolution Time", "2.5 hours", "-4.5 hours")
+        col2.metric("Root Cause Found", "Yes", "100%")
+        col3.metric("Customer Impact", "Minimal", "Reduced")
         
-        # Performance metrics
-        st.subheader("📈 Performance Metrics")
-        col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Total Agents", len(current_scenario['agents']))
-        col2.metric("Messages Exchanged", "147", "32")
-        col3.metric("Decisions Made", "23", "12")
-        col4.metric("Efficiency Gain", "34%", "8%")
+        st.write("**Resolution Summary:**")
+        st.write("• Issue: Surface defects in rolled steel products")
+        st.write("• Root cause: Temperature fluctuation in heat treatment")
+        st.write("• Solution: Automated temperature control system upgrade")
+        st.write("• Prevention: Enhanced monitoring protocols implemented")
+    
+    elif workflow_scenario == "Customer Order Processing":
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Processing Time", "12 minutes", "-48 minutes")
+        col2.metric("Order Accuracy", "99.8%", "0.3%")
+        col3.metric("Customer Satisfaction", "4.9/5", "0.2")
         
-        st.write("**Next Steps:**")
-        st.write("• Review agent recommendations with stakeholders")
-        st.write("• Implement approved actions with proper oversight")
-        st.write("• Monitor results and collect feedback for continuous improvement")
-        st.write("• Scale successful workflows to other business processes")
\ No newline at end of file
+        st.write("**Order Processing Results:**")
+        st.write("• Order validated against technical specifications")
+        st.write("• Materials confirmed available in inventory")
+        st.write("• Production scheduled for optimal efficiency")
+        st.write("• Quality checkpoints established throughout process")
+        st.write("• Delivery timeline confirmed with customer")
+    
+    # Agent coordination insights
+    st.subheader("🔄 Agent Coordination Insights")
+    st.write("**Collaboration Highlights:**")
+    st.write("• All agents shared real-time data and insights")
+    st.write("• Conflicts resolved through automated negotiation protocols")
+    st.write("• Workflow optimized based on agent capabilities")
+    st.write("• Human oversight maintained at critical decision points")
+    
+    # Show agent interaction network
+    st.subheader("🕸️ Agent Interaction Network")
+    st.info("📊 Interactive network diagram showing agent communications and dependencies would be displayed here in production")
+    
+    # Performance metrics
+    st.subheader("📈 Performance Metrics")
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total Agents", agent_count)
+    col2.metric("Messages Exchanged", "147", "32")
+    col3.metric("Decisions Made", "23", "12")
+    col4.metric("Efficiency Gain", "34%", "8%")
+    
+    st.write("**Next Steps:**")
+    st.write("• Review agent recommendations with stakeholders")
+    st.write("• Implement approved actions with proper oversight")
+    st.write("• Monitor results and collect feedback for continuous improvement")
+    st.write("• Scale successful workflows to other business processes")
@@ -0,0 +1,107 @@
+"""
+Analytics Dashboard Page
+Usage trends served from the pre-aggregated analytics rollups
+"""
+
+import streamlit as st
+import pandas as pd
+from src.services.analytics_service import analytics_pipeline, get_analytics_stats
+from src.services.analytics_store import METRICS, analytics_store, range_start
+from src.utils.helpers import render_back_button
+
+# Label -> (days back, bucket granularity)
+TIME_RANGES = {
+    "Last 24 hours": (1, "hour"),
+    "Last 7 days": (7, "hour"),
+    "Last 30 days": (30, "day"),
+    "Last 90 days": (90, "day"),
+    "Last 12 months": (365, "day")
+}
+
+def render_analytics_page():
+    """Render the analytics dashboard page"""
+    # Back to home button
+    render_back_button("back_to_home_analytics")
+
+    st.title("📊 Analytics Dashboard")
+
+    col1, col2 = st.columns([3, 1])
+
+    with col1:
+        time_range = st.selectbox("Time range", list(TIME_RANGES.keys()), index=1, key="analytics_time_range")
+
+    with col2:
+        st.write("")
+        if st.button("🔄 Refresh", use_container_width=True):
+            # Push buffered events into the rollups before re-querying
+            analytics_pipeline.flush()
+
+    days, granularity = TIME_RANGES[time_range]
+    start = range_start(days, granularity)
+
+    render_summary_metrics(granularity, start)
+
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "📄 Page Views",
+        "🤖 Demo Interactions",
+        "📰 News Source Errors",
+        "💡 Submissions"
+    ])
+
+    with tab1:
+        render_metric_section("page_views", granularity, start, "Page")
+
+    with tab2:
+        render_metric_section("demo_interactions", granularity, start, "Demo")
+
+    with tab3:
+        render_metric_section("news_source_errors", granularity, start, "Source")
+
+    with tab4:
+        render_metric_section("submissions", granularity, start, "Department")
+
+    stats = get_analytics_stats()
+    st.caption(
+        f"Pipeline: {stats['buffered']} buffered | {stats['flushed']} flushed | "
+        f"{stats['dropped']} dropped — figures lag live traffic by up to one flush interval"
+    )
+
+def render_summary_metrics(granularity: str, start: str):
+    """Render headline totals for the selected range"""
+    totals = analytics_store.get_totals(granularity, start)
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    with col1:
+        st.metric("Active Sessions", analytics_store.get_active_sessions(granularity, start))
+
+    with col2:
+        st.metric(METRICS["page_views"], totals["page_views"])
+
+    with col3:
+        st.metric(METRICS["demo_interactions"], totals["demo_interactions"])
+
+    with col4:
+        st.metric(METRICS["news_source_errors"], totals["news_source_errors"])
+
+    with col5:
+        st.metric(METRICS["submissions"], totals["submissions"])
+
+def render_metric_section(metric: str, granularity: str, start: str, dimension_label: str):
+    """Render the trend and breakdown for one metric"""
+    series = analytics_store.get_series(metric, granularity, start)
+
+    if not series:
+        st.info(f"No {METRICS[metric].lower()} recorded in this time range yet.")
+        return
+
+    st.markdown(f"#### {METRICS[metric]} per {granularity}")
+    trend = pd.DataFrame(series, columns=["Period", METRICS[metric]]).set_index("Period")
+    st.line_chart(trend)
+
+    st.markdown(f"#### By {dimension_label.lower()}")
+    breakdown = pd.DataFrame(
+        analytics_store.get_breakdown(metric, granularity, start),
+        columns=[dimension_label, "Count"]
+    ).set_index(dimension_label)
+    st.bar_chart(breakdown)
@@ -8,14 +8,12 @@ from typing import Dict, List, Optional
 from datetime import datetime
 import os
 from src.config.settings import get_app_config
-from src.utils.helpers import log_user_action
+from src.utils.helpers import log_user_action, render_back_button
 
 def render_governance_page():
     """Render the AI governance page"""
     # Back to home button
-    if st.button("← Back to Home", key="back_to_home_governance"):
-        st.session_state.page = "🏠 Home"
-        st.rerun()
+    render_back_button("back_to_home_governance")
     
     st.title("📚 AI Governance")
     
@@ -39,6 +37,7 @@ def render_governance_page():
     with tab4:
         render_resources_section()
 
+@st.fragment
 def render_policies_section():
     """Render policies and guidelines section"""
     st.markdown("### 📋 AI Policies & Guidelines")
@@ -139,6 +138,7 @@ def render_policies_section():
                 if st.button("📋 Start Workflow", key=f"start_{workflow['name'].replace(' ', '_')}"):
                     st.info("Workflow integration coming soon!")
 
+@st.fragment
 def render_risk_management_section():
     """Render risk management section"""
     st.markdown("### 🛡️ AI Risk Management")
@@ -243,6 +243,7 @@ def render_risk_management_section():
                 if st.button("📋 Implementation Plan", key=f"implement_{strategy['strategy'].replace(' ', '_')}"):
                     show_implementation_plan(strategy)
 
+@st.fragment
 def render_compliance_dashboard():
     """Render compliance dashboard"""
     st.markdown("### 📊 Compliance Dashboard")
@@ -328,6 +329,7 @@ def render_compliance_dashboard():
     fig.update_layout(height=400, showlegend=True)
     st.plotly_chart(fig, use_container_width=True)
 
+@st.fragment
 def render_resources_section():
     """Render resources and training section"""
     st.markdown("### 📚 Resources & Training")
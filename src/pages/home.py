@@ -5,7 +5,7 @@ Main dashboard with navigation and quick stats
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-from ..utils.helpers import navigate_to_page, show_breadcrumb, create_metric_card, log_user_action
+from ..utils.helpers import set_page, show_breadcrumb, create_metric_card, log_user_action
 from ..utils.css_loader import get_branded_header_css
 from src.services import news_service
 
@@ -39,22 +39,19 @@ def render_main_navigation():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        if st.button("🤖 Agent Studio", key="home_agents", use_container_width=True, 
-                    help="Interactive AI agents and demos • 5 Agents Available"):
-            log_user_action("navigation", {"destination": "agent_studio", "source": "home_main"})
-            navigate_to_page("🤖 Agent Studio")
+        st.button("🤖 Agent Studio", key="home_agents", use_container_width=True,
+                  help="Interactive AI agents and demos • 5 Agents Available",
+                  on_click=set_page, args=("🤖 Agent Studio", {"destination": "agent_studio", "source": "home_main"}))
     
     with col2:
-        if st.button("💡 Use Cases", key="home_cases", use_container_width=True, 
-                    help="Submit your AI ideas • Smart intake process"):
-            log_user_action("navigation", {"destination": "use_cases", "source": "home_main"})
-            navigate_to_page("💡 Use Case Intake")
+        st.button("💡 Use Cases", key="home_cases", use_container_width=True,
+                  help="Submit your AI ideas • Smart intake process",
+                  on_click=set_page, args=("💡 Use Case Intake", {"destination": "use_cases", "source": "home_main"}))
     
     with col3:
-        if st.button("📚 Governance", key="home_gov", use_container_width=True, 
-                    help="AI policies and frameworks • Enterprise ready"):
-            log_user_action("navigation", {"destination": "governance", "source": "home_main"})
-            navigate_to_page("📚 AI Governance")
+        st.button("📚 Governance", key="home_gov", use_container_width=True,
+                  help="AI policies and frameworks • Enterprise ready",
+                  on_click=set_page, args=("📚 AI Governance", {"destination": "governance", "source": "home_main"}))
 
 def render_secondary_navigation():
     """Render secondary navigation cards"""
@@ -62,22 +59,19 @@ def render_secondary_navigation():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        if st.button("🎓 AI Academy", key="home_academy", use_container_width=True, 
-                    help="Learn AI technologies • Multiple learning paths"):
-            log_user_action("navigation", {"destination": "academy", "source": "home_secondary"})
-            navigate_to_page("🎓 AI Academy")
+        st.button("🎓 AI Academy", key="home_academy", use_container_width=True,
+                  help="Learn AI technologies • Multiple learning paths",
+                  on_click=set_page, args=("🎓 AI Academy", {"destination": "academy", "source": "home_secondary"}))
     
     with col2:
-        if st.button("📰 AI News", key="home_news_btn", use_container_width=True, 
-                    help="Latest AI developments • Breaking news & updates"):
-            log_user_action("navigation", {"destination": "news", "source": "home_secondary"})
-            navigate_to_page("📰 AI News")
+        st.button("📰 AI News", key="home_news_btn", use_container_width=True,
+                  help="Latest AI developments • Breaking news & updates",
+                  on_click=set_page, args=("📰 AI News", {"destination": "news", "source": "home_secondary"}))
     
     with col3:
-        if st.button("📊 Analytics", key="home_analytics", use_container_width=True, 
-                    help="Usage metrics • Performance insights"):
-            log_user_action("navigation", {"destination": "analytics", "source": "home_secondary"})
-            navigate_to_page("📊 Analytics Dashboard")
+        st.button("📊 Analytics", key="home_analytics", use_container_width=True,
+                  help="Usage metrics • Performance insights",
+                  on_click=set_page, args=("📊 Analytics Dashboard", {"destination": "analytics", "source": "home_secondary"}))
 
 def render_quick_stats():
     """Render quick statistics section"""
@@ -111,9 +105,8 @@ def render_news_preview():
             st.write("• Enterprise AI adoption accelerates")
             st.write("• New breakthroughs in manufacturing AI")
         
-        if st.button("📰 View All AI News", key="home_news"):
-            log_user_action("navigation", {"destination": "news", "source": "home_news_preview"})
-            navigate_to_page("📰 AI News")
+        st.button("📰 View All AI News", key="home_news",
+                  on_click=set_page, args=("📰 AI News", {"destination": "news", "source": "home_news_preview"}))
     ''' 
     with col2:
         st.info("**Breaking:** OpenAI releases new o3 reasoning model")
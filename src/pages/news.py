@@ -12,7 +12,7 @@ import requests
 # Import configurations and helpers
 try:
     from src.config.settings import get_app_config
-    from src.utils.helpers import log_user_action
+    from src.utils.helpers import log_user_action, render_back_button
     from src.services import news_service  # Namespace import to avoid collision
 except ImportError:
     # Fallback for testing
@@ -21,9 +21,7 @@ except ImportError:
 def render_news_page():
     """Render the AI news aggregator page"""
     # Back to home button
-    if st.button("← Back to Home", key="back_to_home_news"):
-        st.session_state.page = "🏠 Home"
-        st.rerun()
+    render_back_button("back_to_home_news")
     
     st.title("📰 AI News Aggregator")
     
@@ -226,6 +224,7 @@ def render_ai_insights_tab(category_filter: List[str], source_filter: List[str],
     with st.expander("🔍 View Weekly Summary"):
         st.markdown(weekly_summary)
 
+@st.fragment
 def render_news_card(news_item, key: str):
     """Render a news card with improved layout"""
     with st.container(border=True):
@@ -267,6 +266,7 @@ def render_news_card(news_item, key: str):
         with btn_col4:
             st.markdown(f"**Category:** `{news_item.category}`")
 
+@st.fragment
 def render_research_card(paper, key: str):
     """Render a research paper card with academic focus"""
     with st.container(border=True):
@@ -0,0 +1,56 @@
+"""
+Page registry
+Maps navigation entries to page modules that are imported on first visit
+"""
+import importlib
+import sys
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from src.utils.profiler import profile_section, record_cache
+
+# Navigation label -> (module path, render function name)
+PAGE_REGISTRY = {
+    "🏠 Home": ("src.pages.home", "render_home_page"),
+    "🤖 Agent Studio": ("src.pages.agent_space", "render_agent_space"),
+    "💡 Use Case Intake": ("src.pages.use_cases", "render_use_cases_page"),
+    "📚 AI Governance": ("src.pages.governance", "render_governance_page"),
+    "🎓 AI Academy": ("src.pages.academy", "render_academy_page"),
+    "📰 AI News": ("src.pages.news", "render_news_page"),
+    "📊 Analytics Dashboard": ("src.pages.analytics", "render_analytics_page"),
+}
+
+DEFAULT_PAGE = "🏠 Home"
+
+_renderers: Dict[str, Callable] = {}
+_import_stats: Dict[str, Dict[str, float]] = {}
+_lock = threading.Lock()
+
+def get_page_renderer(page: str) -> Optional[Callable]:
+    """Get a page's render function, importing its module on first use"""
+    renderer = _renderers.get(page)
+    record_cache("page_modules", renderer is not None)
+    if renderer is not None:
+        return renderer
+
+    if page not in PAGE_REGISTRY:
+        return None
+
+    with _lock, profile_section("import page module"):
+        if page not in _renderers:
+            module_path, function_name = PAGE_REGISTRY[page]
+            modules_before = len(sys.modules)
+            start = time.perf_counter()
+            module = importlib.import_module(module_path)
+            _import_stats[page] = {
+                "seconds": time.perf_counter() - start,
+                "modules_loaded": len(sys.modules) - modules_before
+            }
+            _renderers[page] = getattr(module, function_name)
+
+    return _renderers[page]
+
+def get_page_import_stats() -> Dict[str, Dict[str, float]]:
+    """Get import time and newly loaded module count for every page imported so far"""
+    return dict(_import_stats)
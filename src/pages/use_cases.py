@@ -3,19 +3,30 @@ Use Case Management Page
 Handles AI use case intake, tracking, and management
 """
 
+import math
 import streamlit as st
 from typing import Dict, List, Optional
 from datetime import datetime
 from src.config.settings import get_app_config
-from src.utils.helpers import log_user_action
-from src.services.sheets_service import submit_use_case_to_sheets, test_sheets_connection
+from src.utils.helpers import log_user_action, render_back_button
+from src.models.submission import UseCaseSubmission, validate_submission
+from src.services.sheets_service import (
+    submit_use_case_to_sheets, test_sheets_connection, get_sheets_connection_status, start_status_sync,
+    replay_submission_backlog
+)
+from src.services.submissions_service import (
+    record_submission, get_submissions_for_user, count_submissions_for_user
+)
+from src.services.similarity_service import find_similar_use_cases, find_duplicate_use_cases, index_use_case
+from src.services.ideas_service import DEPARTMENTS, STATUSES, COMPLEXITIES, SORT_OPTIONS, query_ideas
+
+SUBMISSIONS_PAGE_SIZE = 10
+IDEAS_PAGE_SIZE = 10
 
 def render_use_cases_page():
     """Render the use cases page"""
     # Back to home button
-    if st.button("← Back to Home", key="back_to_home_use_cases"):
-        st.session_state.page = "🏠 Home"
-        st.rerun()
+    render_back_button("back_to_home_use_cases")
     
     st.title("💡 AI Use Case Intake")
     
@@ -166,6 +177,8 @@ def render_use_case_form():
                 height=80
             )
             
+            allow_similar = st.checkbox("Submit even if a similar idea already exists")
+            
             # Submit button
             submitted = st.form_submit_button("🚀 Submit Use Case", use_container_width=True)
             
@@ -175,6 +188,12 @@ def render_use_case_form():
                            business_unit != "Select Business Unit", use_case_title, 
                            problem_description, proposed_solution]):
                     st.error("Please fill in all required fields marked with *")
+                elif not allow_similar and (duplicates := find_duplicate_use_cases(use_case_title, problem_description)):
+                    st.warning("⚠️ This looks very similar to ideas that were already submitted:")
+                    for duplicate in duplicates:
+                        st.markdown(f"- **{duplicate['title']}** - {duplicate['department']} ({duplicate['status']}, {duplicate['score']:.0%} match)")
+                    st.info("Consider joining one of these initiatives, or tick the box above and submit again.")
+                    log_user_action("use_case_duplicate_detected", {"title": use_case_title, "matches": len(duplicates)})
                 else:
                     # Process submission
                     success = process_use_case_submission({
@@ -228,13 +247,19 @@ def render_use_case_form():
         if st.button("📞 Schedule AI Consultation", use_container_width=True):
             st.info("Calendly integration coming soon! Email ai-team@aperam.com to schedule.")
         
+        render_similar_ideas_search()
+        
         # Google Sheets integration status
         st.markdown("#### 🔧 Integration Status")
-        connection_status = test_sheets_connection()
-        if connection_status["success"]:
+        connection_status = get_sheets_connection_status()
+        if connection_status["success"] is None:
+            st.info("⏳ Checking integration status...")
+        elif connection_status["success"]:
             st.success(f"✅ {connection_status['method']} integration active")
         else:
             st.warning(f"⚠️ Using fallback method: {connection_status.get('error', 'No external integration')}")
+        if connection_status.get("checked_at"):
+            st.caption(f"Last checked: {connection_status['checked_at'][:19].replace('T', ' ')}")
         
         if st.button("🔄 Test Connection", use_container_width=True):
             with st.spinner("Testing connection..."):
@@ -243,7 +268,21 @@ def render_use_case_form():
                     st.success("✅ Connection successful!")
                 else:
                     st.error(f"❌ Connection failed: {status.get('error', 'Unknown error')}")
+        
+        if connection_status["success"] and connection_status["method"] != "Fallback":
+            if st.button("📤 Send Queued Submissions", use_container_width=True):
+                with st.spinner("Sending submissions saved while offline..."):
+                    result = replay_submission_backlog()
+                if result["pending"]:
+                    st.warning(f"⚠️ Sent {result['submitted']}, {result['pending']} still queued")
+                elif result["submitted"]:
+                    st.success(f"✅ Sent {result['submitted']} queued submissions")
+                else:
+                    st.info("No queued submissions to send")
+                if result["invalid"]:
+                    st.caption(f"{result['invalid']} queued submissions are invalid and were not sent")
 
+@st.fragment
 def render_existing_ideas():
     """Render the existing ideas showcase"""
     st.markdown("### 💡 Existing AI Ideas & Inspirations")
@@ -254,46 +293,43 @@ def render_existing_ideas():
     """)
     
     # Filter options
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     with col1:
-        filter_department = st.selectbox("Filter by Department", [
-            "All Departments",
-            "Research & Development",
-            "Production",
-            "Quality Control",
-            "Supply Chain",
-            "Finance",
-            "Sales & Marketing",
-            "IT",
-            "HR"
-        ])
+        filter_department = st.selectbox("Filter by Department", ["All Departments"] + DEPARTMENTS[:-1])
     
     with col2:
-        filter_status = st.selectbox("Filter by Status", [
-            "All Statuses",
-            "Under Review",
-            "In Development",
-            "Completed",
-            "On Hold"
-        ])
+        filter_status = st.selectbox("Filter by Status", ["All Statuses"] + STATUSES[:4])
     
     with col3:
-        filter_complexity = st.selectbox("Filter by Complexity", [
-            "All Complexities",
-            "Simple automation",
-            "Moderate AI/ML required",
-            "Complex AI/ML required",
-            "Cutting-edge research needed"
-        ])
+        filter_complexity = st.selectbox("Filter by Complexity", ["All Complexities"] + COMPLEXITIES)
+    
+    with col4:
+        sort_by = st.selectbox("Sort by", list(SORT_OPTIONS))
+    
+    filters = {
+        "department": None if filter_department == "All Departments" else filter_department,
+        "status": None if filter_status == "All Statuses" else filter_status,
+        "complexity": None if filter_complexity == "All Complexities" else filter_complexity
+    }
+    
+    # Only the visible page is materialized and rendered
+    page = st.session_state.get("ideas_page", 1)
+    filtered_ideas, total = query_ideas(sort_by=sort_by, page=page, page_size=IDEAS_PAGE_SIZE, **filters)
+    page_count = max(math.ceil(total / IDEAS_PAGE_SIZE), 1)
     
-    # Sample existing ideas
-    existing_ideas = get_sample_use_cases()
+    if page > page_count:
+        page = st.session_state.ideas_page = page_count
+        filtered_ideas, total = query_ideas(sort_by=sort_by, page=page, page_size=IDEAS_PAGE_SIZE, **filters)
     
-    # Apply filters
-    filtered_ideas = apply_filters(existing_ideas, filter_department, filter_status, filter_complexity)
+    if total == 0:
+        st.info("No ideas match these filters yet.")
+        return
+    
+    st.caption(f"{total} idea{'s' if total != 1 else ''} | Page {page} of {page_count}")
     
     # Display ideas in cards
-    for i, idea in enumerate(filtered_ideas):
+    for idea in filtered_ideas:
+        i = idea['id']
         with st.expander(f"💡 {idea['title']} - {idea['department']} ({idea['status']})"):
             col1, col2 = st.columns([3, 1])
             
@@ -310,6 +346,8 @@ def render_existing_ideas():
                 
                 if idea['status'] == "Completed":
                     st.success("✅ Completed")
+                elif idea['status'] == "Approved":
+                    st.success("✅ Approved")
                 elif idea['status'] == "In Development":
                     st.info("🔄 In Development")
                 elif idea['status'] == "Under Review":
@@ -329,18 +367,66 @@ def render_existing_ideas():
                 if st.button(f"🔄 Similar Idea", key=f"similar_{i}"):
                     st.session_state.similar_idea = idea
                     st.info("Use this as template for your submission!")
+                    render_similar_ideas(idea['title'], idea['problem'])
+    
+    if page_count > 1:
+        st.number_input("Page", min_value=1, max_value=page_count, key="ideas_page")
 
+@st.fragment
+def render_similar_ideas_search():
+    """Render the similar ideas lookup; typing reruns only this fragment"""
+    st.markdown("#### 🔍 Check for Similar Ideas")
+    similar_query = st.text_input(
+        "Describe your idea in a few words",
+        placeholder="e.g., predictive maintenance rolling mill",
+        key="similar_ideas_query"
+    )
+    if similar_query:
+        render_similar_ideas(similar_query)
+
+def render_similar_ideas(title: str, problem_description: str = ""):
+    """Render past submissions similar to the given idea"""
+    similar_ideas = find_similar_use_cases(title, problem_description)
+    
+    if not similar_ideas:
+        st.caption("No similar submissions found.")
+        return
+    
+    for similar in similar_ideas:
+        st.markdown(f"- **{similar['title']}** - {similar['department']} ({similar['status']}, {similar['score']:.0%} match)")
+
+@st.fragment
 def render_my_submissions():
     """Render user's submissions tracking"""
     st.markdown("### 📊 My Submissions")
     
-    # This would typically fetch from a database
-    user_submissions = get_user_submissions()
+    email = st.text_input(
+        "Your email address",
+        value=st.session_state.get('submitter_email', ''),
+        placeholder="john.doe@aperam.com",
+        key="my_submissions_email"
+    )
+    
+    if not email:
+        st.info("Enter the email address you submitted with to track your use cases.")
+        return
+    
+    # Review status changes are pulled from the Sheet in the background; this page only reads SQLite
+    start_status_sync()
     
-    if not user_submissions:
+    total = count_submissions_for_user(email)
+    if total == 0:
         st.info("No submissions yet. Submit your first AI use case to get started!")
         return
     
+    page_count = math.ceil(total / SUBMISSIONS_PAGE_SIZE)
+    page = 1
+    if page_count > 1:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, key="my_submissions_page")
+    st.caption(f"{total} submission{'s' if total != 1 else ''} | Page {page} of {page_count}")
+    
+    user_submissions = get_user_submissions(email, page)
+    
     # Display submissions
     for submission in user_submissions:
         with st.container():
@@ -371,16 +457,23 @@ def process_use_case_submission(submission_data: Dict) -> bool:
     """Process and store use case submission"""
     try:
         # 1. Validate the data
-        if not _validate_submission_data(submission_data):
+        submission = _validate_submission_data(submission_data)
+        if submission is None:
             return False
         
         # 2. Submit to Google Sheets
-        sheets_success = submit_use_case_to_sheets(submission_data)
+        sheets_success = submit_use_case_to_sheets(submission)
+        
+        if sheets_success:
+            stored_data = submission.model_dump()
+            record_submission(stored_data)
+            index_use_case(stored_data)
+            st.session_state.submitter_email = submission.submitter_email
         
         # 3. Log the action
         log_user_action("use_case_submitted", {
-            "title": submission_data.get('use_case_title'),
-            "department": submission_data.get('department'),
+            "title": submission.use_case_title,
+            "department": submission.department,
             "sheets_success": sheets_success
         })
         
@@ -392,140 +485,19 @@ def process_use_case_submission(submission_data: Dict) -> bool:
         log_user_action("use_case_submission_error", {"error": str(e)})
         return False
 
-def _validate_submission_data(data: Dict) -> bool:
-    """Validate submission data"""
-    required_fields = [
-        'submitter_name', 'submitter_email', 'department', 
-        'business_unit', 'use_case_title', 'problem_description', 
-        'proposed_solution'
-    ]
-    
-    for field in required_fields:
-        if not data.get(field) or data.get(field) == f"Select {field.replace('_', ' ').title()}":
-            st.error(f"Please fill in the {field.replace('_', ' ').title()} field")
-            return False
-    
-    # Email validation
-    email = data.get('submitter_email', '')
-    if '@' not in email or '.' not in email:
-        st.error("Please enter a valid email address")
-        return False
-    
-    return True
-
-def get_sample_use_cases() -> List[Dict]:
-    """Get sample use cases for demonstration"""
-    return [
-        {
-            "title": "Automated Steel Quality Grading",
-            "department": "Quality Control",
-            "status": "In Development",
-            "priority": "High",
-            "complexity": "Moderate AI/ML required",
-            "budget": "€50K - €100K",
-            "timeline": "Short-term (1-3 months)",
-            "problem": "Manual quality grading is time-consuming and inconsistent across different inspectors",
-            "solution": "Computer vision system to automatically grade steel products based on visual inspection",
-            "benefits": "50% reduction in inspection time, consistent quality standards, reduced human error"
-        },
-        {
-            "title": "Predictive Maintenance for Rolling Mills",
-            "department": "Production",
-            "status": "Completed",
-            "priority": "High",
-            "complexity": "Complex AI/ML required",
-            "budget": "€100K - €500K",
-            "timeline": "Medium-term (3-6 months)",
-            "problem": "Unexpected equipment failures cause costly downtime and production delays",
-            "solution": "ML model using sensor data to predict equipment failures 2-4 weeks in advance",
-            "benefits": "40% reduction in unplanned downtime, 25% maintenance cost savings, improved safety"
-        },
-        {
-            "title": "Demand Forecasting Optimization",
-            "department": "Supply Chain",
-            "status": "Under Review",
-            "priority": "Medium",
-            "complexity": "Moderate AI/ML required",
-            "budget": "€10K - €50K",
-            "timeline": "Short-term (1-3 months)",
-            "problem": "Current forecasting methods are inaccurate, leading to overstock or stockouts",
-            "solution": "Advanced ML model incorporating market trends, seasonality, and external factors",
-            "benefits": "15% improvement in forecast accuracy, 20% reduction in inventory costs"
-        },
-        {
-            "title": "Automated Invoice Processing",
-            "department": "Finance",
-            "status": "Completed",
-            "priority": "Medium",
-            "complexity": "Simple automation",
-            "budget": "< €10K",
-            "timeline": "ASAP (1-2 weeks)",
-            "problem": "Manual processing of invoices is slow and error-prone",
-            "solution": "OCR and NLP to automatically extract and validate invoice data",
-            "benefits": "80% reduction in processing time, 95% accuracy improvement"
-        },
-        {
-            "title": "Customer Behavior Analytics",
-            "department": "Sales & Marketing",
-            "status": "On Hold",
-            "priority": "Low",
-            "complexity": "Complex AI/ML required",
-            "budget": "€50K - €100K",
-            "timeline": "Long-term (6+ months)",
-            "problem": "Limited insights into customer preferences and buying patterns",
-            "solution": "ML model to analyze customer data and predict buying behavior",
-            "benefits": "Improved customer targeting, increased sales conversion, better product recommendations"
-        },
-        {
-            "title": "Energy Consumption Optimization",
-            "department": "Production",
-            "status": "In Development",
-            "priority": "High",
-            "complexity": "Moderate AI/ML required",
-            "budget": "€100K - €500K",
-            "timeline": "Medium-term (3-6 months)",
-            "problem": "High energy costs and carbon footprint from inefficient energy usage",
-            "solution": "AI system to optimize energy consumption based on production schedules and grid prices",
-            "benefits": "15% reduction in energy costs, 20% carbon footprint reduction"
-        }
-    ]
-
-def apply_filters(ideas: List[Dict], department: str, status: str, complexity: str) -> List[Dict]:
-    """Apply filters to the ideas list"""
-    filtered = ideas
-    
-    if department != "All Departments":
-        filtered = [idea for idea in filtered if idea['department'] == department]
-    
-    if status != "All Statuses":
-        filtered = [idea for idea in filtered if idea['status'] == status]
+def _validate_submission_data(data: Dict) -> Optional[UseCaseSubmission]:
+    """Validate submission data against the submission schema"""
+    submission, errors = validate_submission(data)
     
-    if complexity != "All Complexities":
-        filtered = [idea for idea in filtered if idea['complexity'] == complexity]
+    if errors:
+        st.error(errors[0])
+        return None
     
-    return filtered
+    return submission
 
-def get_user_submissions() -> List[Dict]:
-    """Get user's submissions (mock data)"""
-    # In a real implementation, this would fetch from database based on user ID
-    return [
-        {
-            "id": "1",
-            "title": "Automated Report Generation",
-            "department": "Finance",
-            "status": "Under Review",
-            "date": "2024-01-15",
-            "priority": "Medium"
-        },
-        {
-            "id": "2",
-            "title": "Customer Sentiment Analysis",
-            "department": "Sales & Marketing",
-            "status": "Approved",
-            "date": "2024-01-10",
-            "priority": "High"
-        }
-    ]
+def get_user_submissions(email: str, page: int = 1) -> List[Dict]:
+    """Get one page of the user's submissions from the local submissions store"""
+    return get_submissions_for_user(email, page, SUBMISSIONS_PAGE_SIZE)
 
 def show_submission_details(submission: Dict):
     """Show detailed view of a submission"""
@@ -0,0 +1,76 @@
+"""
+Agent Catalog
+Agent lists partitioned by status and their card markup, rebuilt once per agents.yaml version
+"""
+
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+from src.utils.config_loader import get_agents_config, get_config_version
+from src.utils.css_loader import get_agent_card_css
+from src.utils.profiler import record_cache
+
+DEVELOPMENT_STATUSES = ("Coming Soon", "In Development")
+
+# Stands in for the uptime in cached cards; replaced with the live figure at render time
+UPTIME_SLOT = "<!--uptime-->"
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """Everything the Agent Studio renders from one agents.yaml version"""
+    version: int
+    active: Tuple[Mapping[str, Any], ...]
+    development: Tuple[Mapping[str, Any], ...]
+    demo: Tuple[Mapping[str, Any], ...]
+    cards: Mapping[str, str]
+
+class AgentCatalog:
+    """Serves the current snapshot; a config reload bumps the version and the next read rebuilds it"""
+
+    def __init__(self):
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._lock = threading.Lock()
+
+    def _build(self, version: int) -> CatalogSnapshot:
+        config = get_agents_config()
+        live_agents = config.get("live_agents", ())
+        active = tuple(agent for agent in live_agents if agent.get('status') == 'Active')
+        development = tuple(agent for agent in live_agents if agent.get('status') in DEVELOPMENT_STATUSES)
+        cards = {agent['id']: get_agent_card_css({**agent, 'uptime': UPTIME_SLOT}) for agent in active + development}
+        return CatalogSnapshot(version, active, development, config.get("demo_agents", ()), MappingProxyType(cards))
+
+    def get_snapshot(self) -> CatalogSnapshot:
+        """Current partitions and card markup"""
+        get_agents_config()  # Make sure the config is loaded so the version is meaningful
+        version = get_config_version("agents.yaml")
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            record_cache("agent_catalog", True)
+            return snapshot
+
+        record_cache("agent_catalog", False)
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != version:
+                self._snapshot = self._build(version)
+            return self._snapshot
+
+    def render_card(self, agent: Mapping[str, Any], uptime: str) -> str:
+        """Cached card markup for an agent with its current uptime filled in"""
+        card = self.get_snapshot().cards.get(agent['id'])
+        if card is None:
+            return get_agent_card_css({**agent, 'uptime': uptime})
+        return card.replace(UPTIME_SLOT, uptime)
+
+# Global instance
+agent_catalog = AgentCatalog()
+
+# Convenience functions
+def get_agent_catalog() -> CatalogSnapshot:
+    """Partitioned agent lists and card markup for the current agents.yaml"""
+    return agent_catalog.get_snapshot()
+
+def get_agent_card_html(agent: Mapping[str, Any], uptime: str) -> str:
+    """Card markup for an agent with its live uptime"""
+    return agent_catalog.render_card(agent, uptime)
@@ -0,0 +1,379 @@
+"""
+Agent Gateway
+Sends queries to the configured agents through one pooled async HTTP client per provider
+"""
+
+import asyncio
+import atexit
+import json
+import queue
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, Mapping, Optional, Set, Tuple
+
+import httpx
+
+from src.config.settings import get_agent_config
+from src.services.response_cache import parse_cost, response_cache
+from src.services.usage_service import estimate_tokens, record_agent_usage
+from src.utils.async_runner import submit
+from src.utils.config_loader import get_agents_config, get_config_version
+
+RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+STREAM_BUFFER_CHUNKS = 64  # Chunks read ahead of a slow consumer before the download pauses
+
+@dataclass
+class AgentResponse:
+    """Result of an agent query"""
+    agent_id: str
+    text: str
+    success: bool
+    latency: float
+    attempts: int
+    error: Optional[str] = None
+    cached: bool = False
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+class AgentGatewayError(Exception):
+    """Raised when an agent cannot be reached after all retries"""
+
+class ProviderAdapter:
+    """Generic JSON endpoint: {"query": ...} in, {"response": ...} out"""
+
+    def build_request(self, agent: Mapping[str, Any], query: str, stream: bool) -> Tuple[Dict, Dict]:
+        return {}, {"query": query, "model": agent.get('model'), "stream": stream}
+
+    def parse_response(self, data: Dict) -> str:
+        return str(data.get("response") or data.get("text") or "")
+
+    def parse_stream_event(self, data: Dict) -> Optional[str]:
+        return data.get("delta") or data.get("text")
+
+    def parse_usage(self, data: Dict) -> Optional[Tuple[int, int]]:
+        """(input, output) token counts reported by the provider, if any"""
+        usage = data.get("usage") or {}
+        if "input_tokens" in usage:
+            return int(usage["input_tokens"]), int(usage.get("output_tokens", 0))
+        return None
+
+class OpenAIAdapter(ProviderAdapter):
+    """OpenAI chat completions style"""
+
+    def build_request(self, agent, query, stream):
+        headers = {}
+        api_key = get_agent_config().openai_api_key
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+        return headers, {"model": agent.get('model'), "messages": [{"role": "user", "content": query}], "stream": stream}
+
+    def parse_response(self, data):
+        return data["choices"][0]["message"]["content"]
+
+    def parse_stream_event(self, data):
+        choices = data.get("choices") or [{}]
+        return choices[0].get("delta", {}).get("content")
+
+    def parse_usage(self, data):
+        usage = data.get("usage") or {}
+        if "prompt_tokens" in usage:
+            return int(usage["prompt_tokens"]), int(usage.get("completion_tokens", 0))
+        return None
+
+class AnthropicAdapter(ProviderAdapter):
+    """Anthropic messages style"""
+
+    def build_request(self, agent, query, stream):
+        headers = {"anthropic-version": "2023-06-01"}
+        api_key = get_agent_config().anthropic_api_key
+        if api_key:
+            headers["x-api-key"] = api_key
+        return headers, {
+            "model": agent.get('model'),
+            "max_tokens": agent.get('max_tokens', 1024),
+            "messages": [{"role": "user", "content": query}],
+            "stream": stream
+        }
+
+    def parse_response(self, data):
+        return "".join(block.get("text", "") for block in data.get("content", []))
+
+    def parse_stream_event(self, data):
+        if data.get("type") == "content_block_delta":
+            return data.get("delta", {}).get("text")
+        return None
+
+class VertexAdapter(ProviderAdapter):
+    """Vertex AI / Gemini generateContent style"""
+
+    def build_request(self, agent, query, stream):
+        headers = {}
+        api_key = get_agent_config().google_api_key
+        if api_key:
+            headers["x-goog-api-key"] = api_key
+        return headers, {"contents": [{"role": "user", "parts": [{"text": query}]}]}
+
+    def _candidate_text(self, data: Dict) -> str:
+        candidates = data.get("candidates") or [{}]
+        parts = candidates[0].get("content", {}).get("parts", [])
+        return "".join(part.get("text", "") for part in parts)
+
+    def parse_response(self, data):
+        return self._candidate_text(data)
+
+    def parse_stream_event(self, data):
+        return self._candidate_text(data) or None
+
+    def parse_usage(self, data):
+        usage = data.get("usageMetadata") or {}
+        if "promptTokenCount" in usage:
+            return int(usage["promptTokenCount"]), int(usage.get("candidatesTokenCount", 0))
+        return None
+
+PROVIDER_ADAPTERS = {
+    "OpenAI": OpenAIAdapter(),
+    "Anthropic": AnthropicAdapter(),
+    "Vertex AI": VertexAdapter(),
+}
+
+class AgentGateway:
+    """
+    Runs on the shared background event loop and keeps one httpx.AsyncClient and one
+    semaphore per (provider, concurrency limit), so connections are pooled and agents only
+    share a cap with agents configured for the same limit. Timeout, retry and concurrency
+    limits come from the agent or integration_settings in agents.yaml, falling back to
+    AgentSettings.agent_timeout. Pools no agent uses after a config reload are closed once idle.
+    """
+
+    def __init__(self):
+        self._clients: Dict[Tuple[str, int], httpx.AsyncClient] = {}
+        self._semaphores: Dict[Tuple[str, int], asyncio.Semaphore] = {}
+        self._config_version: Optional[int] = None
+        self._retiring: Set[asyncio.Task] = set()
+
+    def _get_settings(self, agent: Mapping[str, Any]) -> Dict[str, Any]:
+        """Effective timeout, retries and concurrency for an agent"""
+        integration = get_agents_config().get("integration_settings", {})
+        return {
+            "timeout": agent.get('timeout') or integration.get("timeout") or get_agent_config().agent_timeout,
+            "retry_attempts": max(1, int(integration.get("retry_attempts", 1))),
+            "max_concurrent_requests": max(1, int(
+                agent.get('max_concurrent_requests') or integration.get("max_concurrent_requests", 8)
+            ))
+        }
+
+    def _get_client(self, provider: str, settings: Dict[str, Any]) -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        """
+        Pooled client and concurrency limiter for a provider and limit (called on the loop thread)
+        Timeouts are per agent, so they are passed with each request rather than set on the shared client.
+        """
+        version = get_config_version("agents.yaml")
+        if version != self._config_version:
+            self._config_version = version
+            self._retire_unused_pools()
+
+        key = (provider, settings["max_concurrent_requests"])
+        client = self._clients.get(key)
+        if client is None:
+            limit = key[1]
+            client = self._clients[key] = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit)
+            )
+            self._semaphores[key] = asyncio.Semaphore(limit)
+        return client, self._semaphores[key]
+
+    def _retire_unused_pools(self):
+        """Close pools whose (provider, limit) no configured agent uses any more, after their requests finish"""
+        config = get_agents_config()
+        in_use = {
+            (agent.get('provider', 'Unknown'), self._get_settings(agent)["max_concurrent_requests"])
+            for agent in config.get("live_agents", ()) + config.get("demo_agents", ())
+        }
+        for key in [key for key in self._clients if key not in in_use]:
+            client, semaphore = self._clients.pop(key), self._semaphores.pop(key)
+            task = asyncio.get_running_loop().create_task(self._close_when_idle(client, semaphore, key[1]))
+            self._retiring.add(task)
+            task.add_done_callback(self._retiring.discard)
+
+    @staticmethod
+    async def _close_when_idle(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, limit: int):
+        """Take every slot (waiting out in-flight requests), then close the client"""
+        for _ in range(limit):
+            await semaphore.acquire()
+        await client.aclose()
+
+    def _prepare(self, agent: Mapping[str, Any], query: str, stream: bool):
+        if not agent.get('url'):
+            raise AgentGatewayError(f"No URL configured for {agent.get('name', agent.get('id'))}")
+        provider = agent.get('provider', 'Unknown')
+        adapter = PROVIDER_ADAPTERS.get(provider, ProviderAdapter())
+        headers, payload = adapter.build_request(agent, query, stream)
+        return provider, adapter, headers, payload
+
+    async def _query(self, agent: Mapping[str, Any], query: str) -> AgentResponse:
+        settings = self._get_settings(agent)
+        provider, adapter, headers, payload = self._prepare(agent, query, stream=False)
+        client, semaphore = self._get_client(provider, settings)
+        start = time.perf_counter()
+        error = None
+
+        for attempt in range(1, settings["retry_attempts"] + 1):
+            try:
+                async with semaphore:
+                    response = await client.post(agent['url'], json=payload, headers=headers, timeout=settings["timeout"])
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    error = f"HTTP {response.status_code}"
+                else:
+                    response.raise_for_status()
+                    data = response.json()
+                    text = adapter.parse_response(data)
+                    input_tokens, output_tokens = adapter.parse_usage(data) or (estimate_tokens(query), estimate_tokens(text))
+                    return AgentResponse(
+                        agent_id=agent['id'], text=text, success=True, latency=time.perf_counter() - start,
+                        attempts=attempt, input_tokens=input_tokens, output_tokens=output_tokens
+                    )
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                error = f"{type(e).__name__}: {e}"
+            except (httpx.HTTPStatusError, ValueError, KeyError, IndexError) as e:
+                # Client errors and malformed responses are not retried
+                return AgentResponse(agent['id'], "", False, time.perf_counter() - start, attempt, str(e))
+
+            if attempt < settings["retry_attempts"]:
+                await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+
+        return AgentResponse(agent['id'], "", False, time.perf_counter() - start, settings["retry_attempts"], error)
+
+    async def _stream(self, agent: Mapping[str, Any], query: str) -> AsyncIterator[str]:
+        """Yield text chunks from a server-sent events response; retries only before the first chunk"""
+        settings = self._get_settings(agent)
+        provider, adapter, headers, payload = self._prepare(agent, query, stream=True)
+        client, semaphore = self._get_client(provider, settings)
+        url = agent['url'] + ("?alt=sse" if isinstance(adapter, VertexAdapter) else "")
+        error = None
+
+        for attempt in range(1, settings["retry_attempts"] + 1):
+            emitted = False
+            try:
+                async with semaphore, client.stream("POST", url, json=payload, headers=headers, timeout=settings["timeout"]) as response:
+                    if response.status_code in RETRYABLE_STATUS_CODES:
+                        error = f"HTTP {response.status_code}"
+                    else:
+                        response.raise_for_status()
+                        async for line in response.aiter_lines():
+                            if not line.startswith("data:"):
+                                continue
+                            data = line[5:].strip()
+                            if data == "[DONE]":
+                                break
+                            chunk = adapter.parse_stream_event(json.loads(data))
+                            if chunk:
+                                emitted = True
+                                yield chunk
+                        return
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                if emitted:
+                    raise AgentGatewayError(f"Stream interrupted: {e}") from e
+                error = f"{type(e).__name__}: {e}"
+            except httpx.HTTPStatusError as e:
+                raise AgentGatewayError(str(e)) from e
+
+            if attempt < settings["retry_attempts"]:
+                await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+
+        raise AgentGatewayError(f"{agent.get('name', agent['id'])} unavailable after {settings['retry_attempts']} attempts ({error})")
+
+    def _record_usage(self, agent: Mapping[str, Any], response: AgentResponse):
+        """Append a call to the usage ledger; only answered, uncached calls are charged"""
+        status = "cached" if response.cached else "success" if response.success else "error"
+        cost = parse_cost(agent.get('cost_per_query')) if status == "success" else 0.0
+        record_agent_usage(agent['id'], status, response.latency, response.input_tokens, response.output_tokens, cost)
+
+    def query(self, agent: Mapping[str, Any], query: str) -> AgentResponse:
+        """Send a query and wait for the complete response; repeated questions come from the response cache"""
+        cached = response_cache.get(agent['id'], query)
+        if cached is not None:
+            response = AgentResponse(agent['id'], cached.text, True, 0.0, 0, cached=True)
+        else:
+            response = submit(self._query(agent, query)).result()
+            if response.success:
+                response_cache.put(agent['id'], query, response.text)
+        self._record_usage(agent, response)
+        return response
+
+    def stream(self, agent: Mapping[str, Any], query: str) -> Iterator[str]:
+        """Send a query and yield response text as it arrives (usable with st.write_stream)"""
+        cached = response_cache.get(agent['id'], query)
+        if cached is not None:
+            self._record_usage(agent, AgentResponse(agent['id'], cached.text, True, 0.0, 0, cached=True))
+            yield cached.text
+            return
+
+        chunks: queue.Queue = queue.Queue(maxsize=STREAM_BUFFER_CHUNKS)
+        done = object()
+
+        async def put(item):
+            # Never block the loop thread; wait (cancellably) while the consumer catches up
+            while True:
+                try:
+                    return chunks.put_nowait(item)
+                except queue.Full:
+                    await asyncio.sleep(0.01)
+
+        async def produce():
+            try:
+                async for chunk in self._stream(agent, query):
+                    await put(chunk)
+                await put(done)
+            except Exception as e:
+                await put(e)
+
+        start = time.perf_counter()
+        future = submit(produce())
+        received = []
+        try:
+            while True:
+                item = chunks.get()
+                if item is done:
+                    # Only complete answers are cached
+                    text = "".join(received)
+                    response_cache.put(agent['id'], query, text)
+                    self._record_usage(agent, AgentResponse(
+                        agent['id'], text, True, time.perf_counter() - start, 1,
+                        input_tokens=estimate_tokens(query), output_tokens=estimate_tokens(text)
+                    ))
+                    return
+                if isinstance(item, Exception):
+                    self._record_usage(agent, AgentResponse(agent['id'], "", False, time.perf_counter() - start, 1, str(item)))
+                    raise item if isinstance(item, AgentGatewayError) else AgentGatewayError(str(item))
+                received.append(item)
+                yield item
+        finally:
+            # Stops the download and frees the semaphore slot and connection when the consumer
+            # goes away early (rerun, navigation, closed generator); a no-op once finished
+            future.cancel()
+
+    def close(self):
+        """Close all provider clients"""
+        if not self._clients:
+            return
+        clients, self._clients = list(self._clients.values()), {}
+        self._semaphores = {}
+
+        async def close_all():
+            for client in clients:
+                await client.aclose()
+
+        submit(close_all()).result()
+
+# Global instance
+agent_gateway = AgentGateway()
+atexit.register(agent_gateway.close)
+
+# Convenience functions
+def query_agent(agent: Mapping[str, Any], query: str) -> AgentResponse:
+    """Query an agent and wait for the full response"""
+    return agent_gateway.query(agent, query)
+
+def stream_agent_query(agent: Mapping[str, Any], query: str) -> Iterator[str]:
+    """Query an agent and stream the response text"""
+    return agent_gateway.stream(agent, query)
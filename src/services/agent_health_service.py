@@ -0,0 +1,143 @@
+"""
+Agent Health Service
+Background prober that tracks availability and response time of the live agents
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import requests
+
+from src.config.settings import get_agent_config
+from src.utils.config_loader import get_live_agents
+
+class AgentHealthMonitor:
+    """
+    Probe every live agent URL on an interval and keep a bounded window of samples per agent
+    Renders only read the in-memory samples; all network calls happen on the prober thread.
+    """
+
+    def __init__(self, interval: Optional[int] = None, window: int = 1440):
+        self._interval = interval
+        self.window = window  # Samples kept per agent (24h at the default 60s interval)
+        # agent_id -> deque of (unix timestamp, available, latency in seconds)
+        self._samples: Dict[str, deque] = {}
+        self._last_error: Dict[str, str] = {}
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._session = requests.Session()
+
+    @property
+    def interval(self) -> int:
+        """Seconds between probe rounds"""
+        if self._interval is None:
+            self._interval = get_agent_config().agent_health_interval
+        return self._interval
+
+    def start(self):
+        """Start the background prober if it is not running yet"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="agent-health-monitor", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        """Probe loop; sleeps for the interval unless woken early"""
+        while True:
+            try:
+                self.probe_all()
+            except Exception as e:
+                print(f"Warning: Agent health probe round failed: {e}")
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def probe_all(self):
+        """Probe every live agent with a URL concurrently"""
+        agents = [agent for agent in get_live_agents() if agent.get('url')]
+        if not agents:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(agents))) as executor:
+            list(executor.map(self.probe, agents))
+
+    def probe(self, agent: Dict) -> bool:
+        """Probe one agent and record the sample; any response below 500 counts as available"""
+        timeout = get_agent_config().agent_timeout
+        start = time.perf_counter()
+        try:
+            response = self._session.head(agent['url'], allow_redirects=True, timeout=timeout)
+            available = response.status_code < 500
+            if not available:
+                self._last_error[agent['id']] = f"HTTP {response.status_code}"
+        except requests.RequestException as e:
+            available = False
+            self._last_error[agent['id']] = type(e).__name__
+        latency = time.perf_counter() - start
+
+        samples = self._samples.get(agent['id'])
+        if samples is None:
+            samples = self._samples.setdefault(agent['id'], deque(maxlen=self.window))
+        samples.append((time.time(), available, latency))
+        return available
+
+    def get_health(self, agent_id: str) -> Dict:
+        """Rolling uptime and p50/p95 response time from the samples in memory"""
+        self.start()
+        samples = list(self._samples.get(agent_id, ()))
+        if not samples:
+            return {"samples": 0, "uptime": None, "p50": None, "p95": None, "last_checked": None, "available": None, "last_error": None}
+
+        timestamps, available, latencies = (np.array(column) for column in zip(*samples))
+        up_latencies = latencies[available]
+
+        return {
+            "samples": len(samples),
+            "uptime": float(available.mean() * 100),
+            "p50": float(np.percentile(up_latencies, 50)) if up_latencies.size else None,
+            "p95": float(np.percentile(up_latencies, 95)) if up_latencies.size else None,
+            "last_checked": datetime.fromtimestamp(timestamps[-1]).isoformat(timespec='seconds'),
+            "available": bool(available[-1]),
+            "last_error": None if available[-1] else self._last_error.get(agent_id)
+        }
+
+    def get_history(self, agent_id: str) -> List[Dict]:
+        """Samples for charting, oldest first"""
+        self.start()
+        return [
+            {"time": datetime.fromtimestamp(timestamp), "available": available, "latency_ms": latency * 1000}
+            for timestamp, available, latency in list(self._samples.get(agent_id, ()))
+        ]
+
+    def request_probe(self):
+        """Ask the background prober to run ahead of schedule"""
+        self.start()
+        self._wake.set()
+
+# Global instance
+agent_health_monitor = AgentHealthMonitor()
+
+# Convenience functions
+def get_agent_health(agent_id: str) -> Dict:
+    """Get the latest rolling health figures for an agent"""
+    return agent_health_monitor.get_health(agent_id)
+
+def get_agent_health_history(agent_id: str) -> List[Dict]:
+    """Get the probe samples recorded for an agent"""
+    return agent_health_monitor.get_history(agent_id)
+
+def format_uptime(health: Dict) -> str:
+    """Uptime for display, or a placeholder before the first probe"""
+    return f"{health['uptime']:.1f}%" if health["uptime"] is not None else ("Pending" if not health["samples"] else "N/A")
+
+def format_response_time(health: Dict, key: str = "p50") -> str:
+    """Response time percentile for display"""
+    value = health.get(key)
+    if value is None:
+        return "Pending" if not health["samples"] else "N/A"
+    return f"{value * 1000:.0f} ms" if value < 1 else f"{value:.1f}s"
@@ -0,0 +1,172 @@
+"""
+Analytics Service
+Bounded, batched pipeline that ships user action events out of the process
+"""
+
+import atexit
+import json
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from src.config.settings import get_analytics_config
+from src.services.analytics_store import analytics_store
+
+class JsonlSink:
+    """Append event batches to daily JSONL files"""
+
+    def __init__(self, data_dir: str = "static/data/analytics"):
+        # Get the absolute path relative to the project root
+        project_root = Path(__file__).parent.parent.parent
+        self.data_dir = project_root / data_dir
+
+    def __call__(self, batch: List[Dict]):
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        path = self.data_dir / f"events-{datetime.now(timezone.utc).strftime('%Y-%m-%d')}.jsonl"
+        with open(path, 'a', encoding='utf-8') as file:
+            file.write("".join(json.dumps(event, default=str) + "\n" for event in batch))
+
+class HttpSink:
+    """POST event batches to the configured analytics endpoint"""
+
+    def __init__(self, endpoint: str, timeout: int = 10):
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self._session = requests.Session()
+
+    def __call__(self, batch: List[Dict]):
+        response = self._session.post(self.endpoint, json={"events": batch}, timeout=self.timeout)
+        response.raise_for_status()
+
+class AnalyticsPipeline:
+    """
+    Process-wide event buffer drained in batches by a background flusher
+    Enqueue is a length check plus deque.append, both atomic under the GIL, so the
+    hot path takes no lock. When the buffer is full new events are dropped and counted.
+    """
+
+    def __init__(self, capacity: int = 10000, batch_size: int = 500, flush_interval: float = 5.0):
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer = deque()
+        self._sinks: Optional[List[Callable[[List[Dict]], None]]] = None
+        self._enabled: Optional[bool] = None
+        self._wake = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread = None
+
+        # Counters are best-effort (unsynchronized increments)
+        self.enqueued = 0
+        self.dropped = 0
+        self.flushed = 0
+        self.failed_batches = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether analytics collection is enabled in settings"""
+        if self._enabled is None:
+            self._enabled = get_analytics_config().enable_analytics
+        return self._enabled
+
+    def set_sinks(self, sinks: List[Callable[[List[Dict]], None]]):
+        """Replace the default destinations (e.g. to keep test runs out of the real stores)"""
+        self._sinks = list(sinks)
+
+    def add_sink(self, sink: Callable[[List[Dict]], None]):
+        """Register an extra destination for flushed batches"""
+        self._get_sinks().append(sink)
+
+    def _get_sinks(self) -> List[Callable[[List[Dict]], None]]:
+        """Local JSONL files and dashboard rollups always, plus the HTTP endpoint when configured"""
+        if self._sinks is None:
+            sinks = [JsonlSink(), analytics_store]
+            endpoint = get_analytics_config().analytics_endpoint
+            if endpoint:
+                sinks.append(HttpSink(endpoint))
+            self._sinks = sinks
+        return self._sinks
+
+    def enqueue(self, event: Dict) -> bool:
+        """Buffer an event; returns False if analytics is disabled or the buffer is full"""
+        if not self.enabled:
+            return False
+
+        if len(self._buffer) >= self.capacity:
+            self.dropped += 1
+            return False
+
+        self._buffer.append(event)
+        self.enqueued += 1
+
+        if self._thread is None:
+            self._start()
+        if len(self._buffer) >= self.batch_size:
+            self._wake.set()
+
+        return True
+
+    def _start(self):
+        """Start the background flusher once"""
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="analytics-flusher", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self):
+        """Flush on every interval, or early when a full batch is waiting"""
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        """Drain the buffer to every sink in batches; returns the number of events flushed"""
+        flushed = 0
+
+        with self._flush_lock:
+            while self._buffer:
+                batch = []
+                while self._buffer and len(batch) < self.batch_size:
+                    batch.append(self._buffer.popleft())
+
+                for sink in self._get_sinks():
+                    try:
+                        sink(batch)
+                    except Exception as e:
+                        self.failed_batches += 1
+                        print(f"Warning: Analytics sink {type(sink).__name__} failed: {e}")
+
+                flushed += len(batch)
+
+            self.flushed += flushed
+
+        return flushed
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get pipeline counters"""
+        return {
+            "buffered": len(self._buffer),
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "flushed": self.flushed,
+            "failed_batches": self.failed_batches
+        }
+
+# Global instance
+analytics_pipeline = AnalyticsPipeline()
+
+# Convenience functions
+def track_event(event: Dict) -> bool:
+    """Queue an analytics event"""
+    return analytics_pipeline.enqueue(event)
+
+def get_analytics_stats() -> Dict[str, int]:
+    """Get analytics pipeline counters"""
+    return analytics_pipeline.get_stats()
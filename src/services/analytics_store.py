@@ -0,0 +1,177 @@
+"""
+Analytics Store
+Pre-aggregated hourly and daily rollups of analytics events in SQLite
+"""
+
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+GRANULARITIES = ("hour", "day")
+
+NEWS_ERROR_ACTIONS = {"rss_source_error", "rss_parse_warning", "all_rss_sources_failed", "arxiv_fetch_error"}
+
+METRICS = {
+    "page_views": "Page Views",
+    "demo_interactions": "Demo Interactions",
+    "news_source_errors": "News Source Errors",
+    "submissions": "Use Case Submissions",
+    "events": "All Events"
+}
+
+def classify_event(event: Dict) -> List[Tuple[str, str]]:
+    """Map an event to the (metric, dimension) pairs it counts towards"""
+    action = event.get("action", "unknown")
+    details = event.get("details") or {}
+    metrics = [("events", action)]
+
+    if action == "page_navigation":
+        metrics.append(("page_views", str(details.get("page", "Unknown"))))
+    elif action == "demo_interaction":
+        metrics.append(("demo_interactions", str(details.get("demo", "Unknown"))))
+    elif action in NEWS_ERROR_ACTIONS:
+        metrics.append(("news_source_errors", str(details.get("source", action))))
+    elif action == "use_case_submitted" and details.get("sheets_success"):
+        metrics.append(("submissions", str(details.get("department", "Unknown"))))
+
+    return metrics
+
+def bucket_start(timestamp: str, granularity: str) -> str:
+    """Truncate an ISO timestamp to its hour ('YYYY-MM-DDTHH:00') or day ('YYYY-MM-DD') bucket"""
+    return f"{timestamp[:13]}:00" if granularity == "hour" else timestamp[:10]
+
+class AnalyticsStore:
+    """Rollup tables fed by the analytics pipeline; queries never touch raw events"""
+
+    def __init__(self, db_path: str = "static/data/analytics/rollups.db"):
+        # Get the absolute path relative to the project root
+        project_root = Path(__file__).parent.parent.parent
+        self.db_path = project_root / db_path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Open the database lazily and make sure the schema exists"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS event_rollups (
+                    granularity TEXT NOT NULL,
+                    bucket TEXT NOT NULL,
+                    metric TEXT NOT NULL,
+                    dimension TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (granularity, metric, bucket, dimension)
+                );
+                CREATE TABLE IF NOT EXISTS session_rollups (
+                    granularity TEXT NOT NULL,
+                    bucket TEXT NOT NULL,
+                    session_id TEXT NOT NULL,
+                    PRIMARY KEY (granularity, bucket, session_id)
+                );
+            """)
+            self._conn = conn
+        return self._conn
+
+    def __call__(self, batch: List[Dict]):
+        """Pipeline sink: fold a batch of events into the rollups"""
+        self.ingest(batch)
+
+    def ingest(self, batch: List[Dict]):
+        """Aggregate a batch in memory, then upsert one row per (bucket, metric, dimension)"""
+        counts = Counter()
+        sessions = set()
+
+        for event in batch:
+            timestamp = event.get("timestamp") or datetime.now(timezone.utc).isoformat()
+            metrics = classify_event(event)
+            for granularity in GRANULARITIES:
+                bucket = bucket_start(timestamp, granularity)
+                for metric, dimension in metrics:
+                    counts[(granularity, bucket, metric, dimension)] += 1
+                if event.get("session_id"):
+                    sessions.add((granularity, bucket, event["session_id"]))
+
+        with self._lock:
+            conn = self._get_connection()
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO event_rollups (granularity, bucket, metric, dimension, count)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (granularity, metric, bucket, dimension)
+                    DO UPDATE SET count = count + excluded.count
+                    """,
+                    [key + (count,) for key, count in counts.items()]
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO session_rollups (granularity, bucket, session_id) VALUES (?, ?, ?)",
+                    list(sessions)
+                )
+
+    def _read(self, query: str, params: Tuple) -> List[Tuple]:
+        """Run a dashboard query; an unavailable rollup database reads as empty rather than failing the page"""
+        try:
+            with self._lock:
+                return self._get_connection().execute(query, params).fetchall()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: Could not read analytics rollups: {e}")
+            return []
+
+    def get_series(self, metric: str, granularity: str, start: str, end: Optional[str] = None) -> List[Tuple[str, int]]:
+        """Get (bucket, count) pairs for a metric, summed over dimensions"""
+        return self._read(
+            """
+            SELECT bucket, SUM(count) FROM event_rollups
+            WHERE granularity = ? AND metric = ? AND bucket >= ? AND bucket <= ?
+            GROUP BY bucket ORDER BY bucket
+            """,
+            (granularity, metric, start, end or "9999")
+        )
+
+    def get_breakdown(self, metric: str, granularity: str, start: str, end: Optional[str] = None, limit: int = 20) -> List[Tuple[str, int]]:
+        """Get (dimension, count) totals for a metric, largest first"""
+        return self._read(
+            """
+            SELECT dimension, SUM(count) AS total FROM event_rollups
+            WHERE granularity = ? AND metric = ? AND bucket >= ? AND bucket <= ?
+            GROUP BY dimension ORDER BY total DESC LIMIT ?
+            """,
+            (granularity, metric, start, end or "9999", limit)
+        )
+
+    def get_totals(self, granularity: str, start: str, end: Optional[str] = None) -> Dict[str, int]:
+        """Get the total count of every metric in a time range"""
+        rows = self._read(
+            """
+            SELECT metric, SUM(count) FROM event_rollups
+            WHERE granularity = ? AND bucket >= ? AND bucket <= ?
+            GROUP BY metric
+            """,
+            (granularity, start, end or "9999")
+        )
+        return {metric: 0 for metric in METRICS} | dict(rows)
+
+    def get_active_sessions(self, granularity: str, start: str, end: Optional[str] = None) -> int:
+        """Count distinct sessions in a time range"""
+        rows = self._read(
+            """
+            SELECT COUNT(DISTINCT session_id) FROM session_rollups
+            WHERE granularity = ? AND bucket >= ? AND bucket <= ?
+            """,
+            (granularity, start, end or "9999")
+        )
+        return rows[0][0] if rows else 0
+
+def range_start(days: int, granularity: str) -> str:
+    """Bucket key for the start of a range ending now"""
+    start = datetime.now(timezone.utc) - timedelta(days=days)
+    return bucket_start(start.isoformat(), granularity)
+
+# Global instance
+analytics_store = AnalyticsStore()
@@ -0,0 +1,123 @@
+"""
+Document Cache
+Disk cache of document extraction results keyed by the upload's content hash
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional
+
+from src.config.settings import get_agent_config
+
+# Bump when extraction output changes so stale results are not served
+CACHE_FORMAT = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def hash_upload(upload: BinaryIO) -> str:
+    """SHA-256 of an upload's content, read in chunks"""
+    digest = hashlib.sha256()
+    upload.seek(0)
+    for chunk in iter(lambda: upload.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    upload.seek(0)
+    return digest.hexdigest()
+
+class DocumentCache:
+    """
+    One pickle per content hash under the cache directory, shared by all sessions and restarts
+    The file mtime doubles as the LRU clock: hits touch it, and writes evict the least
+    recently used files until the directory fits the size cap.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @property
+    def cache_dir(self) -> Path:
+        """Cache directory, relative to the project root unless absolute"""
+        if self._cache_dir is None:
+            self._cache_dir = get_agent_config().document_cache_dir
+        return Path(__file__).parent.parent.parent / self._cache_dir
+
+    @property
+    def max_bytes(self) -> int:
+        """Size cap for the whole cache directory; 0 disables caching"""
+        if self._max_bytes is None:
+            self._max_bytes = get_agent_config().document_cache_max_mb * 1024 * 1024
+        return self._max_bytes
+
+    def _path(self, content_hash: str) -> Path:
+        return self.cache_dir / f"{content_hash}.v{CACHE_FORMAT}.pickle"
+
+    def get(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Cached extraction result for a content hash, or None"""
+        path = self._path(content_hash)
+        try:
+            with open(path, "rb") as file:
+                result = pickle.load(file)
+            os.utime(path)
+        except FileNotFoundError:
+            self._stats["misses"] += 1
+            return None
+        except Exception as e:
+            print(f"Warning: Dropping unreadable document cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            self._stats["misses"] += 1
+            return None
+
+        self._stats["hits"] += 1
+        return result
+
+    def put(self, content_hash: str, result: Dict[str, Any]):
+        """Store an extraction result and evict old entries beyond the size cap"""
+        if self.max_bytes <= 0:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(content_hash)
+            temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_path, "wb") as file:
+                pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+            self._evict()
+        except Exception as e:
+            print(f"Warning: Could not write document cache entry: {e}")
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits max_bytes"""
+        with self._lock:
+            entries = []
+            for path in self.cache_dir.glob("*.pickle"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                self._stats["evictions"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit counts for this process and the current size on disk"""
+        files = list(self.cache_dir.glob("*.pickle")) if self.cache_dir.exists() else []
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            "entries": len(files),
+            "bytes": sum(path.stat().st_size for path in files if path.exists())
+        }
+
+# Global instance
+document_cache = DocumentCache()
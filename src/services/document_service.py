@@ -0,0 +1,440 @@
+"""
+Document Service
+Streaming text and table extraction for uploaded documents, run in a worker pool
+"""
+
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional
+
+from src.config.settings import get_agent_config
+from src.services.document_cache import document_cache, hash_upload
+
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+SPILL_CHUNK_SIZE = 1024 * 1024
+PAGE_CHARS = 4000          # Text per page for formats without real pages (txt, docx)
+SHEET_PAGE_ROWS = 500      # Spreadsheet rows per page
+PREVIEW_CHARS = 2000       # Text kept in memory per page; counts cover the full text
+PREVIEW_TABLE_ROWS = 50    # Table rows kept in memory per table
+MAX_JOBS = 32              # Finished jobs kept for display
+
+IMAGE_TYPES = {"png", "jpg", "jpeg"}
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+S_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+STANDARD_PATTERN = re.compile(r"\b(?:ASTM|ISO|EN|DIN|AISI|SAE|JIS|ASME)\s?[A-Z]?\d+(?:[-./:]\d+)*[A-Z]?\b")
+GRADE_PATTERN = re.compile(r"\b(?:1\.4\d{3}|S\d{3}(?:JR|J0|J2|N|NL|M|ML)?|[34]\d{2}(?:LN|Ti|L|H))\b")
+MEASUREMENT_PATTERN = re.compile(r"\b\d+(?:[.,]\d+)?\s?(?:MPa|N/mm²|N/mm2|mm|°C|HRC|HBW|HB|HV)(?!\w)")
+
+class DocumentError(Exception):
+    """Raised when a document cannot be read"""
+
+@dataclass
+class DocumentPage:
+    """One page (or page-sized chunk) of extracted content"""
+    number: int
+    label: str
+    text: str
+    chars: int
+    tables: List[List[List[str]]] = field(default_factory=list)
+
+@dataclass
+class DocumentAnalysis:
+    """Figures accumulated page by page as the document streams in"""
+    pages: int = 0
+    words: int = 0
+    chars: int = 0
+    tables: int = 0
+    standards: Counter = field(default_factory=Counter)
+    grades: Counter = field(default_factory=Counter)
+    measurements: Counter = field(default_factory=Counter)
+
+    def add_page(self, text: str, tables: List[List[List[str]]]):
+        """Fold one page's full text and tables into the totals"""
+        self.pages += 1
+        self.words += len(text.split())
+        self.chars += len(text)
+        self.tables += len(tables)
+        self.standards.update(" ".join(match.split()) for match in STANDARD_PATTERN.findall(text))
+        self.grades.update(GRADE_PATTERN.findall(text))
+        self.measurements.update(MEASUREMENT_PATTERN.findall(text))
+
+@dataclass
+class DocumentJob:
+    """An extraction running (or finished) in the worker pool"""
+    job_id: str
+    file_name: str
+    file_type: str
+    size: int
+    status: str = "queued"  # queued, running, done, failed, cancelled
+    pages: List[DocumentPage] = field(default_factory=list)
+    analysis: DocumentAnalysis = field(default_factory=DocumentAnalysis)
+    total_pages: Optional[int] = None
+    error: Optional[str] = None
+    content_hash: Optional[str] = None
+    from_cache: bool = False
+    submitted_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    _done: threading.Event = field(default_factory=threading.Event, repr=False)
+    _cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.time()) - self.submitted_at
+
+def file_extension(file_name: str) -> str:
+    """Lowercase extension without the dot"""
+    return Path(file_name).suffix.lower().lstrip(".")
+
+def spill_upload(upload: BinaryIO, suffix: str = "") -> Path:
+    """Copy an upload to a temporary file in fixed-size chunks so workers read from disk"""
+    upload.seek(0)
+    with tempfile.NamedTemporaryFile(prefix="aperam-doc-", suffix=suffix, delete=False) as spill:
+        shutil.copyfileobj(upload, spill, SPILL_CHUNK_SIZE)
+    return Path(spill.name)
+
+def _chunk_text(lines: Iterator[str], label: str) -> Iterator[DocumentPage]:
+    """Group lines into pages of roughly PAGE_CHARS characters"""
+    buffer: List[str] = []
+    size = 0
+    number = 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= PAGE_CHARS:
+            number += 1
+            yield make_page(number, f"{label} {number}", "".join(buffer))
+            buffer, size = [], 0
+    if buffer:
+        number += 1
+        yield make_page(number, f"{label} {number}", "".join(buffer))
+
+def make_page(number: int, label: str, text: str, tables: Optional[List[List[List[str]]]] = None) -> DocumentPage:
+    """Build a page from its full extracted text"""
+    return DocumentPage(number, label, text, len(text), tables or [])
+
+def iter_text_pages(path: Path) -> Iterator[DocumentPage]:
+    """Plain text, read line by line"""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        yield from _chunk_text(f, "Part")
+
+def iter_pdf_pages(path: Path) -> Iterator[DocumentPage]:
+    """PDF pages via pypdf, which reads page objects from the file on demand"""
+    if PdfReader is None:
+        raise DocumentError("PDF extraction needs the optional pypdf package (pip install pypdf)")
+    reader = PdfReader(str(path))
+    for number, page in enumerate(reader.pages, start=1):
+        yield make_page(number, f"Page {number}", page.extract_text() or "")
+
+def count_pdf_pages(path: Path) -> Optional[int]:
+    """Page count for progress display"""
+    if PdfReader is None:
+        return None
+    try:
+        return len(PdfReader(str(path)).pages)
+    except Exception:
+        return None
+
+def _docx_table(table: ET.Element) -> List[List[str]]:
+    return [
+        ["".join(t.text or "" for t in cell.iter(f"{W_NS}t")) for cell in row.iter(f"{W_NS}tc")]
+        for row in table.iter(f"{W_NS}tr")
+    ]
+
+def iter_docx_pages(path: Path) -> Iterator[DocumentPage]:
+    """Word documents, streamed from word/document.xml; pages split on page breaks or size"""
+    try:
+        archive = zipfile.ZipFile(path)
+    except zipfile.BadZipFile as e:
+        raise DocumentError(f"Not a valid DOCX file: {e}")
+
+    with archive, archive.open("word/document.xml") as xml:
+        paragraphs: List[str] = []
+        tables: List[List[List[str]]] = []
+        size = 0
+        number = 0
+        table_depth = 0
+
+        for event, elem in ET.iterparse(xml, events=("start", "end")):
+            if elem.tag == f"{W_NS}tbl":
+                if event == "start":
+                    table_depth += 1
+                    continue
+                table_depth -= 1
+                if table_depth == 0:
+                    rows = _docx_table(elem)
+                    tables.append(rows)
+                    text = "\n".join("\t".join(row) for row in rows)
+                    paragraphs.append(text + "\n")
+                    size += len(text)
+                    elem.clear()
+            elif event == "end" and elem.tag == f"{W_NS}p" and table_depth == 0:
+                text = "".join(t.text or "" for t in elem.iter(f"{W_NS}t"))
+                page_break = any(br.get(f"{W_NS}type") == "page" for br in elem.iter(f"{W_NS}br"))
+                paragraphs.append(text + "\n")
+                size += len(text)
+                elem.clear()
+
+                if page_break or size >= PAGE_CHARS:
+                    number += 1
+                    yield make_page(number, f"Section {number}", "".join(paragraphs), tables)
+                    paragraphs, tables, size = [], [], 0
+
+        if paragraphs or tables:
+            number += 1
+            yield make_page(number, f"Section {number}", "".join(paragraphs), tables)
+
+def _xlsx_sheets(archive: zipfile.ZipFile) -> List[tuple]:
+    """(sheet name, member path) in workbook order"""
+    workbook = ET.parse(archive.open("xl/workbook.xml")).getroot()
+    rels = ET.parse(archive.open("xl/_rels/workbook.xml.rels")).getroot()
+    targets = {rel.get("Id"): rel.get("Target") for rel in rels.iter(f"{PKG_REL_NS}Relationship")}
+
+    sheets = []
+    for sheet in workbook.iter(f"{S_NS}sheet"):
+        target = targets.get(sheet.get(f"{R_NS}id"), "")
+        member = target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+        sheets.append((sheet.get("name"), member))
+    return sheets
+
+def _xlsx_shared_strings(archive: zipfile.ZipFile) -> List[str]:
+    if "xl/sharedStrings.xml" not in archive.namelist():
+        return []
+    strings = []
+    for _, elem in ET.iterparse(archive.open("xl/sharedStrings.xml")):
+        if elem.tag == f"{S_NS}si":
+            strings.append("".join(t.text or "" for t in elem.iter(f"{S_NS}t")))
+            elem.clear()
+    return strings
+
+def _column_index(reference: str) -> int:
+    """Zero-based column index from a cell reference such as "AB12" """
+    index = 0
+    for char in reference:
+        if not char.isalpha():
+            break
+        index = index * 26 + (ord(char.upper()) - 64)
+    return index - 1
+
+def iter_xlsx_pages(path: Path) -> Iterator[DocumentPage]:
+    """Excel workbooks, streamed sheet by sheet in blocks of SHEET_PAGE_ROWS rows"""
+    try:
+        archive = zipfile.ZipFile(path)
+    except zipfile.BadZipFile as e:
+        raise DocumentError(f"Not a valid XLSX file: {e}")
+
+    with archive:
+        shared = _xlsx_shared_strings(archive)
+        number = 0
+
+        for sheet_name, member in _xlsx_sheets(archive):
+            rows: List[List[str]] = []
+            first_row = 1
+
+            for _, elem in ET.iterparse(archive.open(member)):
+                if elem.tag != f"{S_NS}row":
+                    continue
+
+                values: Dict[int, str] = {}
+                for cell in elem.iter(f"{S_NS}c"):
+                    cell_type = cell.get("t")
+                    value = cell.find(f"{S_NS}v")
+                    if cell_type == "inlineStr":
+                        text = "".join(t.text or "" for t in cell.iter(f"{S_NS}t"))
+                    elif value is None or value.text is None:
+                        continue
+                    elif cell_type == "s":
+                        text = shared[int(value.text)]
+                    else:
+                        text = value.text
+                    values[_column_index(cell.get("r", "A"))] = text
+                elem.clear()
+
+                if values:
+                    row = [""] * (max(values) + 1)
+                    for column, text in values.items():
+                        row[column] = text
+                    rows.append(row)
+
+                if len(rows) >= SHEET_PAGE_ROWS:
+                    number += 1
+                    label = f"{sheet_name} rows {first_row}-{first_row + len(rows) - 1}"
+                    yield make_page(number, label, "\n".join("\t".join(r) for r in rows), [rows])
+                    first_row += len(rows)
+                    rows = []
+
+            if rows or first_row == 1:
+                number += 1
+                label = f"{sheet_name} rows {first_row}-{first_row + len(rows) - 1}" if rows else f"{sheet_name} (empty)"
+                yield make_page(number, label, "\n".join("\t".join(r) for r in rows), [rows] if rows else [])
+
+def iter_image_pages(path: Path) -> Iterator[DocumentPage]:
+    """Images: header metadata only (Pillow reads dimensions without decoding pixels)"""
+    if Image is None:
+        raise DocumentError("Image inspection needs the Pillow package")
+    with Image.open(path) as image:
+        width, height = image.size
+        text = f"{image.format} image, {width}×{height} px, {image.mode} colour mode"
+    yield make_page(1, "Image", text)
+
+EXTRACTORS = {
+    "txt": iter_text_pages,
+    "pdf": iter_pdf_pages,
+    "docx": iter_docx_pages,
+    "xlsx": iter_xlsx_pages,
+    **{extension: iter_image_pages for extension in IMAGE_TYPES},
+}
+
+def iter_document_pages(path: Path, file_type: str) -> Iterator[DocumentPage]:
+    """Extract a spilled document page by page"""
+    extractor = EXTRACTORS.get(file_type)
+    if extractor is None:
+        raise DocumentError(f"Unsupported file type: .{file_type}")
+    return extractor(path)
+
+class DocumentProcessor:
+    """
+    Extract uploads in a thread pool so the script thread only spills the upload and polls
+    Pages are appended to the job as they are extracted, so callers can render partial
+    results; only a preview of each page is kept in memory.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: "OrderedDict[str, DocumentJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                workers = self._max_workers or get_agent_config().document_workers
+                self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="document-worker")
+            return self._executor
+
+    def submit(self, upload: BinaryIO, file_name: str) -> DocumentJob:
+        """Return cached results for content seen before, otherwise spill the upload and queue it"""
+        file_type = file_extension(file_name)
+        cache_key = f"{file_type}-{hash_upload(upload)}"
+        cached = document_cache.get(cache_key)
+
+        if cached is not None:
+            job = DocumentJob(
+                job_id=uuid.uuid4().hex, file_name=file_name, file_type=file_type, size=cached["size"],
+                status="done", pages=cached["pages"], analysis=cached["analysis"],
+                total_pages=cached["total_pages"], content_hash=cache_key, from_cache=True
+            )
+            job.finished_at = job.submitted_at
+            job._done.set()
+            self._register(job)
+            return job
+
+        path = spill_upload(upload, suffix=f".{file_type}")
+        job = DocumentJob(
+            job_id=uuid.uuid4().hex, file_name=file_name, file_type=file_type,
+            size=path.stat().st_size, content_hash=cache_key
+        )
+        self._register(job)
+        self._get_executor().submit(self._run, job, path)
+        return job
+
+    def _register(self, job: DocumentJob):
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._prune()
+
+    def _prune(self):
+        """Forget the oldest finished jobs beyond MAX_JOBS"""
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished][:max(0, len(self._jobs) - MAX_JOBS)]:
+            del self._jobs[job_id]
+
+    def _run(self, job: DocumentJob, path: Path):
+        """Worker: stream pages from the spilled file into the job"""
+        job.status = "running"
+        try:
+            if job.file_type == "pdf":
+                job.total_pages = count_pdf_pages(path)
+
+            for page in iter_document_pages(path, job.file_type):
+                if job._cancel.is_set():
+                    job.status = "cancelled"
+                    return
+                job.analysis.add_page(page.text, page.tables)
+                page.text = page.text[:PREVIEW_CHARS]
+                page.tables = [table[:PREVIEW_TABLE_ROWS] for table in page.tables]
+                job.pages.append(page)
+
+            job.status = "done"
+            document_cache.put(job.content_hash, {
+                "size": job.size,
+                "pages": job.pages,
+                "analysis": job.analysis,
+                "total_pages": job.total_pages
+            })
+        except DocumentError as e:
+            job.status, job.error = "failed", str(e)
+        except Exception as e:
+            job.status, job.error = "failed", f"Could not read {job.file_name}: {e}"
+        finally:
+            job.finished_at = time.time()
+            job._done.set()
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def get_job(self, job_id: str) -> Optional[DocumentJob]:
+        """Look up a job by id"""
+        return self._jobs.get(job_id)
+
+    def wait(self, job_id: str, timeout: float) -> Optional[DocumentJob]:
+        """Block up to timeout seconds for a job to finish (lets small files skip polling)"""
+        job = self.get_job(job_id)
+        if job is not None:
+            job._done.wait(timeout)
+        return job
+
+    def cancel(self, job_id: str):
+        """Stop a job after the page being extracted"""
+        job = self.get_job(job_id)
+        if job is not None:
+            job._cancel.set()
+
+# Global instance
+document_processor = DocumentProcessor()
+
+# Convenience functions
+def submit_document(upload: BinaryIO, file_name: str) -> DocumentJob:
+    """Queue an uploaded document for extraction"""
+    return document_processor.submit(upload, file_name)
+
+def get_document_job(job_id: str) -> Optional[DocumentJob]:
+    """Get an extraction job by id"""
+    return document_processor.get_job(job_id)
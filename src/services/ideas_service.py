@@ -0,0 +1,250 @@
+"""
+Ideas Catalog Service
+Columnar catalog of AI use case ideas with filtering, sorting and pagination
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.services.submissions_service import submissions_repository
+from src.utils.profiler import record_cache
+
+DEPARTMENTS = [
+    "Research & Development",
+    "Production",
+    "Quality Control",
+    "Supply Chain",
+    "Finance",
+    "Sales & Marketing",
+    "IT",
+    "HR",
+    "Other"
+]
+
+STATUSES = ["Under Review", "In Development", "Completed", "On Hold", "Approved", "Declined"]
+
+COMPLEXITIES = [
+    "Simple automation",
+    "Moderate AI/ML required",
+    "Complex AI/ML required",
+    "Cutting-edge research needed"
+]
+
+PRIORITIES = ["High", "Medium", "Low"]
+
+SORT_OPTIONS = {
+    "Newest first": ("submitted_at", False),
+    "Priority": ("priority", True),
+    "Title": ("title", True),
+    "Department": ("department", True)
+}
+
+CATEGORY_COLUMNS = {
+    "department": DEPARTMENTS,
+    "status": STATUSES,
+    "complexity": COMPLEXITIES,
+    "priority": PRIORITIES
+}
+
+@dataclass(frozen=True)
+class IdeasSnapshot:
+    """Table, category codes and sort orders built together from one submissions version"""
+    version: Any
+    table: pd.DataFrame
+    codes: Dict[str, np.ndarray]
+    sort_orders: Dict[str, np.ndarray]
+
+class IdeasCatalog:
+    """Ideas table with precomputed category codes and sort orders, published as one snapshot"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Optional[IdeasSnapshot] = None
+    
+    def _load_ideas(self) -> List[Dict]:
+        """Combine the showcase samples with every stored submission"""
+        ideas = get_sample_use_cases()
+        
+        for submission in submissions_repository.get_all_submissions():
+            payload = submission["payload"]
+            ideas.append({
+                "title": submission["title"],
+                "department": submission["department"],
+                "status": submission["status"],
+                "priority": (submission["priority"] or "").split(" - ")[0],
+                "complexity": payload.get('technical_complexity', ''),
+                "budget": payload.get('budget_range', ''),
+                "timeline": payload.get('timeline', ''),
+                "problem": payload.get('problem_description', ''),
+                "solution": payload.get('proposed_solution', ''),
+                "benefits": payload.get('expected_benefits', ''),
+                "submitted_at": submission["submitted_at"]
+            })
+        
+        return ideas
+    
+    def _build(self, ideas: List[Dict], version: Any) -> IdeasSnapshot:
+        """Build the table, category codes and sort permutations in one go"""
+        table = pd.DataFrame(ideas)
+        if "submitted_at" not in table:
+            table["submitted_at"] = None
+        table["submitted_at"] = pd.to_datetime(table["submitted_at"], errors="coerce")
+        
+        codes = {}
+        for column, categories in CATEGORY_COLUMNS.items():
+            table[column] = pd.Categorical(table[column], categories=categories, ordered=True)
+            codes[column] = table[column].cat.codes.to_numpy()
+        
+        sort_orders = {}
+        for label, (column, ascending) in SORT_OPTIONS.items():
+            # Missing values (e.g. samples without a date) always go last
+            key = table[column].cat.codes.replace(-1, len(CATEGORY_COLUMNS[column])) if column in codes else table[column]
+            sort_orders[label] = key.sort_values(ascending=ascending, kind="stable", na_position="last").index.to_numpy()
+        
+        return IdeasSnapshot(version, table, codes, sort_orders)
+    
+    def _get_snapshot(self) -> IdeasSnapshot:
+        """Current snapshot, rebuilt when the submissions store has changed"""
+        version = submissions_repository.version
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            record_cache("ideas_catalog", True)
+            return snapshot
+        
+        record_cache("ideas_catalog", False)
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != version:
+                # Published with a single assignment so readers never mix parts of two builds
+                self._snapshot = self._build(self._load_ideas(), version)
+            return self._snapshot
+    
+    def query(
+        self,
+        department: Optional[str] = None,
+        status: Optional[str] = None,
+        complexity: Optional[str] = None,
+        sort_by: str = "Newest first",
+        page: int = 1,
+        page_size: int = 10
+    ) -> Tuple[List[Dict], int]:
+        """
+        Filter, sort and paginate the catalog
+        Returns the requested page of ideas and the total number of matches.
+        """
+        snapshot = self._get_snapshot()
+        table, codes, sort_orders = snapshot.table, snapshot.codes, snapshot.sort_orders
+        
+        mask = np.ones(len(table), dtype=bool)
+        for column, value in (("department", department), ("status", status), ("complexity", complexity)):
+            if value:
+                categories = CATEGORY_COLUMNS[column]
+                code = categories.index(value) if value in categories else -2
+                mask &= codes[column] == code
+        
+        order = sort_orders.get(sort_by, sort_orders["Newest first"])
+        matches = order[mask[order]]
+        
+        start = max(page - 1, 0) * page_size
+        visible = table.iloc[matches[start:start + page_size]]
+        
+        ideas = visible.astype({column: "object" for column in CATEGORY_COLUMNS}).to_dict("records")
+        for idea, row_id in zip(ideas, visible.index):
+            idea["id"] = int(row_id)
+        
+        return ideas, int(len(matches))
+
+def get_sample_use_cases() -> List[Dict]:
+    """Get sample use cases for demonstration"""
+    return [
+        {
+            "title": "Automated Steel Quality Grading",
+            "department": "Quality Control",
+            "status": "In Development",
+            "priority": "High",
+            "complexity": "Moderate AI/ML required",
+            "budget": "€50K - €100K",
+            "timeline": "Short-term (1-3 months)",
+            "problem": "Manual quality grading is time-consuming and inconsistent across different inspectors",
+            "solution": "Computer vision system to automatically grade steel products based on visual inspection",
+            "benefits": "50% reduction in inspection time, consistent quality standards, reduced human error"
+        },
+        {
+            "title": "Predictive Maintenance for Rolling Mills",
+            "department": "Production",
+            "status": "Completed",
+            "priority": "High",
+            "complexity": "Complex AI/ML required",
+            "budget": "€100K - €500K",
+            "timeline": "Medium-term (3-6 months)",
+            "problem": "Unexpected equipment failures cause costly downtime and production delays",
+            "solution": "ML model using sensor data to predict equipment failures 2-4 weeks in advance",
+            "benefits": "40% reduction in unplanned downtime, 25% maintenance cost savings, improved safety"
+        },
+        {
+            "title": "Demand Forecasting Optimization",
+            "department": "Supply Chain",
+            "status": "Under Review",
+            "priority": "Medium",
+            "complexity": "Moderate AI/ML required",
+            "budget": "€10K - €50K",
+            "timeline": "Short-term (1-3 months)",
+            "problem": "Current forecasting methods are inaccurate, leading to overstock or stockouts",
+            "solution": "Advanced ML model incorporating market trends, seasonality, and external factors",
+            "benefits": "15% improvement in forecast accuracy, 20% reduction in inventory costs"
+        },
+        {
+            "title": "Automated Invoice Processing",
+            "department": "Finance",
+            "status": "Completed",
+            "priority": "Medium",
+            "complexity": "Simple automation",
+            "budget": "< €10K",
+            "timeline": "ASAP (1-2 weeks)",
+            "problem": "Manual processing of invoices is slow and error-prone",
+            "solution": "OCR and NLP to automatically extract and validate invoice data",
+            "benefits": "80% reduction in processing time, 95% accuracy improvement"
+        },
+        {
+            "title": "Customer Behavior Analytics",
+            "department": "Sales & Marketing",
+            "status": "On Hold",
+            "priority": "Low",
+            "complexity": "Complex AI/ML required",
+            "budget": "€50K - €100K",
+            "timeline": "Long-term (6+ months)",
+            "problem": "Limited insights into customer preferences and buying patterns",
+            "solution": "ML model to analyze customer data and predict buying behavior",
+            "benefits": "Improved customer targeting, increased sales conversion, better product recommendations"
+        },
+        {
+            "title": "Energy Consumption Optimization",
+            "department": "Production",
+            "status": "In Development",
+            "priority": "High",
+            "complexity": "Moderate AI/ML required",
+            "budget": "€100K - €500K",
+            "timeline": "Medium-term (3-6 months)",
+            "problem": "High energy costs and carbon footprint from inefficient energy usage",
+            "solution": "AI system to optimize energy consumption based on production schedules and grid prices",
+            "benefits": "15% reduction in energy costs, 20% carbon footprint reduction"
+        }
+    ]
+
+# Global instance
+ideas_catalog = IdeasCatalog()
+
+# Convenience functions
+def query_ideas(
+    department: Optional[str] = None,
+    status: Optional[str] = None,
+    complexity: Optional[str] = None,
+    sort_by: str = "Newest first",
+    page: int = 1,
+    page_size: int = 10
+) -> Tuple[List[Dict], int]:
+    """Get one page of filtered, sorted ideas and the total match count"""
+    return ideas_catalog.query(department, status, complexity, sort_by, page, page_size)
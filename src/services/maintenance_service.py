@@ -0,0 +1,140 @@
+"""
+Maintenance Service
+Vectorized failure-risk scoring for whole equipment fleets
+"""
+
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+FEATURES = ("operating_hours", "temperature", "vibration", "days_since_maintenance")
+
+# Accepted CSV header spellings for each feature
+COLUMN_ALIASES = {
+    "hours": "operating_hours",
+    "operating_hours_month": "operating_hours",
+    "temperature_avg": "temperature",
+    "avg_temperature": "temperature",
+    "temperature_c": "temperature",
+    "vibration_level": "vibration",
+    "vibration_mm_s": "vibration",
+    "last_maintenance": "days_since_maintenance",
+    "days_since_last_maintenance": "days_since_maintenance",
+}
+
+EQUIPMENT_TYPES = ("Blast Furnace", "Rolling Mill", "Heat Treatment Furnace", "Casting Machine")
+
+HIGH_RISK = 70.0
+MEDIUM_RISK = 40.0
+
+@dataclass(frozen=True)
+class RiskModel:
+    """
+    Failure probability (%, next 30 days) from the four fleet features
+    Features are divided by their scales and combined with the weights, then passed through
+    the link: "linear" clips the sum to [floor, ceiling], "logistic" maps it with a sigmoid.
+    The defaults reproduce the original single-asset formula.
+    """
+    name: str = "Baseline (linear)"
+    scales: Tuple[float, float, float, float] = (744.0, 1500.0, 20.0, 365.0)
+    weights: Tuple[float, float, float, float] = (30.0, 20.0, 25.0, 25.0)
+    intercept: float = 0.0
+    link: str = "linear"
+    floor: float = 5.0
+    ceiling: float = 95.0
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        """Score an (n, 4) feature matrix in one pass"""
+        coefficients = np.asarray(self.weights, dtype=np.float64) / np.asarray(self.scales, dtype=np.float64)
+        linear = features @ coefficients + self.intercept
+        if self.link == "logistic":
+            linear = 100.0 / (1.0 + np.exp(-linear))
+        return np.clip(linear, self.floor, self.ceiling)
+
+RISK_MODELS: Dict[str, RiskModel] = {
+    "baseline": RiskModel(),
+    # Steeper response to vibration and overdue maintenance; about 20% for the median sample-fleet asset
+    "logistic": RiskModel(
+        name="Logistic (vibration-weighted)",
+        weights=(1.2, 1.0, 3.5, 3.0),
+        intercept=-5.5,
+        link="logistic",
+        floor=1.0,
+        ceiling=99.0
+    ),
+}
+
+def normalize_columns(fleet: pd.DataFrame) -> pd.DataFrame:
+    """Map header variants onto the feature names (case and spacing insensitive)"""
+    renamed = {}
+    for column in fleet.columns:
+        key = str(column).strip().lower().replace(" ", "_").replace("-", "_")
+        renamed[column] = COLUMN_ALIASES.get(key, key)
+    return fleet.rename(columns=renamed)
+
+def read_fleet_csv(source: BinaryIO) -> pd.DataFrame:
+    """Read a fleet table from CSV and normalize its headers"""
+    return normalize_columns(pd.read_csv(source))
+
+def score_fleet(fleet: pd.DataFrame, model: Optional[RiskModel] = None) -> pd.DataFrame:
+    """
+    Score every asset and return the fleet ranked by failure probability
+    Rows with missing, non-numeric or infinite feature values are dropped; the count is in attrs["dropped"].
+    """
+    model = model or RISK_MODELS["baseline"]
+    fleet = normalize_columns(fleet)
+
+    missing = [feature for feature in FEATURES if feature not in fleet.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    duplicated = [feature for feature in FEATURES if (fleet.columns == feature).sum() > 1]
+    if duplicated:
+        raise ValueError(f"More than one column maps to: {', '.join(duplicated)}")
+
+    features = np.column_stack([
+        pd.to_numeric(fleet[feature], errors="coerce").to_numpy(dtype=np.float64) for feature in FEATURES
+    ])
+    valid = np.isfinite(features).all(axis=1)
+    features = features[valid]
+
+    probability = model.predict(features)
+    order = np.argsort(-probability, kind="stable")
+
+    ranked = fleet.loc[valid].iloc[order].reset_index(drop=True)
+    ranked.insert(0, "rank", np.arange(1, len(ranked) + 1))
+    ranked["failure_prob"] = np.round(probability[order], 1)
+    ranked["risk_level"] = np.select(
+        [ranked["failure_prob"].to_numpy() > HIGH_RISK, ranked["failure_prob"].to_numpy() > MEDIUM_RISK],
+        ["High", "Medium"],
+        default="Low"
+    )
+    ranked["confidence"] = np.clip(100 - ranked["failure_prob"].to_numpy() / 2, 85, 98).round(0)
+    ranked.attrs["dropped"] = int((~valid).sum())
+    ranked.attrs["model"] = model.name
+    return ranked
+
+def score_asset(operating_hours: float, temperature: float, vibration: float,
+                days_since_maintenance: float, model: Optional[RiskModel] = None) -> float:
+    """Failure probability for a single asset"""
+    features = np.array([[operating_hours, temperature, vibration, days_since_maintenance]], dtype=np.float64)
+    return float((model or RISK_MODELS["baseline"]).predict(features)[0])
+
+def summarize_risk(ranked: pd.DataFrame) -> Dict[str, int]:
+    """Asset counts per risk level"""
+    counts = ranked["risk_level"].value_counts()
+    return {level: int(counts.get(level, 0)) for level in ("High", "Medium", "Low")}
+
+def generate_sample_fleet(size: int = 100_000, seed: int = 7) -> pd.DataFrame:
+    """Synthetic fleet with realistic feature ranges for trying the scorer"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "asset_id": [f"EQ-{i:06d}" for i in range(1, size + 1)],
+        "equipment_type": rng.choice(EQUIPMENT_TYPES, size),
+        "operating_hours": rng.integers(0, 745, size),
+        "temperature": rng.normal(1100, 180, size).clip(500, 1500).round(0),
+        "vibration": rng.gamma(4.0, 1.8, size).clip(0, 20).round(1),
+        "days_since_maintenance": rng.integers(0, 366, size),
+    })
@@ -0,0 +1,186 @@
+"""
+Response Cache
+Exact and near-duplicate caching of agent answers with per-agent TTL and LRU eviction
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from src.config.settings import get_agent_config
+from src.utils.config_loader import get_agent_by_id
+from src.utils.text_index import TfidfIndex, tokenize
+
+@dataclass
+class CachedResponse:
+    """A cached agent answer"""
+    agent_id: str
+    query: str
+    text: str
+    expires_at: float
+    match: str = "exact"  # "exact" or "similar" when returned from a lookup
+    score: float = 1.0
+
+def normalize_query(query: str) -> str:
+    """Case, whitespace and punctuation-insensitive form of a query for exact matching"""
+    return " ".join(re.findall(r"[a-z0-9]+", (query or "").lower()))
+
+def parse_cost(cost: Optional[str]) -> float:
+    """Dollar amount from a cost_per_query string such as "$0.05" """
+    match = re.search(r"\d+(?:\.\d+)?", str(cost or ""))
+    return float(match.group()) if match else 0.0
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of agent answers keyed by (agent id, normalized query)
+    Lookups try the exact key first, then a TF-IDF cosine search over the agent's cached
+    queries for agents whose answers do not depend on the wording (cache_similar in
+    agents.yaml). The TF-IDF index is append-only, so evicted entries stay in it until the
+    number of dead entries outgrows the live ones and the agent's index is rebuilt.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], CachedResponse]" = OrderedDict()
+        self._indexes: Dict[str, TfidfIndex] = {}
+        self._lock = threading.Lock()
+        self._stats = {"exact_hits": 0, "similar_hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "saved_cost": 0.0}
+
+    @property
+    def max_entries(self) -> int:
+        """Entries kept across all agents before the least recently used is evicted"""
+        if self._max_entries is None:
+            self._max_entries = get_agent_config().response_cache_max_entries
+        return self._max_entries
+
+    def get_ttl(self, agent_id: str) -> int:
+        """Seconds an agent's answers stay valid; cache_ttl in agents.yaml overrides the default, 0 disables"""
+        agent = get_agent_by_id(agent_id) or {}
+        ttl = agent.get('cache_ttl')
+        return int(ttl) if ttl is not None else get_agent_config().response_cache_ttl
+
+    def allows_similar(self, agent_id: str) -> bool:
+        """Whether near-duplicate queries may share an agent's answers; off unless cache_similar is set in agents.yaml"""
+        agent = get_agent_by_id(agent_id) or {}
+        return bool(agent.get('cache_similar', False))
+
+    def get(self, agent_id: str, query: str) -> Optional[CachedResponse]:
+        """Look up a cached answer, exact match first, then the most similar cached query where allowed"""
+        key = (agent_id, normalize_query(query))
+        now = time.time()
+
+        with self._lock:
+            entry = self._get_live(key, now)
+            if entry is not None:
+                return self._record_hit(entry, "exact", 1.0)
+
+            index = self._indexes.get(agent_id) if self.allows_similar(agent_id) else None
+            if index is not None and tokenize(query):
+                threshold = get_agent_config().response_cache_similarity
+                for score, indexed_key in index.query(query, k=5, min_score=threshold):
+                    entry = self._get_live(indexed_key, now)
+                    if entry is not None:
+                        return self._record_hit(entry, "similar", score)
+
+            self._stats["misses"] += 1
+            return None
+
+    def _get_live(self, key: Tuple[str, str], now: float) -> Optional[CachedResponse]:
+        """Entry for a key if present and not expired; marks it most recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            del self._entries[key]
+            self._stats["expirations"] += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _record_hit(self, entry: CachedResponse, match: str, score: float) -> CachedResponse:
+        self._stats[f"{match}_hits"] += 1
+        agent = get_agent_by_id(entry.agent_id) or {}
+        self._stats["saved_cost"] += parse_cost(agent.get('cost_per_query'))
+        return CachedResponse(entry.agent_id, entry.query, entry.text, entry.expires_at, match, score)
+
+    def put(self, agent_id: str, query: str, text: str):
+        """Cache an answer for the agent's TTL"""
+        ttl = self.get_ttl(agent_id)
+        normalized = normalize_query(query)
+        if ttl <= 0 or not normalized or not text:
+            return
+
+        key = (agent_id, normalized)
+        with self._lock:
+            is_new = key not in self._entries
+            self._entries[key] = CachedResponse(agent_id, query, text, time.time() + ttl)
+            self._entries.move_to_end(key)
+
+            if is_new:
+                index = self._indexes.setdefault(agent_id, TfidfIndex())
+                index.add(normalized, key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+            self._compact(agent_id)
+
+    def _compact(self, agent_id: str):
+        """Rebuild an agent's similarity index once evicted entries dominate it"""
+        index = self._indexes.get(agent_id)
+        live = [key for key in self._entries if key[0] == agent_id]
+        if index is None or len(index) - len(live) <= max(64, len(live)):
+            return
+
+        rebuilt = TfidfIndex()
+        for key in live:
+            rebuilt.add(key[1], key)
+        self._indexes[agent_id] = rebuilt
+
+    def get_or_compute(self, agent_id: str, query: str, compute: Callable[[str], str]) -> CachedResponse:
+        """Return the cached answer or compute, cache and return a fresh one (match "miss")"""
+        cached = self.get(agent_id, query)
+        if cached is not None:
+            return cached
+
+        text = compute(query)
+        self.put(agent_id, query, text)
+        return CachedResponse(agent_id, query, text, time.time() + self.get_ttl(agent_id), match="miss", score=0.0)
+
+    def get_stats(self) -> Dict:
+        """Hit-rate metrics"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+
+        hits = stats["exact_hits"] + stats["similar_hits"]
+        lookups = hits + stats["misses"]
+        stats["hit_rate"] = hits / lookups if lookups else 0.0
+        return stats
+
+    def clear(self, agent_id: Optional[str] = None):
+        """Drop cached answers for one agent, or all of them"""
+        with self._lock:
+            if agent_id is None:
+                self._entries.clear()
+                self._indexes.clear()
+                return
+            for key in [key for key in self._entries if key[0] == agent_id]:
+                del self._entries[key]
+            self._indexes.pop(agent_id, None)
+
+# Global instance
+response_cache = ResponseCache()
+
+# Convenience functions
+def get_cached_response(agent_id: str, query: str) -> Optional[CachedResponse]:
+    """Look up a cached answer for an agent query"""
+    return response_cache.get(agent_id, query)
+
+def get_response_cache_stats() -> Dict:
+    """Get response cache hit-rate metrics"""
+    return response_cache.get_stats()
@@ -4,10 +4,17 @@ Handles use case submissions to Google Sheets
 """
 
 import json
+import threading
+import time
 import requests
-from typing import Dict, Optional
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
 from datetime import datetime
 from src.config.settings import get_app_config
+from src.models.submission import (
+    UseCaseSubmission, SHEET_COLUMNS, validate_submission, validate_submissions, to_sheet_rows
+)
+from src.services.submissions_service import SubmissionsRepository, submissions_repository
 from src.utils.helpers import log_user_action
 
 class SheetsService:
@@ -18,61 +25,119 @@ class SheetsService:
         # In production, these would come from environment variables
         self.sheets_url = self.config.google_sheets_url if hasattr(self.config, 'google_sheets_url') else None
         self.webhook_url = self.config.webhook_url if hasattr(self.config, 'webhook_url') else None
+        # Local fallback queue for submissions that could not be sent
+        self.data_dir = "static/data"
+        self._replay_lock = threading.Lock()  # The monitor and the admin action must not send a file twice
     
-    def submit_use_case(self, submission_data: Dict) -> bool:
+    def submit_use_case(self, submission_data: Union[Dict, UseCaseSubmission]) -> bool:
         """
         Submit use case to Google Sheets
+        Accepts a raw dict or an already validated UseCaseSubmission.
         Returns True if successful, False otherwise
         """
         try:
+            if not isinstance(submission_data, UseCaseSubmission):
+                submission, errors = validate_submission(submission_data)
+                if errors:
+                    log_user_action("use_case_validation_error", {"errors": errors})
+                    return False
+                submission_data = submission
+            
             # Prepare data for sheets
             sheets_data = self._prepare_sheets_data(submission_data)
             
             # Method 1: Direct Google Sheets API (requires setup)
             if self.sheets_url:
-                success = self._submit_to_sheets_api(sheets_data)
+                success = self._submit_to_sheets_api([list(sheets_data.values())])
                 if success:
-                    log_user_action("use_case_submitted_sheets", {"title": submission_data.get('use_case_title')})
+                    log_user_action("use_case_submitted_sheets", {"title": submission_data.use_case_title})
                     return True
             
             # Method 2: Google Forms webhook (simpler setup)
             if self.webhook_url:
                 success = self._submit_to_webhook(sheets_data)
                 if success:
-                    log_user_action("use_case_submitted_webhook", {"title": submission_data.get('use_case_title')})
+                    log_user_action("use_case_submitted_webhook", {"title": submission_data.use_case_title})
                     return True
             
             # Method 3: Fallback to local storage/email
-            return self._fallback_submission(submission_data)
+            return self._fallback_submission(submission_data.model_dump())
             
         except Exception as e:
             log_user_action("use_case_submission_error", {"error": str(e)})
             return False
     
-    def _prepare_sheets_data(self, submission_data: Dict) -> Dict:
-        """Prepare data for Google Sheets format"""
-        return {
-            "timestamp": datetime.now().isoformat(),
-            "submitter_name": submission_data.get('submitter_name', ''),
-            "submitter_email": submission_data.get('submitter_email', ''),
-            "department": submission_data.get('department', ''),
-            "business_unit": submission_data.get('business_unit', ''),
-            "use_case_title": submission_data.get('use_case_title', ''),
-            "problem_description": submission_data.get('problem_description', ''),
-            "proposed_solution": submission_data.get('proposed_solution', ''),
-            "expected_benefits": submission_data.get('expected_benefits', ''),
-            "priority": submission_data.get('priority', ''),
-            "timeline": submission_data.get('timeline', ''),
-            "data_availability": submission_data.get('data_availability', ''),
-            "technical_complexity": submission_data.get('technical_complexity', ''),
-            "integration_needs": submission_data.get('integration_needs', ''),
-            "budget_range": submission_data.get('budget_range', ''),
-            "stakeholders": submission_data.get('stakeholders', ''),
-            "additional_notes": submission_data.get('additional_notes', '')
-        }
+    def replay_backlog(self, records: List[Dict], on_accepted: Optional[Callable[[int], None]] = None) -> Dict:
+        """
+        Validate and submit many queued submissions in one go
+        Rows go to the Sheets API as a single append; invalid records are reported, not sent.
+        on_accepted is called with a record's index as soon as its row has been accepted.
+        """
+        submissions, errors = validate_submissions(records)
+        rows = to_sheet_rows(submissions)
+        indexes = [i for i in range(len(records)) if i not in errors]
+        accepted = []
+        
+        def accept(index: int):
+            accepted.append(index)
+            if on_accepted:
+                on_accepted(index)
+        
+        if rows and self.sheets_url:
+            if self._submit_to_sheets_api(rows):
+                for index in indexes:
+                    accept(index)
+        elif rows and self.webhook_url:
+            for index, row in zip(indexes, rows):
+                if self._submit_to_webhook(dict(zip(SHEET_COLUMNS, row))):
+                    accept(index)
+        
+        submitted = len(accepted)
+        
+        log_user_action("use_case_backlog_replayed", {
+            "records": len(records),
+            "submitted": submitted,
+            "invalid": len(errors)
+        })
+        
+        return {"submitted": submitted, "pending": len(rows) - submitted, "invalid": len(errors), "errors": errors}
+    
+    def replay_local_backlog(self, data_dir: Optional[str] = None) -> Dict:
+        """Replay submissions saved by the local fallback, marking each file replayed once its row is accepted"""
+        with self._replay_lock:
+            files = sorted(Path(data_dir or self.data_dir).glob("use_case_*.json"))
+            if not files:
+                return {"submitted": 0, "pending": 0, "invalid": 0, "errors": {}}
+            
+            records, readable, unreadable = [], [], 0
+            for path in files:
+                try:
+                    with open(path, 'r') as f:
+                        records.append(json.load(f))
+                    readable.append(path)
+                except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+                    # Set a corrupt file aside so it cannot block every later replay
+                    print(f"Warning: Skipping unreadable queued submission {path.name}: {e}")
+                    unreadable += 1
+                    try:
+                        path.rename(path.with_suffix(".json.invalid"))
+                    except OSError:
+                        pass
+            
+            def mark_replayed(index: int):
+                # Renamed right away so a later failure in the batch cannot resend this row
+                readable[index].rename(readable[index].with_suffix(".json.replayed"))
+            
+            result = self.replay_backlog(records, on_accepted=mark_replayed)
+            result["invalid"] += unreadable
+            return result
     
-    def _submit_to_sheets_api(self, data: Dict) -> bool:
-        """Submit to Google Sheets using API"""
+    def _prepare_sheets_data(self, submission: UseCaseSubmission) -> Dict:
+        """Prepare data for Google Sheets format, in the fixed Sheet column order"""
+        return dict(zip(SHEET_COLUMNS, to_sheet_rows([submission])[0]))
+    
+    def _submit_to_sheets_api(self, rows: List[List[str]]) -> bool:
+        """Append rows to Google Sheets using API"""
         try:
             # This would require Google Sheets API setup
             # For now, we'll simulate success
@@ -83,7 +148,7 @@ class SheetsService:
             
             # Construct the API request
             sheets_payload = {
-                "values": [list(data.values())],
+                "values": rows,
                 "majorDimension": "ROWS"
             }
             
@@ -139,7 +204,7 @@ class SheetsService:
             import os
             
             # Create data directory if it doesn't exist
-            data_dir = "static/data"
+            data_dir = self.data_dir
             os.makedirs(data_dir, exist_ok=True)
             
             # Save to JSON file
@@ -166,6 +231,38 @@ class SheetsService:
         except Exception as e:
             log_user_action("email_notification_error", {"error": str(e)})
     
+    def fetch_status_updates(self, since: Optional[str] = None) -> List[Dict]:
+        """
+        Fetch review status changes made in the Sheet since the given timestamp
+        Only the submission_id/status/updated_at columns are requested, never the full Sheet.
+        """
+        if not self.sheets_url:
+            return []
+
+        try:
+            headers = {'Authorization': f'Bearer {self._get_access_token()}'}
+            params = {"fields": "submission_id,status,updated_at"}
+            if since:
+                params["updated_since"] = since
+
+            response = requests.get(self.sheets_url, headers=headers, params=params, timeout=10)
+            if response.status_code != 200:
+                return []
+
+            updates = []
+            for row in response.json().get("values", []):
+                if len(row) < 3 or not row[0]:
+                    continue
+                if since and row[2] <= since:
+                    continue
+                updates.append({"submission_id": row[0], "status": row[1], "updated_at": row[2]})
+
+            return updates
+
+        except Exception as e:
+            log_user_action("sheets_status_sync_error", {"error": str(e)})
+            return []
+
     def _get_access_token(self) -> str:
         """Get Google API access token"""
         # This would implement OAuth2 flow
@@ -184,10 +281,10 @@ class SheetsService:
                     "status": response.status_code
                 }
             elif self.webhook_url:
-                # Test webhook connection
-                response = requests.post(self.webhook_url, data={"test": "true"}, timeout=10)
+                # Test webhook reachability without posting a submission
+                response = requests.head(self.webhook_url, allow_redirects=True, timeout=10)
                 return {
-                    "success": response.status_code == 200,
+                    "success": response.ok or response.status_code == 405,
                     "method": "Webhook",
                     "status": response.status_code
                 }
@@ -205,13 +302,113 @@ class SheetsService:
                 "error": str(e)
             }
 
-# Global instance
+class SheetsConnectionMonitor:
+    """Probe the Sheets integration in the background and cache the latest status"""
+    
+    def __init__(self, service: SheetsService, interval: int = 300):
+        self.service = service
+        self.interval = interval  # Seconds between background probes
+        self._status = {
+            "success": None,
+            "method": "Pending",
+            "status": "Connection check pending"
+        }
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+    
+    def start(self):
+        """Start the background prober if it is not running yet"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="sheets-connection-monitor", daemon=True)
+                self._thread.start()
+    
+    def _run(self):
+        """Probe loop; sleeps for the interval unless woken early"""
+        while True:
+            status = self.probe()
+            if status["success"] and status["method"] != "Fallback":
+                self._replay_backlog()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+    
+    def probe(self) -> Dict:
+        """Run a connection test now and cache the result"""
+        status = self.service.test_connection()
+        status["checked_at"] = datetime.now().isoformat()
+        self._status = status
+        return status
+    
+    def _replay_backlog(self):
+        """Send submissions queued by the local fallback while the integration was down"""
+        try:
+            result = self.service.replay_local_backlog()
+            if result["pending"]:
+                print(f"Warning: {result['pending']} queued use case submissions could not be replayed")
+        except Exception as e:
+            print(f"Warning: Could not replay queued use case submissions: {e}")
+    
+    def get_status(self) -> Dict:
+        """Get the cached status without any network call"""
+        self.start()
+        return self._status
+    
+    def request_probe(self):
+        """Ask the background prober to run ahead of schedule"""
+        self.start()
+        self._wake.set()
+
+class StatusSyncMonitor:
+    """Pull review status changes from the Sheet into the submissions store in the background"""
+    
+    def __init__(self, service: SheetsService, repository: SubmissionsRepository):
+        self.service = service
+        self.repository = repository
+        self._lock = threading.Lock()
+        self._thread = None
+    
+    def start(self):
+        """Start the background sync if it is not running yet"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="sheets-status-sync", daemon=True)
+                self._thread.start()
+    
+    def _run(self):
+        """Sync loop; runs once per repository sync interval"""
+        while True:
+            try:
+                self.repository.sync_statuses(self.service.fetch_status_updates, force=True)
+            except Exception as e:
+                print(f"Warning: Could not sync submission statuses: {e}")
+            time.sleep(self.repository.sync_interval)
+
+# Global instances
 sheets_service = SheetsService()
+sheets_monitor = SheetsConnectionMonitor(sheets_service)
+status_sync_monitor = StatusSyncMonitor(sheets_service, submissions_repository)
 
-def submit_use_case_to_sheets(submission_data: Dict) -> bool:
+def submit_use_case_to_sheets(submission_data: Union[Dict, UseCaseSubmission]) -> bool:
     """Convenience function for submitting use case"""
     return sheets_service.submit_use_case(submission_data)
 
+def replay_submission_backlog() -> Dict:
+    """Convenience function for replaying locally queued submissions"""
+    return sheets_service.replay_local_backlog()
+
+def fetch_sheet_status_updates(since: Optional[str] = None) -> List[Dict]:
+    """Convenience function for syncing review statuses"""
+    return sheets_service.fetch_status_updates(since)
+
+def start_status_sync():
+    """Convenience function for starting the background status sync (non-blocking)"""
+    status_sync_monitor.start()
+
 def test_sheets_connection() -> Dict:
-    """Convenience function for testing connection"""
-    return sheets_service.test_connection()
\ No newline at end of file
+    """Convenience function for testing connection (blocking, live probe)"""
+    return sheets_monitor.probe()
+
+def get_sheets_connection_status() -> Dict:
+    """Convenience function for the cached connection status"""
+    return sheets_monitor.get_status()
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""
+Use Case Similarity Service
+Detects near-duplicate AI ideas across all past submissions
+"""
+
+import threading
+from typing import Dict, List
+
+from src.utils.text_index import TfidfIndex
+from src.services.submissions_service import submissions_repository
+
+class UseCaseSimilarityService:
+    """TF-IDF similarity index over submitted use cases"""
+
+    def __init__(self, duplicate_threshold: float = 0.6):
+        self.duplicate_threshold = duplicate_threshold
+        self.index = TfidfIndex()
+        self._indexed_ids = set()
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self):
+        """Seed the index from the submissions store on first use"""
+        if self._loaded:
+            return
+
+        with self._lock:
+            if self._loaded:
+                return
+            for submission in submissions_repository.get_all_submissions():
+                self._add(submission["payload"], submission["status"])
+            self._loaded = True
+
+    def _add(self, submission_data: Dict, status: str = "Under Review"):
+        """Index one submission by its title and problem description"""
+        submission_id = submission_data.get('submission_id', '')
+        if submission_id and submission_id in self._indexed_ids:
+            return
+        self._indexed_ids.add(submission_id)
+        
+        title = submission_data.get('use_case_title', '')
+        self.index.add(
+            _index_text(title, submission_data.get('problem_description', '')),
+            {
+                "submission_id": submission_id,
+                "title": title,
+                "department": submission_data.get('department', ''),
+                "status": status
+            }
+        )
+
+    def add_submission(self, submission_data: Dict):
+        """Add a newly accepted submission to the index"""
+        self._ensure_loaded()
+        with self._lock:
+            self._add(submission_data)
+
+    def find_similar(self, title: str, problem_description: str = "", k: int = 5, min_score: float = 0.2) -> List[Dict]:
+        """Get the top-k most similar past submissions with their similarity score"""
+        self._ensure_loaded()
+        matches = self.index.query(_index_text(title, problem_description), k=k, min_score=min_score)
+        return [{**payload, "score": score} for score, payload in matches]
+
+    def find_duplicates(self, title: str, problem_description: str = "", k: int = 3) -> List[Dict]:
+        """Get past submissions similar enough to count as likely duplicates"""
+        return self.find_similar(title, problem_description, k=k, min_score=self.duplicate_threshold)
+
+def _index_text(title: str, problem_description: str) -> str:
+    """Build the indexed text; the title is repeated to weigh it above the description"""
+    return f"{title} {title} {problem_description}"
+
+# Global instance
+similarity_service = UseCaseSimilarityService()
+
+# Convenience functions
+def find_similar_use_cases(title: str, problem_description: str = "", k: int = 5) -> List[Dict]:
+    """Find similar past use cases"""
+    return similarity_service.find_similar(title, problem_description, k=k)
+
+def find_duplicate_use_cases(title: str, problem_description: str = "") -> List[Dict]:
+    """Find likely duplicate use cases"""
+    return similarity_service.find_duplicates(title, problem_description)
+
+def index_use_case(submission_data: Dict):
+    """Add a submitted use case to the similarity index"""
+    similarity_service.add_submission(submission_data)
@@ -0,0 +1,260 @@
+"""
+Steel Specs Index
+Hybrid BM25 and vector retrieval over the steel grade reference data, stored as memory-mapped arrays
+
+Build ahead of time (e.g. in the container image) with:
+    python -m src.services.steel_specs_index
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from src.utils.config_snapshot import CONFIG_DIR, PROJECT_ROOT, parse_yaml
+from src.utils.text_index import tokenize
+
+GRADES_FILE = CONFIG_DIR / "steel_grades.yaml"
+INDEX_DIR = PROJECT_ROOT / ".cache" / "steel_specs_index"
+INDEX_FORMAT = 1
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+VECTOR_DIM = 1024      # Hashed word and character trigram features
+VECTOR_MIN_SCORE = 0.15  # Below this hashed trigram collisions dominate
+RRF_K = 60             # Reciprocal rank fusion damping
+CANDIDATES = 20        # Results taken from each ranking before fusion
+
+# Question phrasing that would otherwise match rare words in unrelated grades
+QUERY_STOP_WORDS = frozenset({
+    "what", "which", "best", "good", "better", "grade", "grades", "steel", "steels", "suitable",
+    "recommend", "recommended", "compare", "vs", "versus", "application", "applications",
+    "type", "types", "material", "materials", "need", "should", "do", "does", "how", "why"
+})
+
+ARRAYS = ("doc_lengths", "term_offsets", "postings_docs", "postings_tf", "idf", "vectors", "vector_idf")
+
+def _tokens(text: str) -> List[str]:
+    return [token for token in tokenize(text) if token not in QUERY_STOP_WORDS]
+
+def grade_text(grade: Dict[str, Any]) -> str:
+    """Searchable text for a grade; names and designations are repeated to weigh them up"""
+    designations = " ".join(str(value) for value in (grade.get('designations') or {}).values())
+    names = f"{grade['name']} {grade['id']} {designations}"
+    composition = " ".join(f"{element} {value}" for element, value in (grade.get('composition') or {}).items())
+    return " ".join([
+        names, names,
+        grade.get('family', ''),
+        " ".join(grade.get('standards', [])),
+        f"composition {composition}",
+        f"corrosion {grade.get('corrosion_resistance', '')}",
+        f"welding weldability {grade.get('weldability', '')}",
+        "high temperature heat resisting service" if (grade.get('max_service_temp_c') or 0) >= 850 else "",
+        " ".join(grade.get('applications', [])),
+        grade.get('summary', '')
+    ])
+
+def _vector_features(text: str) -> np.ndarray:
+    """Hashed bucket ids for word tokens and their character trigrams (robust to inflections)"""
+    features = []
+    for token in _tokens(text):
+        features.append(f"w:{token}")
+        padded = f"<{token}>"
+        features.extend(f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2))
+    # crc32 rather than hash() so buckets are stable across processes
+    return np.fromiter((zlib.crc32(feature.encode()) % VECTOR_DIM for feature in features), dtype=np.int64, count=len(features))
+
+def _embed(text: str, vector_idf: np.ndarray) -> np.ndarray:
+    """L2-normalized log-TF x IDF vector over the hashed features"""
+    counts = np.bincount(_vector_features(text), minlength=VECTOR_DIM).astype(np.float32)
+    vector = np.log1p(counts) * vector_idf
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+def _source_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+def build_index(grades_file: Path = GRADES_FILE, index_dir: Path = INDEX_DIR) -> Path:
+    """Build the BM25 postings (CSR layout) and the vector matrix and write them as .npy files"""
+    grades = parse_yaml(grades_file)["grades"]
+    texts = [grade_text(grade) for grade in grades]
+    doc_tokens = [_tokens(text) for text in texts]
+    doc_count = len(grades)
+
+    # BM25 inverted index: postings grouped by term so each term's documents are one slice
+    vocab = sorted({token for tokens in doc_tokens for token in tokens})
+    term_ids = {term: i for i, term in enumerate(vocab)}
+    entries = []
+    for doc_id, tokens in enumerate(doc_tokens):
+        counts: Dict[int, int] = {}
+        for token in tokens:
+            counts[term_ids[token]] = counts.get(term_ids[token], 0) + 1
+        entries.extend((term_id, doc_id, tf) for term_id, tf in counts.items())
+    entries.sort()
+
+    postings_terms = np.array([term for term, _, _ in entries], dtype=np.int32)
+    arrays = {
+        "doc_lengths": np.array([len(tokens) for tokens in doc_tokens], dtype=np.float32),
+        "term_offsets": np.searchsorted(postings_terms, np.arange(len(vocab) + 1)).astype(np.int64),
+        "postings_docs": np.array([doc for _, doc, _ in entries], dtype=np.int32),
+        "postings_tf": np.array([tf for _, _, tf in entries], dtype=np.float32),
+    }
+    df = np.diff(arrays["term_offsets"]).astype(np.float32)
+    arrays["idf"] = np.log(1.0 + (doc_count - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+    # Vector index over hashed features
+    features = [_vector_features(text) for text in texts]
+    feature_df = np.zeros(VECTOR_DIM, dtype=np.float32)
+    for buckets in features:
+        feature_df[np.unique(buckets)] += 1
+    arrays["vector_idf"] = (np.log((1.0 + doc_count) / (1.0 + feature_df)) + 1.0).astype(np.float32)
+    arrays["vectors"] = np.vstack([_embed(text, arrays["vector_idf"]) for text in texts]).astype(np.float32)
+
+    meta = {
+        "format": INDEX_FORMAT,
+        "source_hash": _source_hash(grades_file),
+        "vector_dim": VECTOR_DIM,
+        "avg_doc_length": float(arrays["doc_lengths"].mean()) if doc_count else 0.0,
+        "vocab": vocab,
+        "grades": grades
+    }
+
+    # Write into a temporary directory and swap it in so readers never see a partial index
+    temp_dir = index_dir.with_name(f"{index_dir.name}.{os.getpid()}.tmp")
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    temp_dir.mkdir(parents=True)
+    for name, array in arrays.items():
+        np.save(temp_dir / f"{name}.npy", array)
+    with open(temp_dir / "meta.json", "w", encoding="utf-8") as file:
+        json.dump(meta, file, ensure_ascii=False)
+
+    shutil.rmtree(index_dir, ignore_errors=True)
+    os.replace(temp_dir, index_dir)
+    return index_dir
+
+class SteelSpecsIndex:
+    """
+    Loads the prebuilt index once per process with the arrays memory-mapped read-only
+    The index is rebuilt when it is missing or older than steel_grades.yaml.
+    """
+
+    def __init__(self, index_dir: Path = INDEX_DIR, grades_file: Path = GRADES_FILE):
+        self.index_dir = index_dir
+        self.grades_file = grades_file
+        self._lock = threading.Lock()
+        self._meta: Optional[Dict[str, Any]] = None
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._term_ids: Dict[str, int] = {}
+
+    def _read_meta(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.index_dir / "meta.json", encoding="utf-8") as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if meta.get("format") != INDEX_FORMAT or meta.get("source_hash") != _source_hash(self.grades_file):
+            return None
+        return meta
+
+    def load(self):
+        """Load the index on first use, building it if needed"""
+        if self._meta is not None:
+            return
+
+        with self._lock:
+            if self._meta is not None:
+                return
+
+            meta = self._read_meta()
+            if meta is None:
+                try:
+                    build_index(self.grades_file, self.index_dir)
+                except OSError as e:
+                    print(f"Warning: Could not write steel specs index: {e}")
+                meta = self._read_meta()
+                if meta is None:
+                    raise RuntimeError(f"Steel specs index unavailable at {self.index_dir}")
+
+            self._arrays = {name: np.load(self.index_dir / f"{name}.npy", mmap_mode="r") for name in ARRAYS}
+            self._term_ids = {term: i for i, term in enumerate(meta["vocab"])}
+            self._meta = meta
+
+    @property
+    def grades(self) -> List[Dict[str, Any]]:
+        self.load()
+        return self._meta["grades"]
+
+    def bm25_scores(self, query: str) -> np.ndarray:
+        """BM25 score of every grade for the query"""
+        self.load()
+        arrays = self._arrays
+        scores = np.zeros(len(self._meta["grades"]), dtype=np.float32)
+        avg_length = self._meta["avg_doc_length"] or 1.0
+
+        for term_id in {self._term_ids[token] for token in _tokens(query) if token in self._term_ids}:
+            start, end = arrays["term_offsets"][term_id], arrays["term_offsets"][term_id + 1]
+            docs = arrays["postings_docs"][start:end]
+            tf = arrays["postings_tf"][start:end]
+            norm = BM25_K1 * (1.0 - BM25_B + BM25_B * arrays["doc_lengths"][docs] / avg_length)
+            # Each document appears once per term, so plain fancy-index addition is safe
+            scores[docs] += arrays["idf"][term_id] * tf * (BM25_K1 + 1.0) / (tf + norm)
+
+        return scores
+
+    def vector_scores(self, query: str) -> np.ndarray:
+        """Cosine similarity of every grade to the query vector"""
+        self.load()
+        return self._arrays["vectors"] @ _embed(query, self._arrays["vector_idf"])
+
+    def search(self, query: str, k: int = 3) -> List[Dict[str, Any]]:
+        """Top-k grades by reciprocal rank fusion of the BM25 and vector rankings"""
+        self.load()
+        fused: Dict[int, float] = {}
+        ranks: Dict[str, Dict[int, int]] = {}
+
+        for name, scores, min_score in (
+            ("bm25", self.bm25_scores(query), 0.0),
+            ("vector", self.vector_scores(query), VECTOR_MIN_SCORE)
+        ):
+            order = np.argsort(-scores, kind="stable")[:CANDIDATES]
+            ranked = [int(doc) for doc in order if scores[doc] > min_score]
+            ranks[name] = {doc: rank for rank, doc in enumerate(ranked, start=1)}
+            for rank, doc in enumerate(ranked, start=1):
+                fused[doc] = fused.get(doc, 0.0) + 1.0 / (RRF_K + rank)
+
+        top = sorted(fused.items(), key=lambda item: -item[1])[:k]
+        return [
+            {
+                "grade": self._meta["grades"][doc],
+                "score": score,
+                "bm25_rank": ranks["bm25"].get(doc),
+                "vector_rank": ranks["vector"].get(doc)
+            }
+            for doc, score in top
+        ]
+
+# Global instance
+steel_specs_index = SteelSpecsIndex()
+
+# Convenience functions
+def search_steel_grades(query: str, k: int = 3) -> List[Dict[str, Any]]:
+    """Find the steel grades most relevant to a question"""
+    return steel_specs_index.search(query, k=k)
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    build_index()
+    built = time.perf_counter()
+    steel_specs_index.load()
+    steel_specs_index.search("warmup")
+    loaded = time.perf_counter()
+    search_steel_grades("What steel grade is best for marine applications?")
+    searched = time.perf_counter()
+    print(f"Steel specs index written to {INDEX_DIR} ({len(steel_specs_index.grades)} grades)")
+    print(f"Build: {(built - start) * 1000:.1f} ms | Load: {(loaded - built) * 1000:.2f} ms | Query: {(searched - loaded) * 1000:.2f} ms")
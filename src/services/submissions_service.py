@@ -0,0 +1,242 @@
+"""
+Submissions Repository
+Local indexed store for use case submissions and their review status
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_STATUS = "Under Review"
+
+class SubmissionsRepository:
+    """SQLite-backed store of use case submissions, indexed by submitter email"""
+
+    def __init__(self, db_path: str = "static/data/submissions.db", sync_interval: int = 300):
+        # Get the absolute path relative to the project root
+        project_root = Path(__file__).parent.parent.parent
+        self.db_path = project_root / db_path
+        self.sync_interval = sync_interval  # Minimum seconds between Sheet status syncs
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._last_sync = 0.0
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every write, for downstream caches"""
+        return self._version
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Open the database lazily and make sure the schema exists"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS submissions (
+                    submission_id TEXT PRIMARY KEY,
+                    submitter_email TEXT NOT NULL,
+                    submitter_name TEXT,
+                    title TEXT,
+                    department TEXT,
+                    business_unit TEXT,
+                    priority TEXT,
+                    status TEXT NOT NULL,
+                    submitted_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    payload TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_submissions_email_date
+                    ON submissions (submitter_email, submitted_at DESC);
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+            self._conn = conn
+        return self._conn
+
+    def add_submission(self, submission_data: Dict, status: str = DEFAULT_STATUS) -> str:
+        """Store a submission and return its ID"""
+        submission_id = submission_data.get('submission_id') or uuid.uuid4().hex
+        submitted_at = submission_data.get('submission_date') or datetime.now().isoformat()
+
+        with self._lock:
+            conn = self._get_connection()
+            with conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO submissions (
+                        submission_id, submitter_email, submitter_name, title, department,
+                        business_unit, priority, status, submitted_at, updated_at, payload
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        submission_id,
+                        _normalize_email(submission_data.get('submitter_email', '')),
+                        submission_data.get('submitter_name', ''),
+                        submission_data.get('use_case_title', ''),
+                        submission_data.get('department', ''),
+                        submission_data.get('business_unit', ''),
+                        submission_data.get('priority', ''),
+                        status,
+                        submitted_at,
+                        submitted_at,
+                        json.dumps(submission_data)
+                    )
+                )
+            self._version += 1
+
+        return submission_id
+
+    def get_submissions_by_email(self, email: str, page: int = 1, page_size: int = 10) -> List[Dict]:
+        """Get one page of a submitter's submissions, newest first"""
+        offset = max(page - 1, 0) * page_size
+
+        with self._lock:
+            rows = self._get_connection().execute(
+                """
+                SELECT * FROM submissions
+                WHERE submitter_email = ?
+                ORDER BY submitted_at DESC
+                LIMIT ? OFFSET ?
+                """,
+                (_normalize_email(email), page_size, offset)
+            ).fetchall()
+
+        return [_row_to_dict(row) for row in rows]
+
+    def count_submissions_by_email(self, email: str) -> int:
+        """Count a submitter's submissions"""
+        with self._lock:
+            row = self._get_connection().execute(
+                "SELECT COUNT(*) FROM submissions WHERE submitter_email = ?",
+                (_normalize_email(email),)
+            ).fetchone()
+
+        return row[0]
+
+    def get_submission(self, submission_id: str) -> Optional[Dict]:
+        """Get a single submission by ID"""
+        with self._lock:
+            row = self._get_connection().execute(
+                "SELECT * FROM submissions WHERE submission_id = ?",
+                (submission_id,)
+            ).fetchone()
+
+        return _row_to_dict(row) if row else None
+
+    def get_all_submissions(self) -> List[Dict]:
+        """Get every stored submission including the full payload"""
+        with self._lock:
+            rows = self._get_connection().execute(
+                "SELECT * FROM submissions ORDER BY submitted_at"
+            ).fetchall()
+
+        return [_row_to_dict(row, include_payload=True) for row in rows]
+
+    def apply_status_updates(self, updates: List[Dict]) -> int:
+        """
+        Apply status changes synced back from the Sheet
+        Each update needs submission_id, status and updated_at; older updates are ignored.
+        Returns the number of submissions changed.
+        """
+        if not updates:
+            return 0
+
+        changed = 0
+        cursor = self.get_sync_cursor()
+
+        with self._lock:
+            conn = self._get_connection()
+            with conn:
+                for update in updates:
+                    updated_at = update.get('updated_at') or datetime.now().isoformat()
+                    result = conn.execute(
+                        """
+                        UPDATE submissions SET status = ?, updated_at = ?
+                        WHERE submission_id = ? AND updated_at <= ? AND status != ?
+                        """,
+                        (update['status'], updated_at, update['submission_id'], updated_at, update['status'])
+                    )
+                    changed += result.rowcount
+                    if cursor is None or updated_at > cursor:
+                        cursor = updated_at
+
+                conn.execute(
+                    "INSERT OR REPLACE INTO sync_state (key, value) VALUES ('status_cursor', ?)",
+                    (cursor,)
+                )
+            if changed:
+                self._version += 1
+
+        return changed
+
+    def get_sync_cursor(self) -> Optional[str]:
+        """Get the timestamp of the newest status update applied so far"""
+        with self._lock:
+            row = self._get_connection().execute(
+                "SELECT value FROM sync_state WHERE key = 'status_cursor'"
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def sync_statuses(self, fetch_updates: Callable[[Optional[str]], List[Dict]], force: bool = False) -> int:
+        """
+        Pull status changes newer than the sync cursor, at most once per sync interval
+        Returns the number of submissions changed.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_sync < self.sync_interval:
+            return 0
+
+        self._last_sync = now
+        return self.apply_status_updates(fetch_updates(self.get_sync_cursor()))
+
+def _normalize_email(email: str) -> str:
+    """Normalize an email address for indexing"""
+    return (email or '').strip().lower()
+
+def _row_to_dict(row: sqlite3.Row, include_payload: bool = False) -> Dict:
+    """Convert a database row into the submission dict used by the pages"""
+    submission = {
+        "id": row['submission_id'],
+        "title": row['title'],
+        "department": row['department'],
+        "business_unit": row['business_unit'],
+        "status": row['status'],
+        "priority": row['priority'],
+        "date": row['submitted_at'][:10],
+        "submitted_at": row['submitted_at'],
+        "updated_at": row['updated_at'],
+        "submitter_name": row['submitter_name'],
+        "submitter_email": row['submitter_email']
+    }
+
+    if include_payload:
+        submission["payload"] = json.loads(row['payload'] or '{}')
+
+    return submission
+
+# Global instance
+submissions_repository = SubmissionsRepository()
+
+# Convenience functions
+def record_submission(submission_data: Dict) -> str:
+    """Store a successful submission"""
+    return submissions_repository.add_submission(submission_data)
+
+def get_submissions_for_user(email: str, page: int = 1, page_size: int = 10) -> List[Dict]:
+    """Get one page of a user's submissions"""
+    return submissions_repository.get_submissions_by_email(email, page, page_size)
+
+def count_submissions_for_user(email: str) -> int:
+    """Count a user's submissions"""
+    return submissions_repository.count_submissions_by_email(email)
@@ -0,0 +1,208 @@
+"""
+Usage Service
+Append-only ledger of agent invocations in SQLite with hourly and daily rollups for the dashboards
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.services.analytics_store import GRANULARITIES, bucket_start, range_start
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token) for providers that do not report usage"""
+    return max(1, round(len(text) / 4)) if text else 0
+
+# Rebuilds the rollups from the event log (bucket keys match analytics_store.bucket_start)
+REBUILD_ROLLUPS_SQL = """
+    INSERT INTO usage_rollups
+        (granularity, bucket, agent_id, calls, errors, cached, answered_latency, input_tokens, output_tokens, cost)
+    SELECT granularity, bucket, agent_id, COUNT(*), SUM(status = 'error'), SUM(status = 'cached'),
+           SUM(CASE WHEN status = 'success' THEN latency ELSE 0 END),
+           SUM(input_tokens), SUM(output_tokens), SUM(cost)
+    FROM (
+        SELECT 'hour' AS granularity, substr(timestamp, 1, 13) || ':00' AS bucket, * FROM usage_events
+        UNION ALL
+        SELECT 'day', substr(timestamp, 1, 10), * FROM usage_events
+    )
+    GROUP BY granularity, bucket, agent_id
+"""
+
+class UsageLedger:
+    """
+    Every call is appended to usage_events and folded into usage_rollups in the same
+    transaction, so dashboard queries read a handful of rollup rows instead of the raw log.
+    Rollups keep latency only for answered calls (not failed, not served from cache), so the
+    average is a real response time however often the cache is hit.
+    """
+
+    def __init__(self, db_path: str = "static/data/agents/usage.db"):
+        # Get the absolute path relative to the project root
+        project_root = Path(__file__).parent.parent.parent
+        self.db_path = project_root / db_path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Open the database lazily and make sure the schema exists"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS usage_events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    agent_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    latency REAL NOT NULL,
+                    input_tokens INTEGER NOT NULL,
+                    output_tokens INTEGER NOT NULL,
+                    cost REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS usage_rollups (
+                    granularity TEXT NOT NULL,
+                    bucket TEXT NOT NULL,
+                    agent_id TEXT NOT NULL,
+                    calls INTEGER NOT NULL,
+                    errors INTEGER NOT NULL,
+                    cached INTEGER NOT NULL,
+                    answered_latency REAL NOT NULL,
+                    input_tokens INTEGER NOT NULL,
+                    output_tokens INTEGER NOT NULL,
+                    cost REAL NOT NULL,
+                    PRIMARY KEY (granularity, bucket, agent_id)
+                );
+            """)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(usage_rollups)")}
+            if "answered_latency" not in columns:
+                # Rollups from before answered_latency: derive them again from the event log
+                with conn:
+                    conn.execute("DROP TABLE usage_rollups")
+                conn.close()
+                return self._get_connection()
+            if not conn.execute("SELECT 1 FROM usage_rollups LIMIT 1").fetchone():
+                with conn:
+                    conn.execute(REBUILD_ROLLUPS_SQL)
+            self._conn = conn
+        return self._conn
+
+    def record(self, agent_id: str, status: str, latency: float, input_tokens: int = 0,
+               output_tokens: int = 0, cost: float = 0.0, timestamp: Optional[str] = None):
+        """Append one invocation and update its hour and day rollups"""
+        timestamp = timestamp or datetime.now(timezone.utc).isoformat()
+        errors, cached = int(status == "error"), int(status == "cached")
+        answered_latency = latency if status == "success" else 0.0
+
+        try:
+            with self._lock:
+                conn = self._get_connection()
+                with conn:
+                    conn.execute(
+                        """
+                        INSERT INTO usage_events (timestamp, agent_id, status, latency, input_tokens, output_tokens, cost)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (timestamp, agent_id, status, latency, input_tokens, output_tokens, cost)
+                    )
+                    conn.executemany(
+                        """
+                        INSERT INTO usage_rollups
+                            (granularity, bucket, agent_id, calls, errors, cached, answered_latency, input_tokens, output_tokens, cost)
+                        VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT (granularity, bucket, agent_id) DO UPDATE SET
+                            calls = calls + 1,
+                            errors = errors + excluded.errors,
+                            cached = cached + excluded.cached,
+                            answered_latency = answered_latency + excluded.answered_latency,
+                            input_tokens = input_tokens + excluded.input_tokens,
+                            output_tokens = output_tokens + excluded.output_tokens,
+                            cost = cost + excluded.cost
+                        """,
+                        [
+                            (granularity, bucket_start(timestamp, granularity), agent_id,
+                             errors, cached, answered_latency, input_tokens, output_tokens, cost)
+                            for granularity in GRANULARITIES
+                        ]
+                    )
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: Could not record usage for {agent_id}: {e}")
+
+    def _read(self, query: str, params: Tuple) -> List[Tuple]:
+        """Run a dashboard query; an unavailable ledger reads as empty rather than failing the page"""
+        try:
+            with self._lock:
+                return self._get_connection().execute(query, params).fetchall()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: Could not read usage ledger: {e}")
+            return []
+
+    def get_totals(self, granularity: str = "day", start: str = "", agent_id: Optional[str] = None) -> Dict[str, float]:
+        """Summed usage since a bucket key, optionally for one agent"""
+        query = """
+            SELECT COALESCE(SUM(calls), 0), COALESCE(SUM(errors), 0), COALESCE(SUM(cached), 0),
+                   COALESCE(SUM(answered_latency), 0), COALESCE(SUM(input_tokens), 0),
+                   COALESCE(SUM(output_tokens), 0), COALESCE(SUM(cost), 0)
+            FROM usage_rollups WHERE granularity = ? AND bucket >= ?
+        """
+        params: Tuple = (granularity, start)
+        if agent_id:
+            query += " AND agent_id = ?"
+            params += (agent_id,)
+
+        rows = self._read(query, params)
+        calls, errors, cached, latency, input_tokens, output_tokens, cost = rows[0] if rows else (0,) * 7
+        answered = calls - errors - cached
+        return {
+            "calls": calls,
+            "errors": errors,
+            "cached": cached,
+            "avg_latency": latency / answered if answered else None,
+            "tokens": input_tokens + output_tokens,
+            "cost": cost
+        }
+
+    def get_agent_breakdown(self, granularity: str = "day", start: str = "") -> List[Tuple[str, int, int, float]]:
+        """(agent_id, calls, tokens, cost) per agent since a bucket key, busiest first"""
+        return self._read(
+            """
+            SELECT agent_id, SUM(calls) AS total, SUM(input_tokens + output_tokens), SUM(cost)
+            FROM usage_rollups WHERE granularity = ? AND bucket >= ?
+            GROUP BY agent_id ORDER BY total DESC
+            """,
+            (granularity, start)
+        )
+
+    def get_series(self, agent_id: str, granularity: str = "hour", start: str = "") -> List[Tuple[str, int, int]]:
+        """(bucket, calls, errors) for one agent since a bucket key"""
+        return self._read(
+            """
+            SELECT bucket, calls, errors FROM usage_rollups
+            WHERE granularity = ? AND agent_id = ? AND bucket >= ?
+            ORDER BY bucket
+            """,
+            (granularity, agent_id, start)
+        )
+
+# Global instance
+usage_ledger = UsageLedger()
+
+# Convenience functions
+def record_agent_usage(agent_id: str, status: str, latency: float, input_tokens: int = 0,
+                       output_tokens: int = 0, cost: float = 0.0):
+    """Record one agent invocation in the ledger"""
+    usage_ledger.record(agent_id, status, latency, input_tokens, output_tokens, cost)
+
+def get_usage_summary(days: Optional[int] = None, agent_id: Optional[str] = None) -> Dict[str, float]:
+    """Usage totals over the last N days (all time when None)"""
+    return usage_ledger.get_totals("day", range_start(days, "day") if days is not None else "", agent_id)
+
+def get_usage_breakdown(days: int = 7) -> List[Tuple[str, int, int, float]]:
+    """Per-agent (agent_id, calls, tokens, cost) over the last N days"""
+    return usage_ledger.get_agent_breakdown("day", range_start(days, "day"))
+
+def get_agent_usage_series(agent_id: str, hours: int = 24) -> List[Tuple[str, int, int]]:
+    """Hourly (bucket, calls, errors) for one agent over the last N hours"""
+    return usage_ledger.get_series(agent_id, "hour", range_start(hours / 24, "hour"))
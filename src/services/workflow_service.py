@@ -0,0 +1,272 @@
+"""
+Workflow Service
+Runs multi-agent workflows as a DAG of steps on the shared event loop, with independent steps in parallel
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.config.settings import get_agent_config
+from src.utils.async_runner import submit
+
+MAX_RUNS = 32  # Finished runs kept for display
+
+StepHandler = Callable[["WorkflowStep", Dict[str, Any]], Awaitable[Any]]
+
+class WorkflowError(Exception):
+    """Raised for workflows that cannot be scheduled (cycles, unknown dependencies)"""
+
+@dataclass(frozen=True)
+class WorkflowStep:
+    """One agent call in a workflow"""
+    id: str
+    agent: str
+    task: str
+    depends_on: Tuple[str, ...] = ()
+    duration: float = 1.0  # Expected seconds; used by the simulated handler
+    timeout: Optional[float] = None  # Overrides the run's timeout
+
+@dataclass
+class StepRun:
+    """Execution record of a step; times are seconds from the start of the run"""
+    step_id: str
+    status: str = "pending"  # pending, running, done, cached, failed, timed_out, skipped, cancelled
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status in ("done", "cached")
+
+    @property
+    def duration(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+@dataclass
+class WorkflowRun:
+    """A workflow running (or finished) on the event loop"""
+    run_id: str
+    name: str
+    steps: List[WorkflowStep]
+    status: str = "running"  # running, done, failed, cancelled
+    step_runs: Dict[str, StepRun] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: Optional[float] = None
+    _done: threading.Event = field(default_factory=threading.Event, repr=False)
+    _future: Optional[Future] = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def sequential_time(self) -> float:
+        """Time the executed steps would have taken one after another"""
+        return sum(step_run.duration for step_run in self.step_runs.values())
+
+    def critical_path(self) -> List[str]:
+        """Step ids on the chain that determined the end-to-end latency"""
+        finished = {step_id: step_run for step_id, step_run in self.step_runs.items() if step_run.finished is not None}
+        if not finished:
+            return []
+
+        steps = {step.id: step for step in self.steps}
+        path = [max(finished, key=lambda step_id: finished[step_id].finished)]
+        while True:
+            upstream = [step_id for step_id in steps[path[-1]].depends_on if step_id in finished]
+            if not upstream:
+                break
+            path.append(max(upstream, key=lambda step_id: finished[step_id].finished))
+        return list(reversed(path))
+
+def topological_order(steps: Sequence[WorkflowStep]) -> List[WorkflowStep]:
+    """Order steps so every step comes after its dependencies; raises WorkflowError for invalid graphs"""
+    by_id = {step.id: step for step in steps}
+    if len(by_id) != len(steps):
+        raise WorkflowError("Workflow step ids must be unique")
+
+    for step in steps:
+        unknown = [dependency for dependency in step.depends_on if dependency not in by_id]
+        if unknown:
+            raise WorkflowError(f"Step '{step.id}' depends on unknown steps: {', '.join(unknown)}")
+
+    remaining = {step.id: set(step.depends_on) for step in steps}
+    ordered = []
+    while remaining:
+        ready = [step_id for step_id, dependencies in remaining.items() if not dependencies]
+        if not ready:
+            raise WorkflowError(f"Workflow has a dependency cycle between: {', '.join(sorted(remaining))}")
+        for step_id in ready:
+            ordered.append(by_id[step_id])
+            del remaining[step_id]
+        for dependencies in remaining.values():
+            dependencies.difference_update(ready)
+    return ordered
+
+async def simulate_step(step: WorkflowStep, inputs: Dict[str, Any]) -> str:
+    """Default handler: stand in for an agent call with a jittered delay"""
+    await asyncio.sleep(step.duration * random.uniform(0.8, 1.3))
+    return f"{step.agent} completed: {step.task}"
+
+class WorkflowEngine:
+    """
+    Schedules each step as an asyncio task that starts as soon as its dependencies succeed
+    Steps run under per-step timeouts; a failed, timed out or cancelled step skips everything
+    downstream of it. Successful results are cached by workflow, step and upstream results, so
+    rerunning a workflow only executes steps whose inputs changed.
+    """
+
+    def __init__(self, handler: Optional[StepHandler] = None, cache_size: Optional[int] = None):
+        self.handler = handler or simulate_step
+        self._cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+        self._runs: Dict[str, WorkflowRun] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def cache_size(self) -> int:
+        if self._cache_size is None:
+            self._cache_size = get_agent_config().workflow_cache_max_entries
+        return self._cache_size
+
+    def start(self, name: str, steps: Sequence[WorkflowStep], timeout: Optional[float] = None,
+              use_cache: bool = True, handler: Optional[StepHandler] = None) -> WorkflowRun:
+        """Validate the workflow and start it in the background; returns immediately"""
+        ordered = topological_order(steps)
+        timeout = timeout or get_agent_config().workflow_step_timeout
+
+        run = WorkflowRun(run_id=uuid.uuid4().hex, name=name, steps=ordered)
+        run.step_runs = {step.id: StepRun(step_id=step.id) for step in ordered}
+        with self._lock:
+            self._runs[run.run_id] = run
+            self._prune()
+
+        run._future = submit(self._execute(run, handler or self.handler, timeout, use_cache))
+        return run
+
+    async def _execute(self, run: WorkflowRun, handler: StepHandler, timeout: float, use_cache: bool):
+        tasks: Dict[str, asyncio.Task] = {}
+        for step in run.steps:
+            upstream = [tasks[dependency] for dependency in step.depends_on]
+            tasks[step.id] = asyncio.create_task(self._run_step(run, step, upstream, handler, timeout, use_cache))
+
+        try:
+            await asyncio.gather(*tasks.values())
+            run.status = "done" if all(step_run.succeeded for step_run in run.step_runs.values()) else "failed"
+        except asyncio.CancelledError:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            run.status = "cancelled"
+        finally:
+            run.finished_at = time.perf_counter()
+            run._done.set()
+
+    async def _run_step(self, run: WorkflowRun, step: WorkflowStep, upstream: List[asyncio.Task],
+                        handler: StepHandler, timeout: float, use_cache: bool) -> StepRun:
+        record = run.step_runs[step.id]
+        try:
+            upstream_runs = await asyncio.gather(*upstream)
+        except asyncio.CancelledError:
+            record.status = "cancelled"
+            raise
+
+        if not all(step_run.succeeded for step_run in upstream_runs):
+            record.status = "skipped"
+            return record
+
+        inputs = {step_run.step_id: step_run.result for step_run in upstream_runs}
+        key = self._cache_key(run.name, step, inputs)
+        record.started = time.perf_counter() - run.started_at
+
+        if use_cache and key in self._cache:
+            self._cache.move_to_end(key)
+            record.result = self._cache[key]
+            record.status = "cached"
+            record.finished = record.started
+            return record
+
+        record.status = "running"
+        try:
+            record.result = await asyncio.wait_for(handler(step, inputs), step.timeout or timeout)
+            record.status = "done"
+            self._cache[key] = record.result
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        except asyncio.TimeoutError:
+            record.status = "timed_out"
+            record.error = f"No result within {step.timeout or timeout:g}s"
+        except asyncio.CancelledError:
+            record.status = "cancelled"
+            raise
+        except Exception as e:
+            record.status = "failed"
+            record.error = f"{type(e).__name__}: {e}"
+        finally:
+            record.finished = time.perf_counter() - run.started_at
+        return record
+
+    @staticmethod
+    def _cache_key(workflow: str, step: WorkflowStep, inputs: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            {"workflow": workflow, "step": step.id, "agent": step.agent, "task": step.task, "inputs": inputs},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _prune(self):
+        """Forget the oldest finished runs beyond MAX_RUNS"""
+        for run_id in [run_id for run_id, run in self._runs.items() if run.finished][:max(0, len(self._runs) - MAX_RUNS)]:
+            del self._runs[run_id]
+
+    def get_run(self, run_id: str) -> Optional[WorkflowRun]:
+        """Look up a run by id"""
+        return self._runs.get(run_id)
+
+    def wait(self, run_id: str, timeout: Optional[float] = None) -> Optional[WorkflowRun]:
+        """Block up to timeout seconds for a run to finish"""
+        run = self.get_run(run_id)
+        if run is not None:
+            run._done.wait(timeout)
+        return run
+
+    def cancel(self, run_id: str):
+        """Cancel a run; running steps are interrupted and pending ones never start"""
+        run = self.get_run(run_id)
+        if run is not None and run._future is not None:
+            run._future.cancel()
+
+    def clear_cache(self):
+        """Drop all cached step results"""
+        self._cache.clear()
+
+# Global instance
+workflow_engine = WorkflowEngine()
+
+# Convenience functions
+def start_workflow(name: str, steps: Sequence[WorkflowStep], timeout: Optional[float] = None,
+                   use_cache: bool = True) -> WorkflowRun:
+    """Start a workflow in the background"""
+    return workflow_engine.start(name, steps, timeout=timeout, use_cache=use_cache)
+
+def get_workflow_run(run_id: str) -> Optional[WorkflowRun]:
+    """Get a workflow run by id"""
+    return workflow_engine.get_run(run_id)
@@ -0,0 +1,26 @@
+"""
+Background event loop
+One asyncio loop on a daemon thread shared by the services that run async work off the script thread
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+_lock = threading.Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared loop, starting its thread on first use"""
+    global _loop
+
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="async-runner", daemon=True).start()
+            _loop = loop
+    return _loop
+
+def submit(coroutine: Coroutine[Any, Any, Any]) -> Future:
+    """Schedule a coroutine on the shared loop from any thread"""
+    return asyncio.run_coroutine_threadsafe(coroutine, get_event_loop())
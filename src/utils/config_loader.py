@@ -3,114 +3,249 @@ Configuration loader utilities for YAML files
 """
 import yaml
 import os
-from typing import Dict, Any, Optional
+import threading
+import time
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, NamedTuple, Optional, Tuple
 from pathlib import Path
+from src.utils.config_snapshot import CONFIG_DIR as SNAPSHOT_CONFIG_DIR, YamlLoader, get_snapshot_config
+
+NEWS_SOURCE_GROUPS = ["primary_sources", "industry_sources", "research_sources", "social_sources", "enterprise_sources"]
+
+def freeze_config(value: Any) -> Any:
+    """Return a read-only view: dicts become mapping proxies and lists become tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze_config(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze_config(item) for item in value)
+    return value
+
+def build_config_indexes(config_file: str, config: Mapping[str, Any]) -> Mapping[str, Mapping]:
+    """Build the id/category lookup tables for a frozen config"""
+    indexes = {}
+    
+    if config_file == "agents.yaml":
+        agents_by_id = {}
+        # Live agents take precedence over demo agents with the same ID
+        for agent in config.get("live_agents", ()) + config.get("demo_agents", ()):
+            agents_by_id.setdefault(agent.get("id"), agent)
+        indexes["agents_by_id"] = MappingProxyType(agents_by_id)
+    
+    elif config_file == "learning_paths.yaml":
+        paths_by_id = {}
+        for path in config.get("learning_paths", ()):
+            paths_by_id.setdefault(path.get("id"), path)
+        indexes["paths_by_id"] = MappingProxyType(paths_by_id)
+    
+    elif config_file == "news_sources.yaml":
+        sources_by_category = {}
+        for source_group in NEWS_SOURCE_GROUPS:
+            for source in config.get(source_group, ()):
+                sources_by_category.setdefault(source.get("category"), []).append(source)
+        indexes["sources_by_category"] = MappingProxyType(
+            {category: tuple(sources) for category, sources in sources_by_category.items()}
+        )
+    
+    return MappingProxyType(indexes)
+
+class ConfigEntry(NamedTuple):
+    """A frozen config with the indexes built from it, published together"""
+    config: Mapping[str, Any]
+    indexes: Mapping[str, Mapping]
+    version: int
 
 class ConfigLoader:
     """Load and manage YAML configuration files"""
     
-    def __init__(self, config_dir: str = "src/config"):
+    def __init__(self, config_dir: str = "src/config", watch: bool = True, poll_interval: float = 2.0):
         # Get the absolute path relative to the project root
         project_root = Path(__file__).parent.parent.parent
         self.config_dir = project_root / config_dir
-        self._cache = {}
+        self._entries: Dict[str, ConfigEntry] = {}
+        self._mtimes = {}
+        self._versions = {}  # Reload counters; kept across clear_cache so versions never repeat
+        self._lock = threading.Lock()
+        
+        # Background change detection (stat polling, at most once per poll interval)
+        self.watch = watch
+        self.poll_interval = poll_interval
+        self._watcher = None
+    
+    def load_config(self, config_file: str, use_cache: bool = True) -> Mapping[str, Any]:
+        """
+        Load configuration from YAML file with caching
+        Cached configs are read-only views shared by all callers; use_cache=False returns a private dict.
+        """
+        if use_cache:
+            entry = self._entries.get(config_file)
+            if entry is not None:
+                return entry.config
+        
+        config, mtime = self._load_from_snapshot(config_file) if use_cache else (None, None)
+        if config is None:
+            config, mtime = self._parse_config(config_file)
+        
+        if use_cache:
+            config = self._swap_config(config_file, config, mtime)
+            self._start_watcher()
+        
+        return config
     
-    def load_config(self, config_file: str, use_cache: bool = True) -> Dict[str, Any]:
-        """Load configuration from YAML file with caching"""
-        if use_cache and config_file in self._cache:
-            return self._cache[config_file]
+    def _load_from_snapshot(self, config_file: str) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+        """Get a config from the precompiled snapshot when it covers this file"""
+        if self.config_dir.resolve() != SNAPSHOT_CONFIG_DIR.resolve():
+            return None, None
         
+        try:
+            mtime = (self.config_dir / config_file).stat().st_mtime_ns
+            return get_snapshot_config(config_file), mtime
+        except Exception as e:
+            print(f"Warning: Could not use config snapshot for {config_file}: {e}")
+            return None, None
+    
+    def _parse_config(self, config_file: str) -> Tuple[Dict[str, Any], int]:
+        """Parse a YAML file; returns the config and the mtime it was read at"""
         config_path = self.config_dir / config_file
         
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
         try:
+            mtime = config_path.stat().st_mtime_ns
             with open(config_path, 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
-                
-            if use_cache:
-                self._cache[config_file] = config
-                
-            return config
+                config = yaml.load(file, Loader=YamlLoader)
+            
+            return config, mtime
             
         except yaml.YAMLError as e:
             raise ValueError(f"Error parsing YAML file {config_file}: {e}")
     
-    def get_agents_config(self) -> Dict[str, Any]:
+    def _swap_config(self, config_file: str, config: Dict[str, Any], mtime: int) -> Mapping[str, Any]:
+        """
+        Publish a freshly parsed config; readers see either the old or the new one
+        The cached config is frozen and its lookup indexes are built here, once per version, and
+        stored with it as one entry so a single lookup never pairs a config with another's indexes.
+        """
+        frozen = freeze_config(config or {})
+        indexes = build_config_indexes(config_file, frozen)
+        
+        with self._lock:
+            version = self._versions.get(config_file, 0) + 1
+            self._versions[config_file] = version
+            self._entries[config_file] = ConfigEntry(frozen, indexes, version)
+            self._mtimes[config_file] = mtime
+        
+        return frozen
+    
+    def _get_index(self, config_file: str, index_name: str) -> Mapping:
+        """Get a lookup index for a config file, loading the file if needed"""
+        entry = self._entries.get(config_file)
+        if entry is None:
+            self.load_config(config_file)
+            entry = self._entries[config_file]
+        return entry.indexes.get(index_name, MappingProxyType({}))
+    
+    def get_config_version(self, config_file: str) -> int:
+        """Get a counter that changes every time the config file is (re)loaded"""
+        entry = self._entries.get(config_file)
+        return entry.version if entry is not None else 0
+    
+    def check_for_changes(self) -> List[str]:
+        """
+        Reparse cached files whose mtime changed and swap them in
+        A file that fails to parse or disappears keeps its last good config.
+        Returns the files that were reloaded.
+        """
+        reloaded = []
+        
+        for config_file, cached_mtime in list(self._mtimes.items()):
+            try:
+                mtime = (self.config_dir / config_file).stat().st_mtime_ns
+            except OSError:
+                # File missing (e.g. mid-save); keep the last good config
+                continue
+            
+            if mtime == cached_mtime:
+                continue
+            
+            try:
+                config, mtime = self._parse_config(config_file)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not reload {config_file}, keeping previous version: {e}")
+                # Don't retry until the file changes again
+                self._mtimes[config_file] = mtime
+                continue
+            
+            self._swap_config(config_file, config, mtime)
+            reloaded.append(config_file)
+        
+        return reloaded
+    
+    def _start_watcher(self):
+        """Start the background watcher thread once"""
+        if not self.watch or self._watcher is not None:
+            return
+        
+        with self._lock:
+            if self._watcher is None:
+                self._watcher = threading.Thread(target=self._watch_loop, name="config-watcher", daemon=True)
+                self._watcher.start()
+    
+    def _watch_loop(self):
+        """Poll cached files for changes so reloads never happen on the request path"""
+        while True:
+            time.sleep(self.poll_interval)
+            self.check_for_changes()
+    
+    def get_agents_config(self) -> Mapping[str, Any]:
         """Get agents configuration"""
         return self.load_config("agents.yaml")
     
-    def get_news_sources_config(self) -> Dict[str, Any]:
+    def get_news_sources_config(self) -> Mapping[str, Any]:
         """Get news sources configuration"""
         return self.load_config("news_sources.yaml")
     
-    def get_learning_paths_config(self) -> Dict[str, Any]:
+    def get_learning_paths_config(self) -> Mapping[str, Any]:
         """Get learning paths configuration"""
         return self.load_config("learning_paths.yaml")
     
-    def get_live_agents(self) -> list:
+    def get_live_agents(self) -> tuple:
         """Get list of live agents"""
         config = self.get_agents_config()
-        return config.get("live_agents", [])
+        return config.get("live_agents", ())
     
-    def get_demo_agents(self) -> list:
+    def get_demo_agents(self) -> tuple:
         """Get list of demo agents"""
         config = self.get_agents_config()
-        return config.get("demo_agents", [])
+        return config.get("demo_agents", ())
     
-    def get_agent_by_id(self, agent_id: str) -> Optional[Dict[str, Any]]:
+    def get_agent_by_id(self, agent_id: str) -> Optional[Mapping[str, Any]]:
         """Get specific agent by ID"""
-        config = self.get_agents_config()
-        
-        # Search in live agents
-        for agent in config.get("live_agents", []):
-            if agent.get("id") == agent_id:
-                return agent
-        
-        # Search in demo agents
-        for agent in config.get("demo_agents", []):
-            if agent.get("id") == agent_id:
-                return agent
-        
-        return None
+        return self._get_index("agents.yaml", "agents_by_id").get(agent_id)
     
-    def get_news_sources_by_category(self, category: str) -> list:
+    def get_news_sources_by_category(self, category: str) -> tuple:
         """Get news sources filtered by category"""
-        config = self.get_news_sources_config()
-        sources = []
-        
-        for source_category in ["primary_sources", "industry_sources", "research_sources", "social_sources", "enterprise_sources"]:
-            for source in config.get(source_category, []):
-                if source.get("category") == category:
-                    sources.append(source)
-        
-        return sources
+        return self._get_index("news_sources.yaml", "sources_by_category").get(category, ())
     
-    def get_learning_path_by_id(self, path_id: str) -> Optional[Dict[str, Any]]:
+    def get_learning_path_by_id(self, path_id: str) -> Optional[Mapping[str, Any]]:
         """Get specific learning path by ID"""
-        config = self.get_learning_paths_config()
-        
-        for path in config.get("learning_paths", []):
-            if path.get("id") == path_id:
-                return path
-        
-        return None
+        return self._get_index("learning_paths.yaml", "paths_by_id").get(path_id)
     
-    def get_quick_courses(self) -> list:
+    def get_quick_courses(self) -> tuple:
         """Get list of quick courses"""
         config = self.get_learning_paths_config()
-        return config.get("quick_courses", [])
+        return config.get("quick_courses", ())
     
     def reload_config(self, config_file: str):
-        """Reload configuration file and clear cache"""
-        if config_file in self._cache:
-            del self._cache[config_file]
-        return self.load_config(config_file, use_cache=False)
+        """Reload configuration file now and swap it into the cache"""
+        config, mtime = self._parse_config(config_file)
+        return self._swap_config(config_file, config, mtime)
     
     def clear_cache(self):
         """Clear all cached configurations"""
-        self._cache.clear()
+        with self._lock:
+            self._entries.clear()
+            self._mtimes.clear()
 
 # Global instance
 config_loader = ConfigLoader()
@@ -138,4 +273,7 @@ def get_learning_path_by_id(path_id: str):
     return config_loader.get_learning_path_by_id(path_id)
 
 def get_quick_courses():
-    return config_loader.get_quick_courses()
\ No newline at end of file
+    return config_loader.get_quick_courses()
+
+def get_config_version(config_file: str) -> int:
+    return config_loader.get_config_version(config_file)
\ No newline at end of file
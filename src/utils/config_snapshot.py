@@ -0,0 +1,199 @@
+"""
+Precompiled configuration snapshot
+Parses the YAML configs and settings once and caches them as JSON keyed by content hash
+Credentials are left out of the snapshot and read from the environment on every load.
+
+Build ahead of time (e.g. in the container image) with:
+    python -m src.utils.config_snapshot
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from src.config.settings import ENV_FILE, SECRET_FIELDS
+
+# C-accelerated loader when libyaml is available
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+CONFIG_DIR = PROJECT_ROOT / "src" / "config"
+YAML_FILES = ("agents.yaml", "news_sources.yaml", "learning_paths.yaml")
+SETTINGS_FILE = CONFIG_DIR / "settings.py"
+SNAPSHOT_PATH = PROJECT_ROOT / ".cache" / "config_snapshot.json"
+LEGACY_SNAPSHOT_PATH = PROJECT_ROOT / ".cache" / "config_snapshot.pickle"  # Held credentials; removed on write
+SNAPSHOT_FORMAT = 2
+
+_lock = threading.Lock()
+_snapshot: Optional[Dict[str, Any]] = None
+
+def parse_yaml(path: Path) -> Any:
+    """Parse a YAML file with the fastest available safe loader"""
+    with open(path, 'r', encoding='utf-8') as file:
+        return yaml.load(file, Loader=YamlLoader)
+
+def _source_paths() -> Tuple[Path, ...]:
+    # settings.py is included so new settings fields invalidate the snapshot
+    return tuple(CONFIG_DIR / name for name in YAML_FILES) + (ENV_FILE, SETTINGS_FILE)
+
+def _fingerprint() -> List:
+    """Cheap change detector: [mtime, size] of every source, None for missing files (JSON-shaped)"""
+    fingerprint = []
+    for path in _source_paths():
+        try:
+            stat = path.stat()
+            fingerprint.append([stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            fingerprint.append(None)
+    return fingerprint
+
+def _content_hash() -> str:
+    """Hash of every source file's content"""
+    digest = hashlib.sha256()
+    for path in _source_paths():
+        digest.update(path.name.encode())
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+def _settings_classes() -> Dict[str, type]:
+    from src.config import settings
+    return {cls.__name__: cls for cls in settings.SETTINGS_CLASSES}
+
+def _field_env_names(name: str, field) -> Tuple[str, ...]:
+    """Environment variables a settings field can be read from"""
+    extra = field.json_schema_extra
+    if isinstance(extra, dict) and extra.get("env"):
+        return (name.upper(), str(extra["env"]).upper())
+    return (name.upper(),)
+
+def _env_keys() -> List[str]:
+    """Environment variables the non-secret settings fields can read"""
+    keys = set()
+    for class_name, cls in _settings_classes().items():
+        secrets = SECRET_FIELDS.get(class_name, ())
+        for name, field in cls.model_fields.items():
+            if name not in secrets:
+                keys.update(_field_env_names(name, field))
+    return sorted(keys)
+
+def _read_secrets(settings_class: type) -> Dict[str, Any]:
+    """Current credential values from the environment (.env is loaded into it by settings.py)"""
+    environ = {key.upper(): value for key, value in os.environ.items()}
+    secrets = {}
+    for name in SECRET_FIELDS.get(settings_class.__name__, ()):
+        field = settings_class.model_fields[name]
+        value = next((environ[key] for key in _field_env_names(name, field) if key in environ), field.default)
+        secrets[name] = value
+    return secrets
+
+def _env_signature(keys: List[str]) -> str:
+    """Hash of the current values of the given environment variables"""
+    environ = {key.upper(): value for key, value in os.environ.items()}
+    digest = hashlib.sha256()
+    for key in keys:
+        digest.update(f"{key}={environ.get(key, '')}\0".encode())
+    return digest.hexdigest()
+
+def _is_current(snapshot: Dict[str, Any], fingerprint: List) -> bool:
+    return snapshot["fingerprint"] == fingerprint and snapshot["env_signature"] == _env_signature(snapshot["env_keys"])
+
+def build_snapshot() -> Dict[str, Any]:
+    """Parse and validate every source and write a fresh snapshot"""
+    configs = {}
+    for name in YAML_FILES:
+        path = CONFIG_DIR / name
+        if path.exists():
+            configs[name] = parse_yaml(path)
+
+    settings = {
+        name: cls().model_dump(mode="json", exclude=set(SECRET_FIELDS.get(name, ())))
+        for name, cls in _settings_classes().items()
+    }
+    env_keys = _env_keys()
+
+    snapshot = {
+        "format": SNAPSHOT_FORMAT,
+        "fingerprint": _fingerprint(),
+        "content_hash": _content_hash(),
+        "env_keys": env_keys,
+        "env_signature": _env_signature(env_keys),
+        "configs": configs,
+        "settings": settings
+    }
+    _write_snapshot(snapshot)
+    return snapshot
+
+def _write_snapshot(snapshot: Dict[str, Any]):
+    """Write atomically (owner-only permissions) so concurrent workers never read a partial file"""
+    try:
+        data = json.dumps(snapshot)
+        SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = SNAPSHOT_PATH.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            file.write(data)
+        os.replace(temp_path, SNAPSHOT_PATH)
+        LEGACY_SNAPSHOT_PATH.unlink(missing_ok=True)
+    except (OSError, TypeError, ValueError) as e:
+        # Read-only deployments (or configs JSON cannot hold) still work; they just reparse on start
+        print(f"Warning: Could not write config snapshot: {e}")
+
+def _read_snapshot() -> Optional[Dict[str, Any]]:
+    try:
+        with open(SNAPSHOT_PATH, 'r', encoding='utf-8') as file:
+            snapshot = json.load(file)
+        return snapshot if snapshot.get("format") == SNAPSHOT_FORMAT else None
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def load_snapshot() -> Dict[str, Any]:
+    """
+    Get the current snapshot, rebuilding only when the sources changed
+    Unchanged (mtime, size) skips hashing; a touched but identical file only refreshes the fingerprint.
+    """
+    global _snapshot
+
+    with _lock:
+        fingerprint = _fingerprint()
+        if _snapshot is not None and _is_current(_snapshot, fingerprint):
+            return _snapshot
+
+        snapshot = _read_snapshot()
+        if snapshot is None or snapshot["env_signature"] != _env_signature(snapshot["env_keys"]):
+            snapshot = build_snapshot()
+        elif snapshot["fingerprint"] != fingerprint:
+            if snapshot["content_hash"] == _content_hash():
+                snapshot["fingerprint"] = fingerprint
+                _write_snapshot(snapshot)
+            else:
+                snapshot = build_snapshot()
+
+        _snapshot = snapshot
+        return snapshot
+
+def get_snapshot_config(config_file: str) -> Optional[Any]:
+    """Get a parsed YAML config from the snapshot, or None if it is not part of it"""
+    return load_snapshot()["configs"].get(config_file)
+
+def get_snapshot_settings(settings_class: type):
+    """Get a settings instance from the snapshot without revalidating; credentials come from the environment"""
+    values = load_snapshot()["settings"].get(settings_class.__name__)
+    if values is None:
+        return settings_class()
+    return settings_class.model_construct(**values, **_read_secrets(settings_class))
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    build_snapshot()
+    built = time.perf_counter()
+    _snapshot = None
+    load_snapshot()
+    loaded = time.perf_counter()
+    print(f"Config snapshot written to {SNAPSHOT_PATH}")
+    print(f"Build: {(built - start) * 1000:.1f} ms | Load: {(loaded - built) * 1000:.2f} ms | YAML loader: {YamlLoader.__name__}")
@@ -1,30 +1,79 @@
 """
 CSS loader utilities for Streamlit
 """
+import re
+import time
 import streamlit as st
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+from src.utils.profiler import record_cache
+
+# Quoted strings and comments, matched together so a quote inside a comment (or "/*" inside a string) is not misread
+_CSS_STRINGS_AND_COMMENTS = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|/\*.*?\*/)""", re.DOTALL)
+_CSS_WHITESPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION_SPACES = re.compile(r"\s*([{};,>])\s*")
+_CSS_DECLARATION_COLONS = re.compile(r"(?<=[{;])([\w-]+)\s*:\s*")
+
+def _minify_css_code(code: str) -> str:
+    """Minify CSS that contains no strings or comments"""
+    code = _CSS_WHITESPACE.sub(" ", code)
+    code = _CSS_PUNCTUATION_SPACES.sub(r"\1", code)
+    code = _CSS_DECLARATION_COLONS.sub(r"\1:", code)
+    return code.replace(";}", "}")
+
+def minify_css(css_content: str) -> str:
+    """Strip comments and redundant whitespace from CSS, leaving quoted strings untouched"""
+    minified, code = [], []
+    # split() alternates code (even indexes) with the captured strings and comments (odd indexes)
+    for i, part in enumerate(_CSS_STRINGS_AND_COMMENTS.split(css_content)):
+        if i % 2 == 0:
+            code.append(part)
+        elif not part.startswith("/*"):
+            minified += [_minify_css_code("".join(code)), part]
+            code = []
+    minified.append(_minify_css_code("".join(code)))
+    return "".join(minified).strip()
 
 class CSSLoader:
     """Load and inject CSS styles into Streamlit"""
     
-    def __init__(self, css_dir: str = "static/css"):
+    def __init__(self, css_dir: str = "static/css", check_interval: float = 2.0):
         # Get the absolute path relative to the project root
         project_root = Path(__file__).parent.parent.parent
         self.css_dir = project_root / css_dir
+        
+        # css_file -> (mtime, raw css, minified css); files are re-stat'ed at most once per interval
+        self.check_interval = check_interval
+        self._cache: Dict[str, Tuple[int, str, str]] = {}
+        self._last_checked: Dict[str, float] = {}
     
-    def load_css_file(self, css_file: str) -> str:
-        """Load CSS content from file"""
+    def load_css_file(self, css_file: str, minify: bool = False) -> str:
+        """Load CSS content from file, served from memory while the file is unchanged"""
+        now = time.monotonic()
+        cached = self._cache.get(css_file)
+        
+        if cached and now - self._last_checked.get(css_file, 0.0) < self.check_interval:
+            record_cache("css", True)
+            return cached[2] if minify else cached[1]
+        
         css_path = self.css_dir / css_file
         
         if not css_path.exists():
             raise FileNotFoundError(f"CSS file not found: {css_path}")
         
         try:
-            with open(css_path, 'r', encoding='utf-8') as file:
-                return file.read()
+            mtime = css_path.stat().st_mtime_ns
+            record_cache("css", bool(cached) and cached[0] == mtime)
+            if not cached or cached[0] != mtime:
+                with open(css_path, 'r', encoding='utf-8') as file:
+                    css_content = file.read()
+                cached = (mtime, css_content, minify_css(css_content))
+                self._cache[css_file] = cached
         except Exception as e:
             raise ValueError(f"Error reading CSS file {css_file}: {e}")
+        
+        self._last_checked[css_file] = now
+        return cached[2] if minify else cached[1]
     
     def inject_css(self, css_content: str, unsafe_allow_html: bool = True):
         """Inject CSS into Streamlit app"""
@@ -33,15 +82,15 @@ class CSSLoader:
             unsafe_allow_html=unsafe_allow_html
         )
     
-    def load_and_inject_css(self, css_file: str):
+    def load_and_inject_css(self, css_file: str, minify: bool = True):
         """Load CSS file and inject into Streamlit"""
-        css_content = self.load_css_file(css_file)
+        css_content = self.load_css_file(css_file, minify=minify)
         self.inject_css(css_content)
     
-    def load_main_css(self):
+    def load_main_css(self, minify: bool = True):
         """Load main CSS file"""
         try:
-            self.load_and_inject_css("main.css")
+            self.load_and_inject_css("main.css", minify=minify)
         except Exception as e:
             # If CSS fails to load, continue without styling
             print(f"Warning: Could not load main CSS: {e}")
@@ -55,17 +104,17 @@ class CSSLoader:
 css_loader = CSSLoader()
 
 # Convenience functions
-def load_main_css():
+def load_main_css(minify: bool = True):
     """Load main CSS styles"""
-    css_loader.load_main_css()
+    css_loader.load_main_css(minify=minify)
 
 def inject_custom_css(css_rules: str):
     """Inject custom CSS rules"""
     css_loader.inject_custom_css(css_rules)
 
-def load_css_file(css_file: str) -> str:
+def load_css_file(css_file: str, minify: bool = False) -> str:
     """Load CSS content from file"""
-    return css_loader.load_css_file(css_file)
+    return css_loader.load_css_file(css_file, minify=minify)
 
 # Common CSS utilities
 def get_branded_header_css(title: str, subtitle: str = None) -> str:
@@ -2,9 +2,11 @@
 Helper utilities for Aperam AI Hub
 """
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
 import json
+from src.services.analytics_service import track_event
 
 def initialize_session_state():
     """Initialize required session state variables"""
@@ -25,17 +27,29 @@ def reset_agent_view():
     if 'agent_view' in st.session_state:
         st.session_state.agent_view = 'main'
 
-def navigate_to_page(page_name: str):
-    """Navigate to a specific page"""
+def set_page(page_name: str, log_details: Optional[Dict[str, Any]] = None):
+    """
+    Switch page from a widget callback
+    Callbacks run before the script, so the click's own rerun renders the new page directly.
+    """
+    if log_details:
+        log_user_action("navigation", log_details)
     st.session_state.page = page_name
     reset_agent_view()
+
+def navigate_to_page(page_name: str):
+    """Navigate to a specific page outside of a widget callback"""
+    set_page(page_name)
     st.rerun()
 
+def render_back_button(key: str, page_name: str = "🏠 Home", label: str = "← Back to Home"):
+    """Render a button that navigates back without an extra rerun"""
+    st.button(label, key=key, on_click=set_page, args=(page_name,))
+
 def show_breadcrumb(current_page: str):
     """Show breadcrumb navigation"""
     if current_page != "🏠 Home":
-        if st.button("← Back to Home", key="breadcrumb"):
-            navigate_to_page("🏠 Home")
+        render_back_button("breadcrumb")
         st.markdown("---")
 
 def format_timestamp(timestamp: Optional[datetime] = None) -> str:
@@ -197,20 +211,19 @@ def create_download_button(content: str, filename: str, mime_type: str = "text/p
     )
 
 def log_user_action(action: str, details: Dict[str, Any] = None):
-    """Log user action for analytics (future: send to analytics service)"""
+    """Log user action for analytics (buffered and flushed in the background)"""
     if details is None:
         details = {}
     
+    # Background threads (monitors, flushers) have no Streamlit session
+    ctx = get_script_run_ctx()
+    
     log_entry = {
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "action": action,
         "details": details,
-        "page": st.session_state.get('page', 'Unknown')
+        "page": st.session_state.get('page', 'Unknown') if ctx else 'Unknown',
+        "session_id": ctx.session_id if ctx else None
     }
     
-    # For now, just add to session state
-    # In production, this would send to an analytics service
-    if 'user_actions' not in st.session_state:
-        st.session_state.user_actions = []
-    
-    st.session_state.user_actions.append(log_entry)
\ No newline at end of file
+    track_event(log_entry)
@@ -0,0 +1,133 @@
+"""
+Rerun profiler
+Opt-in wall time per section and cache hit/miss counts for each Streamlit rerun
+"""
+import cProfile
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.config.settings import get_app_config
+
+# Each session's script runs in its own thread, so the active profile is thread-local
+_local = threading.local()
+
+class RerunProfile:
+    """Timings collected during a single rerun"""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.started = time.perf_counter()
+        self.total_seconds: Optional[float] = None
+        # (depth, section name, seconds) in call order
+        self.sections: List[Optional[Tuple[int, str, float]]] = []
+        # cache name -> [hits, misses]
+        self.cache: Dict[str, List[int]] = {}
+        self.depth = 0
+        self.profile_path: Optional[Path] = None
+        self._cprofile: Optional[cProfile.Profile] = None
+
+def is_profiling_enabled() -> bool:
+    """Whether profiling is switched on in settings"""
+    return get_app_config().enable_profiling
+
+def get_current_profile() -> Optional[RerunProfile]:
+    """Get the profile of the rerun running in this thread, if any"""
+    return getattr(_local, "profile", None)
+
+def start_rerun(label: str = "rerun") -> Optional[RerunProfile]:
+    """Begin profiling a rerun; does nothing unless profiling is enabled"""
+    # A rerun interrupted by st.rerun() never reached finish_rerun()
+    stale = get_current_profile()
+    if stale is not None and stale._cprofile is not None:
+        stale._cprofile.disable()
+    _local.profile = None
+
+    config = get_app_config()
+    if not config.enable_profiling:
+        return None
+
+    profile = RerunProfile(label)
+    if config.profile_dir:
+        profile._cprofile = cProfile.Profile()
+        profile._cprofile.enable()
+
+    _local.profile = profile
+    return profile
+
+def finish_rerun() -> Optional[RerunProfile]:
+    """Stop profiling the current rerun and dump the cProfile stats if configured"""
+    profile = get_current_profile()
+    if profile is None:
+        return None
+
+    _local.profile = None
+    profile.total_seconds = time.perf_counter() - profile.started
+
+    if profile._cprofile is not None:
+        profile._cprofile.disable()
+        profile.profile_path = _dump_profile(profile)
+        profile._cprofile = None
+
+    return profile
+
+def _dump_profile(profile: RerunProfile) -> Optional[Path]:
+    """Write cProfile stats to the profile directory (open with pstats or snakeviz)"""
+    try:
+        # Get the absolute path relative to the project root
+        profile_dir = Path(__file__).parent.parent.parent / get_app_config().profile_dir
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        slug = re.sub(r"[^a-z0-9]+", "-", profile.label.lower()).strip("-") or "rerun"
+        path = profile_dir / f"{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}-{slug}.prof"
+        profile._cprofile.dump_stats(str(path))
+        return path
+    except Exception as e:
+        print(f"Warning: Could not write profile: {e}")
+        return None
+
+@contextmanager
+def profile_section(name: str):
+    """Time a block as a named section of the current rerun"""
+    profile = get_current_profile()
+    if profile is None:
+        yield
+        return
+
+    # Reserve the slot so parents are listed before their children
+    index = len(profile.sections)
+    profile.sections.append(None)
+    depth = profile.depth
+    profile.depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.depth = depth
+        profile.sections[index] = (depth, name, time.perf_counter() - start)
+
+def profiled(name: Optional[str] = None) -> Callable:
+    """Decorator that times every call of a function as a section"""
+    def decorator(func: Callable) -> Callable:
+        section = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if get_current_profile() is None:
+                return func(*args, **kwargs)
+            with profile_section(section):
+                return func(*args, **kwargs)
+
+        return wrapper
+    return decorator
+
+def record_cache(cache: str, hit: bool):
+    """Count a cache hit or miss against the current rerun"""
+    profile = get_current_profile()
+    if profile is not None:
+        counts = profile.cache.setdefault(cache, [0, 0])
+        counts[0 if hit else 1] += 1
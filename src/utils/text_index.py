@@ -0,0 +1,134 @@
+"""
+Text index utilities
+Incrementally updated TF-IDF vectors with cosine similarity search in NumPy
+"""
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "for", "from", "has", "have",
+    "in", "into", "is", "it", "its", "of", "on", "or", "our", "that", "the", "their", "this",
+    "to", "was", "we", "will", "with", "use", "using", "based"
+})
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stop words or single characters"""
+    return [
+        token for token in TOKEN_PATTERN.findall((text or "").lower())
+        if len(token) > 1 and token not in STOP_WORDS
+    ]
+
+class TfidfIndex:
+    """
+    TF-IDF index with top-k cosine similarity search
+    Documents are appended incrementally; on the next query the (doc, term, tf)
+    entries are regrouped by term so scoring only touches the query's postings.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._vocab: Dict[str, int] = {}
+        self._df: List[int] = []
+        self._payloads: List[Any] = []
+        self._pending: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self._doc_flat = np.empty(0, dtype=np.int32)
+        self._term_flat = np.empty(0, dtype=np.int32)
+        self._tf_flat = np.empty(0, dtype=np.float32)
+        self._term_offsets = np.zeros(1, dtype=np.int64)
+        self._idf = np.empty(0, dtype=np.float32)
+        self._norms = np.empty(0, dtype=np.float32)
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def add(self, text: str, payload: Any = None) -> int:
+        """Add a document and return its position in the index"""
+        counts = Counter(tokenize(text))
+
+        with self._lock:
+            doc_id = len(self._payloads)
+            term_ids = np.empty(len(counts), dtype=np.int32)
+
+            for i, term in enumerate(counts):
+                term_id = self._vocab.get(term)
+                if term_id is None:
+                    term_id = len(self._vocab)
+                    self._vocab[term] = term_id
+                    self._df.append(0)
+                self._df[term_id] += 1
+                term_ids[i] = term_id
+
+            tf = 1.0 + np.log(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+            self._pending.append((np.full(len(counts), doc_id, dtype=np.int32), term_ids, tf))
+            self._payloads.append(payload)
+            self._dirty = True
+
+        return doc_id
+
+    def _refresh(self):
+        """Fold pending documents in and recompute IDF weights and document norms"""
+        if self._pending:
+            docs, terms, tfs = zip(*self._pending)
+            self._doc_flat = np.concatenate((self._doc_flat, *docs))
+            self._term_flat = np.concatenate((self._term_flat, *terms))
+            self._tf_flat = np.concatenate((self._tf_flat, *tfs))
+            self._pending.clear()
+
+            # Group entries by term (CSR layout) so each term's postings are one slice
+            order = np.argsort(self._term_flat, kind="stable")
+            self._doc_flat = self._doc_flat[order]
+            self._term_flat = self._term_flat[order]
+            self._tf_flat = self._tf_flat[order]
+            self._term_offsets = np.searchsorted(self._term_flat, np.arange(len(self._vocab) + 1))
+
+        doc_count = len(self._payloads)
+        df = np.asarray(self._df, dtype=np.float32)
+        self._idf = (np.log((1.0 + doc_count) / (1.0 + df)) + 1.0).astype(np.float32)
+
+        weights = self._tf_flat * self._idf[self._term_flat]
+        self._norms = np.sqrt(np.bincount(self._doc_flat, weights=weights * weights, minlength=doc_count))
+        self._dirty = False
+
+    def query(self, text: str, k: int = 5, min_score: float = 0.0) -> List[Tuple[float, Any]]:
+        """Return up to k (score, payload) pairs ordered by cosine similarity"""
+        counts = Counter(tokenize(text))
+
+        with self._lock:
+            query_terms = {self._vocab[term]: count for term, count in counts.items() if term in self._vocab}
+            if not query_terms or not self._payloads:
+                return []
+
+            if self._dirty:
+                self._refresh()
+
+            term_ids = np.fromiter(query_terms.keys(), dtype=np.int32, count=len(query_terms))
+            query_tf = 1.0 + np.log(np.fromiter(query_terms.values(), dtype=np.float32, count=len(query_terms)))
+            query_weights = query_tf * self._idf[term_ids]
+
+            postings = [
+                np.arange(self._term_offsets[term_id], self._term_offsets[term_id + 1])
+                for term_id in term_ids
+            ]
+            entries = np.concatenate(postings)
+            entry_weights = np.repeat(query_weights * self._idf[term_ids], [len(p) for p in postings])
+            scores = np.bincount(
+                self._doc_flat[entries],
+                weights=entry_weights * self._tf_flat[entries],
+                minlength=len(self._payloads)
+            )
+
+            denominator = self._norms * np.linalg.norm(query_weights)
+            scores = np.divide(scores, denominator, out=np.zeros_like(scores), where=denominator > 0)
+
+            k = min(k, len(scores))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+
+            return [(float(scores[i]), self._payloads[i]) for i in top if scores[i] > min_score]